@@ -0,0 +1,178 @@
+"""Load test: tracker.adjust() cost with hundreds of WebSocket subscribers on the tracker API
+
+Run from the repository root:  python benchmarks/bench_api_push.py [--subscribers 0 100 500]
+
+For each subscriber count a headless tracker on an EventLoop serves the API
+on a free localhost port. The subscribers connect from a separate thread,
+then the host loop applies bursts of increments the way triggers arrive.
+Reports the time per adjust() call (what the window's + button and every
+trigger run) and how long a change takes to reach the subscribers.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from event_loop import EventLoop  # noqa: E402
+from tracker import DATA_FILE, JOURNAL_FILE, ShinyTracker, TrackerConfig  # noqa: E402
+from tracker_api import TrackerAPI  # noqa: E402
+
+HUNTS = 200
+BURSTS = 200
+BURST_SIZE = 5
+BURST_INTERVAL_MS = 10
+
+
+class BenchConfig(TrackerConfig):
+    API_PORT = 0  # Any free port
+
+
+def write_data_file(path, count, seed=0):
+    rng = random.Random(seed)
+    pokemon = {
+        f"hunt-{i}": {
+            "name": f"hunt-{i}",
+            "encounters": rng.randint(0, 20000),
+            "game": "Scarlet/Violet",
+            "method": "Random Encounter",
+            "last_updated": f"2024-01-01 00:00:{i % 60:02d}",
+            "status": "ACTIVE" if i < 20 else "COMPLETE",
+        }
+        for i in range(count)
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"pokemon": pokemon, "active_hunts": ["hunt-0"]}, f)
+
+
+async def subscribe(port):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write(f"GET /ws HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                 f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode())
+    await reader.readuntil(b"\r\n\r\n")
+
+    async def next_message():
+        head = await reader.readexactly(2)
+        length = head[1] & 0x7F
+        if length == 126:
+            (length,) = struct.unpack(">H", await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack(">Q", await reader.readexactly(8))
+        return json.loads(await reader.readexactly(length))
+
+    await next_message()  # Snapshot
+    return reader, writer, next_message
+
+
+async def run_subscribers(port, count, ready, done, received):
+    connections = await asyncio.gather(*(subscribe(port) for _ in range(count)))
+    ready.set()
+
+    async def listen(next_message):
+        try:
+            while True:
+                message = await next_message()
+                received.append((time.perf_counter(), message["current"]["encounters"]))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    listeners = [asyncio.ensure_future(listen(next_message)) for _, _, next_message in connections]
+    while not done.is_set():
+        await asyncio.sleep(0.05)
+    for _, writer, _ in connections:
+        writer.close()
+    await asyncio.gather(*listeners, return_exceptions=True)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else float("nan")
+
+
+def run(subscribers, directory):
+    write_data_file(os.path.join(directory, DATA_FILE), HUNTS)
+    loop = EventLoop()
+    tracker = ShinyTracker(loop.after, loop.after_cancel, BenchConfig,
+                           data_file=os.path.join(directory, DATA_FILE),
+                           journal_file=os.path.join(directory, JOURNAL_FILE))
+    tracker.load()
+    tracker.select_hunt("hunt-0")
+    api = TrackerAPI(tracker, loop.after, loop.after_cancel, BenchConfig)
+    port = api.sock.getsockname()[1]
+    api.start()
+
+    ready, done = threading.Event(), threading.Event()
+    received = []
+    clients = threading.Thread(target=lambda: asyncio.run(run_subscribers(port, subscribers, ready, done, received)))
+    clients.start()
+
+    adjust_us = []
+    applied_at = {}  # encounter count -> perf_counter when adjust() produced it
+    bursts = [0]
+
+    def burst():
+        if not ready.is_set():
+            # Subscribers get their snapshot from this loop, so keep it running until they are connected
+            loop.after(BURST_INTERVAL_MS, burst)
+            return
+        for _ in range(BURST_SIZE):
+            start = time.perf_counter()
+            tracker.adjust("increase", amount=1, source="bench")
+            end = time.perf_counter()
+            adjust_us.append((end - start) * 1e6)
+            applied_at[tracker.current_number] = end
+        bursts[0] += 1
+        if bursts[0] < BURSTS:
+            loop.after(BURST_INTERVAL_MS, burst)
+        else:
+            # Let the last coalesced push go out before stopping
+            loop.after(3 * BenchConfig.API_PUSH_MS, loop.stop)
+
+    loop.after(0, burst)
+    loop.run()
+    done.set()
+    clients.join()
+    api.stop()
+    tracker.close()
+
+    latencies_ms = [(at - applied_at[count]) * 1000 for at, count in received if count in applied_at]
+    return {
+        "adjust_p50_us": percentile(adjust_us, 0.5),
+        "adjust_p99_us": percentile(adjust_us, 0.99),
+        "adjust_max_us": max(adjust_us),
+        "pushes_per_subscriber": len(received) / subscribers if subscribers else 0,
+        "latency_p50_ms": percentile(latencies_ms, 0.5),
+        "latency_p99_ms": percentile(latencies_ms, 0.99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time tracker.adjust() with WebSocket subscribers attached")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[0, 100, 500],
+                        help="subscriber counts to run, one after another")
+    counts = parser.parse_args().subscribers
+
+    increments = BURSTS * BURST_SIZE
+    print(f"{increments} increments in bursts of {BURST_SIZE} every {BURST_INTERVAL_MS} ms, "
+          f"pushes coalesced to one per {BenchConfig.API_PUSH_MS} ms\n")
+    print(f"{'subscribers':>11} {'adjust p50 us':>14} {'p99 us':>8} {'max us':>8} "
+          f"{'pushes/sub':>10} {'push p50 ms':>12} {'p99 ms':>7}")
+    for count in counts:
+        with tempfile.TemporaryDirectory() as directory:
+            result = run(count, directory)
+        print(f"{count:>11} {result['adjust_p50_us']:>14.1f} {result['adjust_p99_us']:>8.1f} "
+              f"{result['adjust_max_us']:>8.1f} {result['pushes_per_subscriber']:>10.1f} "
+              f"{result['latency_p50_ms']:>12.1f} {result['latency_p99_ms']:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""Timings of the tracker's hot paths on synthetic data files, as JSON that can be compared across commits
+
+Run from the repository root:
+
+    python benchmarks/bench_hot_paths.py [--sizes 10 100 1000 10000 50000] [--output results.json]
+                                         [--compare baseline.json] [--display]
+
+Each size gets a synthetic data file (see synthetic_data.py) in a temp
+directory. Paths timed:
+
+    load               ShinyTracker.load of a current-schema file: parse the JSON, rebuild the sort and
+                       status indexes (hunts are hydrated on first use, the text index on first query)
+    load[migrate]      the same for a file without a schema version, which is checked and upgraded
+    text_index         building the deferred note/name text index
+    snapshot           build_save_snapshot, the part of a save that runs on the UI thread
+    save_write         write_json_atomic of that snapshot, the write-behind thread's part
+    increment          ShinyTracker.adjust: journal append, index and rate updates
+    ordered_names[*]   filter and sort the hunts panel (all, active only, note text)
+    odds_batch         compute_stats for every hunt in one batch
+    panel_rebuild      VirtualGrid.set_items + binding every visible card (full panel refresh)
+    panel_reposition   one increment followed by moving its card (incremental panel refresh)
+
+The panel paths use a widget stub that only does the text formatting of
+ShinyCounter.update_hunt_card. With --display they use real tkinter
+widgets instead, which needs a display (run under xvfb-run on a headless
+box). The results are written with --output and can be compared
+with --compare.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from event_loop import EventLoop  # noqa: E402
+from hunt_grid import VirtualGrid  # noqa: E402
+from persistence import write_json_atomic  # noqa: E402
+from synthetic_data import write_data_file  # noqa: E402
+from tracker import DATA_FILE, JOURNAL_FILE, ShinyTracker, TrackerConfig  # noqa: E402
+
+CANVAS_SIZE = (1000, 600)
+CARD_ROW_HEIGHT = 210
+CARD_MIN_WIDTH = 300
+
+
+class StubCanvas:
+    """The slice of tk.Canvas VirtualGrid uses, without any drawing"""
+
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.items = 0
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def configure(self, **options):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+    def canvasy(self, y):
+        return y
+
+    def create_window(self, x, y, **options):
+        self.items += 1
+        return self.items
+
+    def coords(self, item, *args):
+        pass
+
+    def itemconfigure(self, item, **options):
+        pass
+
+    def after_idle(self, callback):
+        callback()
+
+
+class StubCard:
+    def __init__(self):
+        self.rendered = {}
+
+
+def card_texts(tracker, stats, data):
+    """The strings ShinyCounter.update_hunt_card and bind_hunt_card put on a card"""
+    texts = {
+        "name": data.name.split()[0].capitalize() + (f" (Phase {data.phase})" if data.phase > 1 else ""),
+        "status": f"• {f'Phase {data.phase}' if data.target else data.status}",
+        "encounters": f"Encounters: {data.encounters:,}",
+    }
+    if data.method:
+        hunt_stats = stats.get(data.name)
+        if hunt_stats is None:
+            hunt_stats = stats[data.name] = tracker.compute_stats([data.name])[data.name]
+        texts["probability"] = f"Shiny Chance: {hunt_stats.probability:.2%} (1/{tracker.odds.odds_for(data):,})"
+    if data.game:
+        texts["game"] = f"Game: {data.game}"
+    if data.status == "COMPLETE" and data.found_date:
+        texts["found"] = f"Found: {data.found_date}"
+    return texts
+
+
+def make_panel(tracker, stats, display):
+    if not display:
+        def bind_card(card, name):
+            card.rendered = card_texts(tracker, stats, tracker.saved_data.pokemon[name])
+
+        return VirtualGrid(StubCanvas(*CANVAS_SIZE), lambda parent: StubCard(), bind_card,
+                           CARD_ROW_HEIGHT, CARD_MIN_WIDTH), None
+
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"--display needs a display (try xvfb-run): {e}")
+        sys.exit(1)
+    canvas = tk.Canvas(root, width=CANVAS_SIZE[0], height=CANVAS_SIZE[1])
+    canvas.pack()
+    root.update()
+
+    def create_card(parent):
+        card = tk.Frame(parent, borderwidth=2, relief="groove")
+        card.labels = {}
+        for row, key in enumerate(("name", "status", "encounters", "probability", "game", "found")):
+            card.labels[key] = tk.Label(card, text="")
+            card.labels[key].grid(row=row, column=0, sticky="w")
+        return card
+
+    def bind_card(card, name):
+        texts = card_texts(tracker, stats, tracker.saved_data.pokemon[name])
+        for key, label in card.labels.items():
+            label.configure(text=texts.get(key, ""))
+
+    return VirtualGrid(canvas, create_card, bind_card, CARD_ROW_HEIGHT, CARD_MIN_WIDTH), root
+
+
+def measure(function, min_seconds=0.2, min_repeats=3, max_repeats=2000):
+    """Run function until min_seconds have passed (within the repeat bounds); per-call times in ms"""
+    times = []
+    total_start = time.perf_counter()
+    while len(times) < min_repeats or (time.perf_counter() - total_start < min_seconds
+                                       and len(times) < max_repeats):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def bench_size(count, display):
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        data_file = os.path.join(directory, DATA_FILE)
+        write_data_file(data_file, count)
+        loop = EventLoop()  # Never run: saves are flushed explicitly, like on close
+        tracker = ShinyTracker(loop.after, loop.after_cancel, TrackerConfig, data_file=data_file,
+                               journal_file=os.path.join(directory, JOURNAL_FILE))
+
+        results["load"] = measure(tracker.load)
+
+        with open(data_file, "r", encoding="utf-8") as f:
+            legacy = json.load(f)
+        del legacy["schema_version"]
+        legacy_file = os.path.join(directory, "legacy.json")
+        with open(legacy_file, "w", encoding="utf-8") as f:
+            json.dump(legacy, f)
+        # Its upgrade is only written on close, so every load below migrates again
+        legacy_tracker = ShinyTracker(loop.after, loop.after_cancel, TrackerConfig, data_file=legacy_file,
+                                      journal_file=os.path.join(directory, "legacy.jsonl"))
+        results["load[migrate]"] = measure(legacy_tracker.load)
+        legacy_tracker.close()
+
+        hunts = tracker.saved_data.pokemon
+        results["text_index"] = measure(lambda: tracker.hunt_indexes.text.rebuild(hunts.peek_all()))
+        snapshot = tracker.build_save_snapshot()
+        results["snapshot"] = measure(tracker.build_save_snapshot)
+        results["save_write"] = measure(lambda: write_json_atomic(os.path.join(directory, "save.json"), snapshot))
+
+        results["ordered_names[all]"] = measure(lambda: tracker.ordered_names(None, "", "most_recent", True))
+        results["ordered_names[active]"] = measure(
+            lambda: tracker.ordered_names("ACTIVE", "", "most_encounters", False))
+        results["ordered_names[text]"] = measure(lambda: tracker.ordered_names(None, "shiny", "most_recent", True))
+        results["odds_batch"] = measure(lambda: tracker.compute_stats(tracker.saved_data.pokemon))
+
+        tracker.select_most_recent_hunt()
+        results["increment"] = measure(lambda: tracker.adjust("increase", amount=1, source="bench"))
+
+        stats = tracker.compute_stats(tracker.saved_data.pokemon)
+        grid, root = make_panel(tracker, stats, display)
+        order = (None, "", "most_recent", True)
+
+        def rebuild():
+            grid.set_items(tracker.ordered_names(*order))
+            if root:
+                root.update_idletasks()
+
+        results["panel_rebuild"] = measure(rebuild)
+
+        hunt_indexes = tracker.hunt_indexes
+
+        def reposition():
+            tracker.adjust("increase", amount=1, source="bench")
+            name = tracker.current_pokemon
+            stats.update(tracker.compute_stats([name]))
+            old_index = grid.index_of(name)
+            new_index = hunt_indexes[order[2]].insertion_point(grid.keys, name, descending=order[3], skip=old_index)
+            if old_index < 0:
+                grid.insert(name, new_index)
+            else:
+                grid.move(name, new_index)
+            grid.refresh(name)
+            if root:
+                root.update_idletasks()
+
+        results["panel_reposition"] = measure(reposition)
+        if root:
+            root.destroy()
+        tracker.close()
+    return results
+
+
+def summarize(path, count, times):
+    return {
+        "path": path,
+        "hunts": count,
+        "repeats": len(times),
+        "min_ms": round(min(times), 4),
+        "median_ms": round(statistics.median(times), 4),
+        "max_ms": round(max(times), 4),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    before = {(r["path"], r["hunts"]): r["median_ms"] for r in baseline["results"]}
+    print(f"\nmedian vs {baseline_path} ({baseline.get('commit') or 'unknown commit'}):")
+    for result in results:
+        old = before.get((result["path"], result["hunts"]))
+        if old:
+            change = result["median_ms"] / old if old else float("inf")
+            print(f"  {result['path']:<24} {result['hunts']:>7}  {old:>10.3f} -> {result['median_ms']:>10.3f} ms"
+                  f"  {change:>6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the shiny tracker's hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 50000])
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--display", action="store_true", help="time the panel with real tkinter widgets")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'path':<24} {'hunts':>7} {'median ms':>10} {'min ms':>10} {'repeats':>8}")
+    for count in args.sizes:
+        for path, times in bench_size(count, args.display).items():
+            result = summarize(path, count, times)
+            results.append(result)
+            print(f"{path:<24} {count:>7} {result['median_ms']:>10.3f} {result['min_ms']:>10.3f} "
+                  f"{result['repeats']:>8}")
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "widgets": "tkinter" if args.display else "stub",
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
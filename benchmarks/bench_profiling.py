@@ -0,0 +1,75 @@
+"""Cost of the profiling layer per instrumented call, disabled and enabled
+
+Run from the repository root:  python benchmarks/bench_profiling.py
+
+Times an empty function bare, wrapped with profiler.timed(), and inside a
+profiler.span() block, first with profiling disabled (the default) and
+then enabled with tracing, and finally tracker.adjust() both ways.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from event_loop import EventLoop  # noqa: E402
+from profiling import Profiler, profiler  # noqa: E402
+from synthetic_data import write_data_file  # noqa: E402
+from tracker import DATA_FILE, JOURNAL_FILE, ShinyTracker, TrackerConfig  # noqa: E402
+
+CALLS = 200000
+
+
+def per_call_ns(function, calls=CALLS):
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter_ns() - start) / calls
+
+
+def micro(instance):
+    def bare():
+        pass
+
+    timed = instance.timed("bench.timed")(bare)
+
+    def spanned():
+        with instance.span("bench.span"):
+            pass
+
+    return per_call_ns(bare), per_call_ns(timed), per_call_ns(spanned)
+
+
+def adjust_us(enabled):
+    with tempfile.TemporaryDirectory() as directory:
+        write_data_file(os.path.join(directory, DATA_FILE), 1000)
+        loop = EventLoop()
+        tracker = ShinyTracker(loop.after, loop.after_cancel, TrackerConfig,
+                               data_file=os.path.join(directory, DATA_FILE),
+                               journal_file=os.path.join(directory, JOURNAL_FILE))
+        tracker.load()
+        tracker.select_most_recent_hunt()
+        if enabled:
+            profiler.enable()
+        try:
+            return per_call_ns(lambda: tracker.adjust("increase", amount=1, source="bench"), 5000) / 1000
+        finally:
+            profiler.disable()
+            profiler.reset()
+            tracker.close()
+
+
+def main():
+    local = Profiler()
+    print(f"{'':<10} {'bare ns':>9} {'timed ns':>9} {'span ns':>9}")
+    for label in ("disabled", "enabled"):
+        if label == "enabled":
+            local.enable()
+        bare, timed, spanned = micro(local)
+        print(f"{label:<10} {bare:>9.0f} {timed:>9.0f} {spanned:>9.0f}")
+    print(f"\ntracker.adjust: {adjust_us(False):.1f} us disabled, {adjust_us(True):.1f} us enabled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Hunts panel sort cost: strptime per comparison key vs pre-parsed epoch timestamps
+
+Run from the repository root:  python benchmarks/bench_sort_keys.py [hunt counts...]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from models import TIMESTAMP_FORMAT, PokemonData  # noqa: E402
+
+STATUSES = ("ACTIVE", "COMPLETE", "PAUSED", "PHASE")
+
+
+def make_hunts(count, seed=0):
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1)
+    return [
+        PokemonData(
+            name=f"hunt-{i}",
+            encounters=rng.randint(0, 20000),
+            last_updated=(start + timedelta(seconds=rng.randint(0, 60_000_000))).strftime(TIMESTAMP_FORMAT),
+            status=rng.choice(STATUSES)
+        )
+        for i in range(count)
+    ]
+
+
+def strptime_key(data):
+    # The sort key the panel used before timestamps were pre-parsed
+    return datetime.strptime(data.last_updated, TIMESTAMP_FORMAT) if data.last_updated else datetime.min
+
+
+def epoch_key(data):
+    return data.last_updated_ts
+
+
+def refresh_ms(hunts, key, repeats):
+    """Best-of-repeats time for one panel refresh: filter to "all" and sort most recent first"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        names = [h.name for h in sorted(hunts, key=key, reverse=True)]
+        best = min(best, time.perf_counter() - start)
+    assert names
+    return best * 1000
+
+
+def main(counts):
+    print(f"{'hunts':>8} {'strptime ms':>12} {'epoch ms':>10} {'speedup':>8}")
+    for count in counts:
+        hunts = make_hunts(count)
+        repeats = max(3, 20000 // count)
+        before = refresh_ms(hunts, strptime_key, repeats)
+        after = refresh_ms(hunts, epoch_key, repeats)
+        print(f"{count:>8} {before:>12.3f} {after:>10.3f} {before / after:>7.1f}x")
+
+    # Parsing moves to load time; show what that costs once
+    start = time.perf_counter()
+    make_hunts(counts[-1])
+    print(f"\nbuilding {counts[-1]} hunts (parses each timestamp once): "
+          f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000])
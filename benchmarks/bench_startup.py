@@ -0,0 +1,74 @@
+"""Startup time of the Tk window against Config.STARTUP_BUDGET_MS
+
+Run from the repository root (needs a display; use xvfb-run on a headless box):
+
+    python benchmarks/bench_startup.py [--hunts 1000] [--runs 5]
+
+Each run launches pokemon_shiny_hunter.py --measure-startup in a temp
+directory holding a synthetic data file. The app prints its milestones
+(ms since the start of its imports) once the counter and the first screen
+of hunt cards are up, then exits:
+
+    first_paint   the counter panel is on screen
+    counter       hunts are loaded and the selected hunt's count is shown
+    interactive   the hunts panel is filled and triggers and the API are running
+
+Medians are compared with the budget; the exit status is 1 when one is over.
+Sprites are not cached in the temp directory, so they load in the background
+after the window is interactive, as on a first launch.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+
+from pokemon_shiny_hunter import Config  # noqa: E402
+from synthetic_data import write_data_file  # noqa: E402
+from tracker import DATA_FILE  # noqa: E402
+
+MILESTONES = ("first_paint", "counter", "interactive")
+
+
+def launch(directory):
+    result = subprocess.run([sys.executable, os.path.join(ROOT, "pokemon_shiny_hunter.py"), "--measure-startup"],
+                            cwd=directory, capture_output=True, text=True, timeout=60)
+    for line in result.stdout.splitlines():
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError(f"No startup times from the app:\n{result.stdout}{result.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the tracker window's startup times")
+    parser.add_argument("--hunts", type=int, default=1000, help="hunts in the synthetic data file")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        write_data_file(os.path.join(directory, DATA_FILE), args.hunts)
+        for _ in range(args.runs):
+            runs.append(launch(directory))
+
+    over_budget = False
+    print(f"{args.runs} launches with {args.hunts:,} hunts\n")
+    print(f"{'milestone':<12} {'median ms':>10} {'max ms':>8} {'budget ms':>10}")
+    for milestone in MILESTONES:
+        values = [run[milestone] for run in runs]
+        budget = Config.STARTUP_BUDGET_MS.get(milestone)
+        median = statistics.median(values)
+        over = budget is not None and median > budget
+        over_budget = over_budget or over
+        print(f"{milestone:<12} {median:>10.1f} {max(values):>8.1f} {budget if budget else '-':>10}"
+              f"{'  OVER' if over else ''}")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Synthetic shiny_counter_data.json files for benchmarks
+
+Run from the repository root:  python benchmarks/synthetic_data.py <hunts> <output.json> [seed]
+
+Hunts get mixed statuses, games, methods, Shiny Charm and chain settings,
+notes on some of them, and completed phases linked back to their target
+hunt, in roughly the proportions of a long-running real file.
+"""
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from models import SCHEMA_VERSION, TIMESTAMP_FORMAT  # noqa: E402
+from tracker import TrackerConfig  # noqa: E402
+
+NOTE_WORDS = ("shiny", "reset", "sweet", "scent", "radar", "chain", "horde", "egg", "masuda", "fishing",
+              "outbreak", "safari", "synchronize", "adamant", "jolly", "timid", "modest", "route", "cave", "night")
+PHASE_SHARE = 0.3  # Fraction of entries that are phases of another hunt
+
+
+def make_data(count, seed=0):
+    """A data file dict with count entries, PHASE_SHARE of them phases"""
+    rng = random.Random(seed)
+    games = list(TrackerConfig.POKEMON_GAMES)
+    start = datetime(2020, 1, 1)
+
+    def timestamp():
+        return (start + timedelta(seconds=rng.randint(0, 150_000_000))).strftime(TIMESTAMP_FORMAT)
+
+    pokemon = {}
+    targets = []
+    phase_counts = {}
+    for i in range(count):
+        game = rng.choice(games)
+        entry = {
+            "encounters": rng.randint(0, 30000),
+            "adjustment": rng.choice((1, 1, 4, 8, 16)),
+            "sprite_url": None,
+            "last_updated": timestamp(),
+            "found_date": None,
+            "game": game,
+            "notes": " ".join(rng.sample(NOTE_WORDS, rng.randint(1, 6))) if rng.random() < 0.4 else None,
+            "method": rng.choice(TrackerConfig.HUNT_METHODS) if rng.random() < 0.95 else None,
+            "charm": rng.random() < 0.3,
+            "chain": rng.randint(0, 40) if rng.random() < 0.2 else 0,
+            "phase": 1,
+            "target": None,
+        }
+        if targets and rng.random() < PHASE_SHARE:
+            target = rng.choice(targets)
+            phase_counts[target] = phase_counts.get(target, 0) + 1
+            name = f"mon{i} phase {phase_counts[target]}"
+            entry.update(status="COMPLETE", found_date=entry["last_updated"],
+                         phase=phase_counts[target], target=target)
+        else:
+            name = f"mon{i}"
+            entry["status"] = rng.choices(("ACTIVE", "COMPLETE", "PAUSED", "PHASE"), (3, 5, 2, 1))[0]
+            if entry["status"] == "COMPLETE":
+                entry["found_date"] = entry["last_updated"]
+            targets.append(name)
+        entry["name"] = name
+        pokemon[name] = entry
+
+    for target, phases in phase_counts.items():
+        pokemon[target]["phase"] = phases + 1
+    active = [name for name, entry in pokemon.items() if entry["status"] == "ACTIVE"]
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "pokemon": pokemon,
+        "active_hunts": active[:20],
+        "last_pokemon": active[0] if active else None,
+        "theme": "dark",
+        "sort_by": "most_recent",
+        "sort_order": "descending",
+    }
+
+
+def write_data_file(path, count, seed=0):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(make_data(count, seed), f, indent=4)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python benchmarks/synthetic_data.py <hunts> <output.json> [seed]")
+        sys.exit(1)
+    write_data_file(sys.argv[2], int(sys.argv[1]), int(sys.argv[3]) if len(sys.argv) == 4 else 0)
+    print(f"Wrote {sys.argv[1]} hunts to {sys.argv[2]}")
@@ -0,0 +1,309 @@
+"""Framed, acknowledged encounter messages between melon.py and the shiny tracker
+
+Every frame is a 4-byte big-endian length followed by a UTF-8 JSON object.
+
+    client -> tracker  {"type": "hello", "client": id}
+    tracker -> client  {"type": "welcome", "acked": seq}
+    client -> tracker  {"type": "batch", "messages": [{"seq", "kind", "t", "hunt", "delta", "emulators"}, ...]}
+    tracker -> client  {"type": "ack", "seq": seq}
+
+Sequence numbers are per client. The client keeps every message until it is
+acknowledged and replays the unacknowledged ones after reconnecting; the
+tracker drops any sequence number it already received, so a replay never
+counts twice. Acks are only sent once the tracker has applied the message.
+"""
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+HEADER = struct.Struct(">I")
+MAX_FRAME = 1024 * 1024
+
+
+def send_frame(sock, message: dict):
+    data = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def recv_frame(sock) -> Optional[dict]:
+    """Next message from sock, or None once the peer has closed the connection"""
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"Frame of {length} bytes exceeds the {MAX_FRAME} byte limit")
+    body = _recv_exact(sock, length)
+    if body is None:
+        return None
+    return json.loads(body.decode("utf-8"))
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+class EncounterServer:
+    """Tracker side: accepts controller connections and queues their messages for the Tk thread
+
+    Each queued item is (client_id, message). Once the Tk thread has applied
+    messages it calls applied(client_id, seq), which sends the ack.
+    """
+
+    def __init__(self, host: str, port: int, events):
+        self.events = events
+        self.clients = {}  # client id -> {"received", "applied", "conn", "send_lock"}
+        self.lock = threading.Lock()
+        self.stopped = False
+        self.sock = socket.create_server((host, port))
+        self.thread = threading.Thread(target=self._accept, name="encounter-server", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped = True
+        with self.lock:
+            connections = [state["conn"] for state in self.clients.values() if state["conn"]]
+        # Shutting the listener down wakes the blocked accept(); close() alone would not
+        for conn in [self.sock] + connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.sock.close()
+
+    def applied(self, client_id: str, seq: int):
+        with self.lock:
+            state = self.clients.get(client_id)
+            if state is None:
+                return
+            state["applied"] = max(state["applied"], seq)
+        self._send(state, {"type": "ack", "seq": state["applied"]})
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            if self.stopped:
+                conn.close()
+                return
+            threading.Thread(target=self._serve, args=(conn,), name="encounter-connection", daemon=True).start()
+
+    def _serve(self, conn):
+        state = None
+        try:
+            hello = recv_frame(conn)
+            if not hello or hello.get("type") != "hello":
+                return
+            client_id = hello["client"]
+            with self.lock:
+                state = self.clients.setdefault(client_id, {
+                    "received": 0, "applied": 0, "conn": None, "send_lock": threading.Lock()
+                })
+                state["conn"] = conn
+            self._send(state, {"type": "welcome", "acked": state["applied"]})
+
+            while True:
+                message = recv_frame(conn)
+                if message is None:
+                    return
+                if message.get("type") != "batch":
+                    continue
+                for item in message.get("messages", []):
+                    with self.lock:
+                        if item["seq"] <= state["received"]:
+                            continue  # Replayed after a reconnect, already queued once
+                        state["received"] = item["seq"]
+                    self.events.put((client_id, item))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Encounter connection error: {e}")
+        finally:
+            if state is not None:
+                with self.lock:
+                    if state["conn"] is conn:
+                        state["conn"] = None
+            conn.close()
+
+    def _send(self, state, message):
+        conn = state["conn"]
+        if conn is None:
+            return
+        try:
+            with state["send_lock"]:
+                send_frame(conn, message)
+        except OSError as e:
+            print(f"Could not send to encounter client: {e}")
+
+
+class EncounterClient:
+    """Controller side: sends encounter messages in batches and replays them until acknowledged
+
+    send() never blocks on the network. A background thread connects,
+    batches whatever queued up within batch_ms, and reconnects after
+    failures. Messages that could not reach a tracker for fallback_after
+    seconds are handed to fallback(message) instead (the old trigger file),
+    as are messages still unsent or unacknowledged when close() is called.
+    """
+
+    def __init__(self, host: str, port: int, fallback: Callable[[dict], None], client_id: Optional[str] = None,
+                 batch_ms: int = 10, max_batch: int = 100, fallback_after: float = 10.0, retry_ms: int = 1000):
+        self.address = (host, port)
+        self.fallback = fallback
+        self.client_id = client_id or f"{socket.gethostname()}-{os.getpid()}-{int(time.time())}"
+        self.batch_s = batch_ms / 1000
+        self.max_batch = max_batch
+        self.fallback_after = fallback_after
+        self.retry_s = retry_ms / 1000
+
+        self.seq = 0
+        self.outbox = deque()  # Not yet sent on the current connection
+        self.unacked = deque()  # Sent, waiting for the tracker's ack
+        self.cond = threading.Condition()
+        self.sock = None
+        self.stopped = False
+        self.thread = threading.Thread(target=self._run, name="encounter-client", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def send(self, kind: str, **fields) -> int:
+        with self.cond:
+            self.seq += 1
+            self.outbox.append({"seq": self.seq, "kind": kind, "t": time.time(), **fields})
+            self.cond.notify()
+            return self.seq
+
+    def connected(self) -> bool:
+        return self.sock is not None
+
+    def close(self, timeout: float = 1.0):
+        """Give queued messages a moment to be acknowledged, then fall back for the rest
+
+        Delivery is at least once: a message sent but not yet acknowledged may
+        already have been applied, so falling back for it can count it twice.
+        """
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            while (self.outbox or self.unacked) and self.sock is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.cond.wait(remaining)
+            self.stopped = True
+            unacked = len(self.unacked)
+            leftovers = list(self.unacked) + list(self.outbox)
+            self.unacked.clear()
+            self.outbox.clear()
+            self.cond.notify_all()
+        self._disconnect()
+        self.thread.join(timeout=2)
+        if unacked:
+            print(f"{unacked} encounter message(s) sent but not acknowledged on close; "
+                  f"writing them to the fallback, which may count them twice")
+        for message in leftovers:
+            self.fallback(message)
+
+    def _run(self):
+        while True:
+            with self.cond:
+                if self.stopped:
+                    return
+            if self.sock is None and not self._connect():
+                self._fall_back_stale()
+                with self.cond:
+                    self.cond.wait(self.retry_s)
+                continue
+
+            with self.cond:
+                while not self.outbox and self.sock is not None and not self.stopped:
+                    self.cond.wait()
+                if self.stopped or self.sock is None:
+                    continue
+                if len(self.outbox) < self.max_batch:
+                    # Let a burst of triggers collect into one frame
+                    self.cond.wait(self.batch_s)
+                batch = [self.outbox.popleft() for _ in range(min(self.max_batch, len(self.outbox)))]
+                self.unacked.extend(batch)
+                sock = self.sock
+            if not batch or sock is None:
+                continue
+            try:
+                send_frame(sock, {"type": "batch", "messages": batch})
+            except OSError:
+                self._disconnect()
+
+    def _connect(self) -> bool:
+        try:
+            sock = socket.create_connection(self.address, timeout=1.0)
+            send_frame(sock, {"type": "hello", "client": self.client_id})
+            welcome = recv_frame(sock)
+            if not welcome or welcome.get("type") != "welcome":
+                sock.close()
+                return False
+            sock.settimeout(None)
+        except (OSError, ValueError):
+            return False
+
+        with self.cond:
+            # Everything the tracker has not applied goes out again, oldest first
+            pending = [m for m in list(self.unacked) + list(self.outbox) if m["seq"] > welcome["acked"]]
+            self.unacked.clear()
+            self.outbox = deque(pending)
+            self.sock = sock
+            self.cond.notify_all()
+        threading.Thread(target=self._read_acks, args=(sock,), name="encounter-acks", daemon=True).start()
+        return True
+
+    def _read_acks(self, sock):
+        try:
+            while True:
+                message = recv_frame(sock)
+                if message is None:
+                    break
+                if message.get("type") == "ack":
+                    with self.cond:
+                        while self.unacked and self.unacked[0]["seq"] <= message["seq"]:
+                            self.unacked.popleft()
+                        self.cond.notify_all()
+        except (OSError, ValueError):
+            pass
+        if self.sock is sock:
+            self._disconnect()
+
+    def _disconnect(self):
+        with self.cond:
+            sock, self.sock = self.sock, None
+            # Unacknowledged messages are replayed on the next connection
+            self.outbox.extendleft(reversed(self.unacked))
+            self.unacked.clear()
+            self.cond.notify_all()
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    def _fall_back_stale(self):
+        cutoff = time.time() - self.fallback_after
+        stale = []
+        with self.cond:
+            while self.outbox and self.outbox[0]["t"] < cutoff:
+                stale.append(self.outbox.popleft())
+        for message in stale:
+            self.fallback(message)
@@ -0,0 +1,109 @@
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+class EncounterRate:
+    """Increment timestamps for one hunt in a fixed-size ring buffer with sliding-window sums
+
+    Each window keeps a running encounter total and the index of its oldest
+    entry. Recording an increment adds to every window's total and retires
+    entries that fell out of the window, so each entry is added and removed
+    once per window: O(1) amortized per increment, with memory bounded by
+    capacity regardless of how long the hunt runs.
+    """
+
+    def __init__(self, windows: Sequence[float], capacity: int = 4096):
+        self.windows = tuple(windows)
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.deltas = array("l", bytes(array("l").itemsize * capacity))
+        self.head = 0  # Index of the next write, counted from the first record ever
+        self.tails = [0] * len(self.windows)
+        self.sums = [0] * len(self.windows)
+
+    def record(self, delta: int, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        if self.head - self.capacity >= 0:
+            # The slot about to be overwritten must leave every window that still counts it
+            self._expire(self.head - self.capacity + 1, now)
+        slot = self.head % self.capacity
+        self.times[slot] = now
+        self.deltas[slot] = delta
+        self.head += 1
+        for i in range(len(self.windows)):
+            self.sums[i] += delta
+        self._expire(0, now)
+
+    def per_hour(self, now: Optional[float] = None) -> List[float]:
+        """Encounters per hour over each window (0 until there are two samples to measure)"""
+        now = time.time() if now is None else now
+        self._expire(0, now)
+        oldest = max(0, self.head - self.capacity)
+        rates = []
+        for i, window in enumerate(self.windows):
+            tail = self.tails[i]
+            if tail >= self.head:
+                rates.append(0.0)
+                continue
+            if tail > oldest:
+                # Older samples exist, so the whole window is covered
+                span, count = window, self.sums[i]
+            else:
+                # Everything retained is inside the window; measure from the first sample
+                span = now - self.times[tail % self.capacity]
+                count = self.sums[i] - self.deltas[tail % self.capacity]
+            rates.append(count / span * 3600 if span > 0 and count > 0 else 0.0)
+        return rates
+
+    def _expire(self, min_tail: int, now: float):
+        for i, window in enumerate(self.windows):
+            tail = self.tails[i]
+            cutoff = now - window
+            while tail < self.head and (tail < min_tail or self.times[tail % self.capacity] < cutoff):
+                self.sums[i] -= self.deltas[tail % self.capacity]
+                tail += 1
+            self.tails[i] = tail
+
+
+class EncounterRates:
+    """EncounterRate per hunt, created on the first increment"""
+
+    def __init__(self, windows: Sequence[float], capacity: int = 4096):
+        self.windows = tuple(windows)
+        self.capacity = capacity
+        self.hunts: Dict[str, EncounterRate] = {}
+
+    def record(self, name: str, delta: int, now: Optional[float] = None):
+        rate = self.hunts.get(name)
+        if rate is None:
+            rate = self.hunts[name] = EncounterRate(self.windows, self.capacity)
+        rate.record(delta, now)
+
+    def per_hour(self, name: str, now: Optional[float] = None) -> Optional[List[float]]:
+        rate = self.hunts.get(name)
+        return rate.per_hour(now) if rate else None
+
+    def names(self) -> Iterable[str]:
+        return self.hunts.keys()
+
+
+def eta_hours(encounters: int, target_encounters: int, per_hour: float) -> Optional[float]:
+    """Hours until target_encounters at the given rate; 0 if already there, None without a rate"""
+    remaining = target_encounters - encounters
+    if remaining <= 0:
+        return 0.0
+    if per_hour <= 0:
+        return None
+    return remaining / per_hour
+
+
+def format_duration(hours: Optional[float]) -> str:
+    if hours is None:
+        return "—"
+    minutes = int(round(hours * 60))
+    if minutes < 60:
+        return f"{minutes}m"
+    if minutes < 48 * 60:
+        return f"{minutes // 60}h {minutes % 60:02d}m"
+    return f"{minutes / (24 * 60):.1f}d"
@@ -0,0 +1,57 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable
+
+
+class EventLoop:
+    """Single-threaded timer loop with Tk's after/after_cancel interface, for running without a display
+
+    Callbacks run one at a time on the thread that called run(), so code
+    written for the Tk thread (ShinyTracker, TriggerHub, WriteBehindSaver)
+    runs unchanged. after() and stop() may be called from any thread.
+    """
+
+    def __init__(self):
+        self.jobs = []  # Heap of (due, job id, callback, args)
+        self.cancelled = set()
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopped = False
+
+    def after(self, ms: int, callback: Callable, *args) -> int:
+        with self.lock:
+            job = next(self.ids)
+            heapq.heappush(self.jobs, (time.monotonic() + ms / 1000, job, callback, args))
+        self.wakeup.set()
+        return job
+
+    def after_cancel(self, job: int):
+        with self.lock:
+            self.cancelled.add(job)
+
+    def stop(self):
+        self.stopped = True
+        self.wakeup.set()
+
+    def run(self):
+        """Run callbacks as they come due until stop() is called"""
+        while not self.stopped:
+            with self.lock:
+                due = self.jobs[0][0] if self.jobs else None
+                job = None
+                if due is not None and due <= time.monotonic():
+                    _, job, callback, args = heapq.heappop(self.jobs)
+                    if job in self.cancelled:
+                        self.cancelled.discard(job)
+                        continue
+                self.wakeup.clear()
+            if job is not None:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"Error in scheduled callback: {e}")
+                continue
+            self.wakeup.wait(None if due is None else max(0.0, due - time.monotonic()))
@@ -0,0 +1,125 @@
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+from typing import Iterable
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_CLOEXEC = 0o2000000
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class InotifyWatcher:
+    """Watches a directory with Linux inotify and puts the names of finished writes on a queue
+
+    The thread sleeps in select() until the kernel reports IN_CLOSE_WRITE or
+    IN_MOVED_TO, so every completed write of a watched file becomes its own
+    event, with no polling delay and no merging of writes within an mtime tick.
+    """
+
+    def __init__(self, directory, filenames: Iterable[str], events: queue.Queue):
+        self.directory = os.path.abspath(directory)
+        self.filenames = set(filenames)
+        self.events = events
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(self.directory), IN_CLOSE_WRITE | IN_MOVED_TO)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {self.directory}")
+
+        # Writing to this pipe wakes the thread up so stop() doesn't wait for a file event
+        self.wake_r, self.wake_w = os.pipe()
+        self.thread = threading.Thread(target=self._run, name="inotify-watcher", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        os.write(self.wake_w, b"x")
+        self.thread.join(timeout=2)
+        for fd in (self.fd, self.wake_r, self.wake_w):
+            os.close(fd)
+
+    def _run(self):
+        while True:
+            readable, _, _ = select.select([self.fd, self.wake_r], [], [])
+            if self.wake_r in readable:
+                return
+            data = os.read(self.fd, 64 * 1024)
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    print("File watcher queue overflowed; some events were lost")
+                    for filename in self.filenames:
+                        self.events.put(filename)
+                elif name in self.filenames:
+                    self.events.put(name)
+
+
+class PollingWatcher:
+    """Fallback that polls mtime and size every interval_ms on a background thread
+
+    Used where inotify is unavailable (Windows, macOS). Several writes between
+    two polls are reported as one event, like the original Tk polling loop.
+    """
+
+    def __init__(self, directory, filenames: Iterable[str], events: queue.Queue, interval_ms: int = 500):
+        self.directory = os.path.abspath(directory)
+        self.filenames = set(filenames)
+        self.events = events
+        self.interval = interval_ms / 1000
+        self.stopped = threading.Event()
+        # Snapshot now so files that already exist don't fire on the first poll
+        self.state = {name: self._stat(name) for name in self.filenames}
+        self.thread = threading.Thread(target=self._run, name="polling-watcher", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join(timeout=2)
+
+    def _stat(self, name):
+        try:
+            stat = os.stat(os.path.join(self.directory, name))
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            for name in self.filenames:
+                state = self._stat(name)
+                # An empty file is usually caught between truncate and write; wait for the content
+                if state is not None and state[1] > 0 and state != self.state[name]:
+                    self.events.put(name)
+                self.state[name] = state
+
+
+def create_file_watcher(directory, filenames: Iterable[str], events: queue.Queue,
+                        backend: str = "auto", poll_interval_ms: int = 500):
+    """inotify on Linux when available ("auto" or "inotify"), otherwise the polling fallback"""
+    filenames = list(filenames)
+    if backend in ("auto", "inotify") and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory, filenames, events)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable, falling back to polling: {e}")
+    return PollingWatcher(directory, filenames, events, interval_ms=poll_interval_ms)
@@ -0,0 +1,176 @@
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+class VirtualGrid:
+    """Card grid on a canvas that only materializes widgets for rows near the viewport
+
+    Cards are created by create_card(parent) and filled by bind_card(card, key).
+    Cards that scroll out of range go back to a pool and are re-bound to
+    whichever key scrolls into view next, so the widget count stays bounded by
+    the viewport size instead of the number of items. With cards_per_pass set,
+    at most that many new cards are created per render and the rest follow in
+    idle callbacks, so a first fill never blocks the window for long.
+    """
+
+    def __init__(self, canvas, create_card: Callable, bind_card: Callable, row_height: int,
+                 min_card_width: int, min_columns: int = 1, max_columns: int = 5,
+                 overscan_rows: int = 1, padding: int = 5, cards_per_pass: Optional[int] = None):
+        self.canvas = canvas
+        self.create_card = create_card
+        self.bind_card = bind_card
+        self.row_height = row_height
+        self.min_card_width = min_card_width
+        self.min_columns = min_columns
+        self.max_columns = max_columns
+        self.overscan_rows = overscan_rows
+        self.padding = padding
+        self.cards_per_pass = cards_per_pass
+
+        self.keys: List[str] = []
+        self.positions: Dict[str, int] = {}
+        self.visible: Dict[str, object] = {}  # key -> bound card
+        self.pool: List[object] = []  # hidden cards ready for reuse
+        self.columns = min_columns
+        self.card_width = min_card_width
+        self.render_job = None
+        self.filled_callbacks: List[Callable] = []
+
+    def set_items(self, keys: Sequence[str], rebind: bool = True):
+        """Replace the ordered item list; rebind refreshes cards that stay on screen"""
+        self.keys = list(keys)
+        self.positions = {key: index for index, key in enumerate(self.keys)}
+        self.update_scroll_region()
+        self.render(rebind=rebind)
+
+    def index_of(self, key: str) -> int:
+        """Position of key in the current item list, or -1 when it is not shown"""
+        return self.positions.get(key, -1)
+
+    def insert(self, key: str, index: int):
+        self.keys.insert(index, key)
+        self._reindex(index, len(self.keys))
+        self.update_scroll_region()
+        self.render()
+
+    def remove(self, key: str):
+        index = self.positions.pop(key)
+        del self.keys[index]
+        self._reindex(index, len(self.keys))
+        self.update_scroll_region()
+        self.render()
+
+    def move(self, key: str, index: int):
+        """Move key to index, counted as if key were not in the list
+
+        Only the positions between the old and new slot change, and render()
+        re-places just the cards in the viewport whose slot actually moved.
+        """
+        old_index = self.positions[key]
+        if old_index == index:
+            return
+        del self.keys[old_index]
+        self.keys.insert(index, key)
+        self._reindex(min(old_index, index), max(old_index, index) + 1)
+        self.render()
+
+    def _reindex(self, start: int, end: int):
+        for index in range(start, end):
+            self.positions[self.keys[index]] = index
+
+    def refresh(self, key: str):
+        card = self.visible.get(key)
+        if card is not None:
+            self.bind_card(card, key)
+
+    def relayout(self):
+        width = max(self.canvas.winfo_width(), 1)
+        self.columns = max(self.min_columns, min(self.max_columns, width // self.min_card_width))
+        self.card_width = width // self.columns
+        self.update_scroll_region()
+        self.render()
+
+    def row_count(self) -> int:
+        return -(-len(self.keys) // self.columns)
+
+    def update_scroll_region(self):
+        # Computed from the row count so no widget has to exist to know the content height
+        height = self.row_count() * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+        if height <= self.canvas.winfo_height():
+            self.canvas.yview_moveto(0)
+
+    def after_filled(self, callback: Callable):
+        """Call callback once every card in view exists and is bound"""
+        if self.render_job is None:
+            callback()
+        else:
+            self.filled_callbacks.append(callback)
+
+    def schedule_render(self):
+        if self.render_job is None:
+            self.render_job = self.canvas.after_idle(self._run_scheduled_render)
+
+    def _run_scheduled_render(self):
+        self.render_job = None
+        self.render()
+
+    def render(self, rebind: bool = False):
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(0, int(top // self.row_height) - self.overscan_rows)
+        last_row = int(bottom // self.row_height) + self.overscan_rows
+        start = first_row * self.columns
+        end = min(len(self.keys), (last_row + 1) * self.columns)
+        needed = {key: index for index, key in enumerate(self.keys[start:end], start)}
+
+        # Return cards that left the viewport to the pool
+        for key in [k for k in self.visible if k not in needed]:
+            card = self.visible.pop(key)
+            self.canvas.itemconfigure(card.window_id, state="hidden")
+            self.pool.append(card)
+
+        created = 0
+        deferred = False
+        for key, index in needed.items():
+            card = self.visible.get(key)
+            if card is None:
+                if self.pool:
+                    card = self.pool.pop()
+                elif created == self.cards_per_pass:
+                    deferred = True
+                    continue
+                else:
+                    created += 1
+                    card = self._new_card()
+                self.visible[key] = card
+                self.bind_card(card, key)
+            elif rebind:
+                self.bind_card(card, key)
+            self._place(card, index)
+
+        if deferred:
+            self.schedule_render()
+        elif self.filled_callbacks and self.render_job is None:
+            callbacks, self.filled_callbacks = self.filled_callbacks, []
+            for callback in callbacks:
+                callback()
+
+    def _new_card(self):
+        card = self.create_card(self.canvas)
+        card.window_id = self.canvas.create_window(0, 0, window=card, anchor="nw", state="hidden")
+        card.placement = None
+        return card
+
+    def _place(self, card, index):
+        row, col = divmod(index, self.columns)
+        placement = (
+            col * self.card_width + self.padding,
+            row * self.row_height + self.padding,
+            self.card_width - 2 * self.padding
+        )
+        if card.placement != placement:
+            self.canvas.coords(card.window_id, placement[0], placement[1])
+            self.canvas.itemconfigure(card.window_id, width=placement[2],
+                                      height=self.row_height - 2 * self.padding)
+            card.placement = placement
+        self.canvas.itemconfigure(card.window_id, state="normal")
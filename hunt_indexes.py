@@ -0,0 +1,252 @@
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+STATUSES = ("ACTIVE", "COMPLETE", "PAUSED", "PHASE")
+
+# Sort key per hunts panel sort mode; ties are broken by name so every entry has a unique slot
+SORT_KEYS: Dict[str, Callable] = {
+    "most_recent": lambda data: data.last_updated_ts,
+    "most_encounters": lambda data: data.encounters,
+}
+
+
+class SortedIndex:
+    """Hunt names kept in ascending (key, name) order with bisect
+
+    Re-keying one hunt only removes and re-inserts its own entry, so the
+    panel never has to sort the whole collection after an increment.
+    """
+
+    def __init__(self, key: Callable):
+        self.key = key
+        self.entries: List[Tuple] = []
+        self.entry_of: Dict[str, Tuple] = {}
+
+    def rebuild(self, hunts):
+        self.entry_of = {data.name: (self.key(data), data.name) for data in hunts}
+        self.entries = sorted(self.entry_of.values())
+
+    def update(self, data) -> Tuple[int, int]:
+        """Reposition one hunt; returns its (old, new) ascending position, old is -1 if it was new"""
+        entry = (self.key(data), data.name)
+        old_entry = self.entry_of.get(data.name)
+        if old_entry == entry:
+            position = bisect_left(self.entries, entry)
+            return position, position
+
+        old_position = -1
+        if old_entry is not None:
+            old_position = bisect_left(self.entries, old_entry)
+            del self.entries[old_position]
+        insort(self.entries, entry)
+        self.entry_of[data.name] = entry
+        return old_position, bisect_left(self.entries, entry)
+
+    def remove(self, name: str) -> int:
+        entry = self.entry_of.pop(name, None)
+        if entry is None:
+            return -1
+        position = bisect_left(self.entries, entry)
+        del self.entries[position]
+        return position
+
+    def names(self, descending: bool = False) -> List[str]:
+        entries = reversed(self.entries) if descending else self.entries
+        return [name for _, name in entries]
+
+    def insertion_point(self, names: Sequence[str], name: str, descending: bool = False,
+                        skip: int = -1) -> int:
+        """Where name belongs in names, a list already in this index's order
+
+        names may be any filtered subset of the index. skip is the current
+        position of name in names, if present, and is treated as removed, so
+        the result is an index into the list without it.
+        """
+        entry = self.entry_of[name]
+        lo, hi = 0, len(names) - (1 if skip >= 0 else 0)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = self.entry_of[names[mid if skip < 0 or mid < skip else mid + 1]]
+            if (other > entry) if descending else (other < entry):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class StatusBuckets:
+    """Set of hunt names per status, so a status filter never scans every hunt"""
+
+    def __init__(self):
+        self.buckets: Dict[str, Set[str]] = {status: set() for status in STATUSES}
+        self.status_of: Dict[str, str] = {}
+
+    def rebuild(self, hunts):
+        self.buckets = {status: set() for status in STATUSES}
+        self.status_of = {}
+        for data in hunts:
+            self.update(data)
+
+    def update(self, data):
+        name, status = data.name, data.status
+        old_status = self.status_of.get(name)
+        if old_status == status:
+            return
+        if old_status is not None:
+            self.buckets[old_status].discard(name)
+        self.buckets.setdefault(status, set()).add(name)
+        self.status_of[name] = status
+
+    def remove(self, name: str):
+        status = self.status_of.pop(name, None)
+        if status is not None:
+            self.buckets[status].discard(name)
+
+    def members(self, status: str) -> Set[str]:
+        return self.buckets.get(status, set())
+
+
+class NgramIndex:
+    """Inverted index from 1..max_n character grams to the hunts whose text contains them
+
+    A query's longest grams are intersected to get candidates, which are then
+    confirmed with a plain substring check, so results match `query in text`
+    exactly while only touching hunts that share every gram with the query.
+    """
+
+    def __init__(self, max_n: int = 3):
+        self.max_n = max_n
+        self.postings: Dict[str, Set[str]] = {}
+        self.texts: Dict[str, str] = {}
+        self.source: Optional[Callable[[], Iterable]] = None  # Set while the build is deferred
+
+    @staticmethod
+    def text_of(data) -> str:
+        # Fields are joined with a newline, which a single-line query can never span
+        return "\n".join(value.lower() for value in (data.notes, data.target, data.name) if value)
+
+    def grams(self, text: str) -> Set[str]:
+        return {text[i:i + n] for n in range(1, self.max_n + 1) for i in range(len(text) - n + 1)}
+
+    def rebuild(self, hunts):
+        self.postings = {}
+        self.texts = {}
+        self.source = None
+        for data in hunts:
+            self.update(data)
+
+    def defer(self, source: Callable[[], Iterable]):
+        """Build from source() at the first query instead of now; changes until then are read by that build"""
+        self.postings = {}
+        self.texts = {}
+        self.source = source
+
+    def ensure_built(self):
+        if self.source is not None:
+            self.rebuild(self.source())
+
+    def update(self, data):
+        if self.source is not None:
+            return
+        name = data.name
+        text = self.text_of(data)
+        old_text = self.texts.get(name)
+        if old_text == text:
+            return
+        old_grams = self.grams(old_text) if old_text is not None else set()
+        new_grams = self.grams(text)
+        for gram in old_grams - new_grams:
+            names = self.postings[gram]
+            names.discard(name)
+            if not names:
+                del self.postings[gram]
+        for gram in new_grams - old_grams:
+            self.postings.setdefault(gram, set()).add(name)
+        self.texts[name] = text
+
+    def remove(self, name: str):
+        if self.source is not None:
+            return
+        text = self.texts.pop(name, None)
+        if text is None:
+            return
+        for gram in self.grams(text):
+            names = self.postings[gram]
+            names.discard(name)
+            if not names:
+                del self.postings[gram]
+
+    def search(self, query: str) -> Set[str]:
+        self.ensure_built()
+        query = query.lower()
+        n = min(len(query), self.max_n)
+        postings = []
+        for i in range(len(query) - n + 1):
+            names = self.postings.get(query[i:i + n])
+            if not names:
+                return set()
+            postings.append(names)
+        # Smallest posting list first keeps the intersection cheap
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for names in postings[1:]:
+            candidates &= names
+            if not candidates:
+                return candidates
+        if len(query) <= self.max_n:
+            return candidates
+        return {name for name in candidates if query in self.texts[name]}
+
+    def matches(self, name: str, query: str) -> bool:
+        self.ensure_built()
+        return query.lower() in self.texts.get(name, "")
+
+
+class HuntIndexes:
+    """Sorted, status and text indexes over the hunts, updated together whenever a hunt changes"""
+
+    def __init__(self):
+        self.indexes = {mode: SortedIndex(key) for mode, key in SORT_KEYS.items()}
+        self.status = StatusBuckets()
+        self.text = NgramIndex()
+
+    def __getitem__(self, sort_by: str) -> SortedIndex:
+        return self.indexes[sort_by]
+
+    def rebuild(self, hunts, text_source: Optional[Callable[[], Iterable]] = None):
+        """Index hunts; with text_source, the text index is built from it on the first text query"""
+        hunts = list(hunts)
+        for index in self.indexes.values():
+            index.rebuild(hunts)
+        self.status.rebuild(hunts)
+        if text_source is None:
+            self.text.rebuild(hunts)
+        else:
+            self.text.defer(text_source)
+
+    def update(self, data) -> Dict[str, Tuple[int, int]]:
+        self.status.update(data)
+        self.text.update(data)
+        return {mode: index.update(data) for mode, index in self.indexes.items()}
+
+    def remove(self, name: str):
+        for index in self.indexes.values():
+            index.remove(name)
+        self.status.remove(name)
+        self.text.remove(name)
+
+    def matching(self, status: Optional[str] = None, query: str = "") -> Optional[Set[str]]:
+        """Names passing the status and text filters, or None when neither filter is set"""
+        result = None
+        if status is not None:
+            result = self.status.members(status)
+        if query:
+            found = self.text.search(query)
+            result = found if result is None else result & found
+        return result
+
+    def matches(self, name: str, status: Optional[str] = None, query: str = "") -> bool:
+        """Filter check for a single hunt, used when repositioning one changed card"""
+        if status is not None and self.status.status_of.get(name) != status:
+            return False
+        return not query or self.text.matches(name, query)
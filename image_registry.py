@@ -0,0 +1,55 @@
+import tkinter as tk
+from typing import Dict, Hashable, Tuple
+
+import customtkinter as ctk
+
+
+class ImageRegistry:
+    """Shares one CTkImage per (species, size) and frees it once no widget shows it"""
+
+    def __init__(self):
+        # key -> [CTkImage, reference count, approximate bytes]
+        self.images: Dict[Tuple[str, Tuple[int, int]], list] = {}
+        # owner (widget path) -> key it currently displays
+        self.owners: Dict[Hashable, Tuple[str, Tuple[int, int]]] = {}
+
+    def acquire(self, widget, species: str, size, img) -> ctk.CTkImage:
+        """Return the shared image for (species, size) and make widget an owner of it
+
+        img is only used when the image is not registered yet. A widget owns one
+        image at a time, so re-acquiring swaps its previous image out.
+        """
+        owner = str(widget)
+        key = (species, tuple(size))
+        if self.owners.get(owner) == key:
+            return self.images[key][0]
+
+        if owner not in self.owners:
+            # Release automatically when the widget goes away, bypassing CTk's bind override
+            tk.Misc.bind(widget, "<Destroy>", lambda e, o=owner: self.release(o), add="+")
+        self.release(owner)
+
+        entry = self.images.get(key)
+        if entry is None:
+            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=key[1])
+            entry = [ctk_img, 0, img.width * img.height * len(img.getbands())]
+            self.images[key] = entry
+        entry[1] += 1
+        self.owners[owner] = key
+        return entry[0]
+
+    def release(self, owner):
+        key = self.owners.pop(str(owner), None)
+        if key is None:
+            return
+        entry = self.images[key]
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self.images[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "images": len(self.images),
+            "owners": len(self.owners),
+            "bytes": sum(entry[2] for entry in self.images.values())
+        }
@@ -10,6 +10,9 @@ import keyboard
 from tkinter import *
 from tkinter import messagebox
 
+from encounter_protocol import EncounterClient
+from shared_counters import SharedCounters
+
 # Initialize virtual controller
 try:
     controller = pyvjoy.VJoyDevice(1)
@@ -27,6 +30,9 @@ processes = []
 windows = []
 NUM_EMULATORS = 24
 ROWS = 3
+TRIGGER_TRANSPORT = "socket"  # "socket" (acknowledged and replayed, file as fallback), "shm" or "file"
+TRIGGER_HOST = "127.0.0.1"
+TRIGGER_PORT = 47800
 
 
 class EmulatorController:
@@ -38,6 +44,16 @@ class EmulatorController:
 
         # Initialize communication files
         self.initialize_communication_files()
+        self.trigger_client = None
+        if TRIGGER_TRANSPORT == "socket":
+            # Falls back to the trigger file for messages no tracker picked up
+            self.trigger_client = EncounterClient(TRIGGER_HOST, TRIGGER_PORT,
+                                                  fallback=lambda message: self.write_trigger_file())
+            self.trigger_client.start()
+        self.shared_counters = None
+        if TRIGGER_TRANSPORT == "shm":
+            # Each encounter is a few memory stores the tracker picks up on its next tick
+            self.shared_counters = SharedCounters("shiny_counters", slots=32)
 
         # Main control frame
         main_frame = Frame(root)
@@ -1173,6 +1189,17 @@ class EmulatorController:
 
     def trigger_shinyhunter_increment(self):
         """Signal to increment encounters in shiny hunter"""
+        count = self.num_emulators_var.get()
+        if self.trigger_client:
+            self.trigger_client.send("encounter", hunt=None, delta=count, emulators=count)
+            return
+        if self.shared_counters:
+            self.shared_counters.add(range(count), 1, emulators=count)
+            return
+        self.write_trigger_file()
+
+    def write_trigger_file(self):
+        """Fallback signal: the tracker counts each write of the trigger file"""
         try:
             with open("encounter_trigger.txt", 'w') as f:
                 f.write(str(time.time()))
@@ -1290,6 +1317,8 @@ if __name__ == "__main__":
         root.mainloop()
     finally:
         keyboard.unhook_all()
+        if app.trigger_client:
+            app.trigger_client.close()
         if 'controller' in globals():
             try:
                 controller.reset()
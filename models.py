@@ -0,0 +1,155 @@
+from collections.abc import MutableMapping
+from dataclasses import MISSING, dataclass, fields
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Data file layout; 2 = every hunt entry carries every PokemonData field (files without a version are 1)
+SCHEMA_VERSION = 2
+# Sorts before every real timestamp, like datetime.min did
+MISSING_TIMESTAMP = float("-inf")
+
+
+def parse_timestamp(value: Optional[str]) -> float:
+    """Epoch seconds for a saved timestamp string, MISSING_TIMESTAMP if empty or malformed"""
+    if not value:
+        return MISSING_TIMESTAMP
+    try:
+        # fromisoformat reads "%Y-%m-%d %H:%M:%S" many times faster than strptime
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return MISSING_TIMESTAMP
+
+
+@dataclass
+class PokemonData:
+    name: str
+    encounters: int = 0
+    adjustment: int = 1
+    sprite_url: Optional[str] = None
+    last_updated: Optional[str] = None
+    status: str = "ACTIVE"  # Can be ACTIVE, COMPLETE, PAUSED, or PHASE
+    found_date: Optional[str] = None
+    game: Optional[str] = None
+    notes: Optional[str] = None
+    method: Optional[str] = None
+    phase: int = 1
+    target: Optional[str] = None
+    charm: bool = False
+    chain: int = 0  # Chain length for chaining methods (fishing, Poke Radar, SOS, outbreaks)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Parsed once per change so sorts compare floats; these are not dataclass
+        # fields, so asdict() and the saved JSON only ever see the strings
+        if name == "last_updated":
+            object.__setattr__(self, "last_updated_ts", parse_timestamp(value))
+        elif name == "found_date":
+            object.__setattr__(self, "found_date_ts", parse_timestamp(value))
+
+
+FIELD_NAMES = tuple(f.name for f in fields(PokemonData))
+FIELD_DEFAULTS = {f.name: f.default for f in fields(PokemonData) if f.default is not MISSING}
+
+
+def migrate_data(loaded: dict) -> dict:
+    """Upgrade a parsed data file to SCHEMA_VERSION, dropping entries that are not valid hunts
+
+    Runs once per file: the next save writes the version, and versioned files
+    are loaded without looking at each entry.
+    """
+    pokemon = {}
+    for name, entry in loaded.get('pokemon', {}).items():
+        try:
+            PokemonData(**entry)
+            # Fills phase and target for files from before phases, and any other field added since
+            pokemon[name] = {**FIELD_DEFAULTS, **entry}
+        except Exception as e:
+            print(f"Skipping invalid Pokémon entry {name}: {e}")
+    return {**loaded, 'pokemon': pokemon, 'schema_version': SCHEMA_VERSION}
+
+
+class HuntView:
+    """Read-only attributes over a saved entry, for scans that should not hydrate every hunt"""
+    __slots__ = ("entry", "name", "last_updated_ts")
+
+    def __init__(self, entry: dict):
+        self.entry = entry
+        # The fields every index reads are plain attributes; the rest go through __getattr__
+        self.name = entry["name"]
+        self.last_updated_ts = parse_timestamp(entry["last_updated"])
+
+    def __getattr__(self, field):
+        if field == "found_date_ts":
+            return parse_timestamp(self.entry["found_date"])
+        try:
+            return self.entry[field]
+        except KeyError:
+            raise AttributeError(field) from None
+
+
+class HuntRecords(MutableMapping):
+    """Hunts by name, kept as the parsed entries until each is first looked up
+
+    A lookup hydrates the entry into a PokemonData once and keeps that; names,
+    len() and `in` never hydrate. peek()/peek_all() give HuntViews of
+    untouched entries for whole-collection scans, and to_json() hands those
+    entries back unchanged, so a large archive only pays for the hunts in use.
+    """
+
+    def __init__(self, entries=None):
+        self.entries: Dict[str, object] = dict(entries or {})  # name -> entry dict or PokemonData
+
+    def __getitem__(self, name) -> PokemonData:
+        value = self.entries[name]
+        if type(value) is dict:
+            value = self.entries[name] = PokemonData(**value)
+        return value
+
+    def __setitem__(self, name, data: PokemonData):
+        self.entries[name] = data
+
+    def __delitem__(self, name):
+        del self.entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, name) -> bool:
+        return name in self.entries
+
+    def peek(self, name):
+        value = self.entries[name]
+        return HuntView(value) if type(value) is dict else value
+
+    def peek_all(self):
+        return [HuntView(value) if type(value) is dict else value for value in self.entries.values()]
+
+    def hydrated_count(self) -> int:
+        return sum(1 for value in self.entries.values() if type(value) is not dict)
+
+    def to_json(self) -> Dict[str, dict]:
+        # Untouched entries are never mutated, so the writer thread can share them as they are
+        return {
+            name: value if type(value) is dict else {field: getattr(value, field) for field in FIELD_NAMES}
+            for name, value in self.entries.items()
+        }
+
+
+@dataclass
+class AppData:
+    pokemon: HuntRecords
+    active_hunts: List[str] = None
+    last_pokemon: Optional[str] = None
+    theme: str = "dark"
+    sort_by: str = "most_recent"
+    sort_order: str = "descending"
+
+    def __post_init__(self):
+        if self.active_hunts is None:
+            self.active_hunts = []
+        if not isinstance(self.pokemon, HuntRecords):
+            self.pokemon = HuntRecords(self.pokemon)
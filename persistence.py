@@ -0,0 +1,234 @@
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from profiling import profiler
+
+
+def write_json_atomic(path, data, indent: Optional[int] = 4):
+    """Write to a temp file, fsync it and rename over path so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, default=str)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class WriteBehindSaver:
+    """Coalesces save requests and writes the snapshot on a background thread
+
+    build_snapshot runs on the caller's (Tk) thread once per coalescing window,
+    so the model is only read from the thread that mutates it; the JSON
+    encoding and file I/O happen on the writer thread. A build_snapshot that
+    returns None skips that write.
+    """
+
+    def __init__(self, path, build_snapshot: Callable[[], dict], schedule: Callable, cancel: Callable,
+                 window_ms: int = 1000, on_written: Optional[Callable[[dict], None]] = None):
+        self.path = path
+        self.build_snapshot = build_snapshot
+        self.schedule = schedule
+        self.cancel = cancel
+        self.window_ms = window_ms
+        # Called on the writer thread after a snapshot is safely on disk
+        self.on_written = on_written
+
+        self.job = None
+        self.deadline = 0.0
+        # Oldest change not yet snapshotted, and the request times of snapshots still being written
+        self.dirty_since: Optional[float] = None
+        self.in_flight = deque()
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.metrics = {
+            "requests": 0,
+            "writes": 0,
+            "errors": 0,
+            "last_write_ms": 0.0,
+            "max_write_ms": 0.0,
+        }
+        self.last_error: Optional[str] = None
+        self.thread = threading.Thread(target=self._writer, name="write-behind", daemon=True)
+        self.thread.start()
+
+    def request(self, delay_ms: Optional[int] = None):
+        """Mark the data dirty; it is written at most delay_ms (default window_ms) later"""
+        self.metrics["requests"] += 1
+        delay_ms = self.window_ms if delay_ms is None else delay_ms
+        now = time.monotonic()
+        deadline = now + delay_ms / 1000
+        if self.job is None:
+            self.dirty_since = now
+        elif deadline < self.deadline:
+            # A more urgent request pulls the pending write forward
+            self.cancel(self.job)
+        else:
+            return
+        self.deadline = deadline
+        self.job = self.schedule(delay_ms, self._take_snapshot)
+
+    def flush(self):
+        """Write any pending changes now and wait until they are on disk"""
+        if self.job is not None:
+            self.cancel(self.job)
+            self._take_snapshot()
+        self.queue.join()
+        if self.last_error:
+            raise IOError(self.last_error)
+
+    def close(self):
+        self.flush()
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+
+    def discard(self):
+        """Drop any pending save and stop the writer thread, for hosts that only read"""
+        if self.job is not None:
+            self.cancel(self.job)
+            self.job = None
+        self.dirty_since = None
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+
+    def pending_age(self) -> float:
+        """Seconds the oldest unsaved change has been waiting"""
+        with self.lock:
+            waiting = list(self.in_flight)
+        if self.dirty_since is not None:
+            waiting.append(self.dirty_since)
+        return time.monotonic() - min(waiting) if waiting else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        with self.lock:
+            stats = dict(self.metrics)
+        stats["pending_age"] = self.pending_age()
+        return stats
+
+    @profiler.timed("save.snapshot")
+    def _take_snapshot(self):
+        self.job = None
+        snapshot = self.build_snapshot()
+        if snapshot is None:
+            self.dirty_since = None
+            return
+        with self.lock:
+            self.in_flight.append(self.dirty_since)
+        self.dirty_since = None
+        self.queue.put(snapshot)
+
+    def _writer(self):
+        while True:
+            snapshot = self.queue.get()
+            if snapshot is None:
+                self.queue.task_done()
+                return
+
+            start = time.perf_counter()
+            try:
+                with profiler.span("save.write"):
+                    write_json_atomic(self.path, snapshot)
+                self.last_error = None
+                if self.on_written:
+                    self.on_written(snapshot)
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Error saving data: {e}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            with self.lock:
+                self.metrics["writes"] += 1
+                self.metrics["last_write_ms"] = elapsed_ms
+                self.metrics["max_write_ms"] = max(self.metrics["max_write_ms"], elapsed_ms)
+                if self.last_error:
+                    self.metrics["errors"] += 1
+                self.in_flight.popleft()
+            self.queue.task_done()
+
+
+class EncounterJournal:
+    """Append-only JSON-lines log of hunt changes made since the last snapshot
+
+    Every record carries a sequence number. Snapshots store the last sequence
+    they include, so on startup only newer records are replayed and a
+    compaction can drop everything the snapshot already covers.
+    """
+
+    def __init__(self, path, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self.seq = 0
+        self.file = None
+        # Appends come from the Tk thread, compaction from the write-behind thread
+        self.lock = threading.Lock()
+
+    @profiler.timed("journal.append")
+    def append(self, op: str, hunt: str, fields: dict, source: str = "ui", delta: Optional[int] = None) -> int:
+        with self.lock:
+            self.seq += 1
+            record = {"seq": self.seq, "t": time.time(), "op": op, "hunt": hunt, "source": source}
+            if delta is not None:
+                record["delta"] = delta
+            record["fields"] = fields
+
+            if self.file is None:
+                self.file = self._open_for_append()
+            self.file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+            self.file.flush()
+            if self.fsync:
+                os.fsync(self.file.fileno())
+            return self.seq
+
+    def _open_for_append(self):
+        f = open(self.path, 'a+b')
+        # Terminate a torn line left by a crash so it can't swallow the next record
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.close()
+        return open(self.path, 'a', encoding='utf-8')
+
+    def read(self, after_seq: int = 0) -> List[dict]:
+        """Records newer than after_seq; a torn final line from a crash is skipped"""
+        records = []
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("seq", 0) > after_seq:
+                    records.append(record)
+        return records
+
+    def compact(self, upto_seq: int):
+        """Drop records already contained in a snapshot written up to upto_seq"""
+        with self.lock:
+            remaining = self.read(upto_seq)
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+            if remaining:
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    for record in remaining:
+                        f.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            elif os.path.exists(self.path):
+                os.remove(self.path)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from profiling import profiler
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace outgoing requests"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # Reserve the token up front so concurrent callers queue behind each other
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class PokeAPIClient:
+    """Shared HTTP client for PokeAPI and sprite downloads"""
+
+    def __init__(self, base_url: str, timeout=(3.05, 10), retries: int = 3, backoff: float = 0.5,
+                 rate: float = 10, burst: int = 20, pool_size: int = 8, max_validators: int = 256):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate, burst)
+        self.max_validators = max_validators
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["User-Agent"] = "Shiny-Hunting-GUI"
+
+        # url -> (etag, last_modified, content) for conditional revalidation
+        self.validators: "OrderedDict[str, tuple]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = {
+            "requests": 0,
+            "errors": 0,
+            "not_modified": 0,
+            "bytes": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+        }
+
+    def url_for(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    @profiler.timed("pokeapi.get")
+    def get(self, path: str, timeout=None) -> bytes:
+        url = self.url_for(path)
+        headers = {}
+        with self.lock:
+            cached = self.validators.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        self.bucket.acquire()
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+        except requests.RequestException:
+            self._record(time.perf_counter() - start, error=True)
+            raise
+
+        if response.status_code == 304 and cached:
+            self._record(time.perf_counter() - start, not_modified=True)
+            return cached[2]
+
+        if not response.ok:
+            self._record(time.perf_counter() - start, error=True)
+            response.raise_for_status()
+
+        content = response.content
+        self._record(time.perf_counter() - start, size=len(content))
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self.lock:
+                self.validators[url] = (etag, last_modified, content)
+                self.validators.move_to_end(url)
+                while len(self.validators) > self.max_validators:
+                    self.validators.popitem(last=False)
+        return content
+
+    def get_json(self, path: str, timeout=None):
+        return json.loads(self.get(path, timeout=timeout))
+
+    def stats(self) -> Dict[str, float]:
+        with self.lock:
+            stats = dict(self.counters)
+        stats["latency_avg"] = stats["latency_total"] / stats["requests"] if stats["requests"] else 0.0
+        return stats
+
+    def close(self):
+        self.session.close()
+
+    def _record(self, elapsed: float, error: bool = False, not_modified: bool = False, size: int = 0):
+        with self.lock:
+            self.counters["requests"] += 1
+            self.counters["latency_total"] += elapsed
+            self.counters["latency_max"] = max(self.counters["latency_max"], elapsed)
+            self.counters["bytes"] += size
+            if error:
+                self.counters["errors"] += 1
+            if not_modified:
+                self.counters["not_modified"] += 1
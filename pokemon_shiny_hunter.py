@@ -1,3 +1,7 @@
+import time
+
+STARTUP_STARTED = time.perf_counter()  # Startup times are measured from here, before the imports below
+
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import simpledialog, messagebox, filedialog
@@ -6,92 +10,47 @@ import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional, Dict, List
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
-from datetime import datetime
-from dataclasses import dataclass, asdict
+
+# PokeAPI, sprite (requests, PIL) and tracker API (asyncio) modules are imported after the first paint
+from hunt_grid import VirtualGrid
+from image_registry import ImageRegistry
+from profiling import get_logger, profiler
+from render_scheduler import RenderScheduler
+from search_index import SearchIndex
+from tracker import ShinyTracker, TrackerConfig
+from trigger_hub import TriggerHub
 
 # Constants
 CACHE_DIR = Path("cache/sprites")
-DATA_FILE = "shiny_counter_data.json"
+SPECIES_CATALOG_FILE = Path("cache/species_catalog.json")
 DEFAULT_SPRITE_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/0.png"
 
 
-@dataclass
-class PokemonData:
-    name: str
-    encounters: int = 0
-    adjustment: int = 1
-    sprite_url: Optional[str] = None
-    last_updated: Optional[str] = None
-    status: str = "ACTIVE"  # Can be ACTIVE, COMPLETE, PAUSED, or PHASE
-    found_date: Optional[str] = None
-    game: Optional[str] = None
-    notes: Optional[str] = None
-    method: Optional[str] = None
-    phase: int = 1
-    target: Optional[str] = None
-
-
-@dataclass
-class AppData:
-    pokemon: Dict[str, PokemonData]
-    active_hunts: List[str] = None
-    last_pokemon: Optional[str] = None
-    theme: str = "dark"
-    sort_by: str = "most_recent"
-    sort_order: str = "descending"
-
-    def __post_init__(self):
-        if self.active_hunts is None:
-            self.active_hunts = []
-
-
-class Config:
+class Config(TrackerConfig):
     API_BASE_URL = "https://pokeapi.co/api/v2"
+    API_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+    API_RATE_LIMIT = 10  # Requests per second, well inside PokeAPI fair use
+    API_RATE_BURST = 20
+    SPECIES_CATALOG_TTL = 7 * 24 * 60 * 60  # Seconds before the species catalog is refreshed
+    SEARCH_DEBOUNCE_MS = 120
+    FILTER_DEBOUNCE_MS = 150
     MAIN_SPRITE_SIZE = (150, 150)
     CARD_SPRITE_SIZE = (80, 80)
     MINI_SPRITE_SIZE = (40, 40)
+    SPRITE_CACHE_BYTES = 32 * 1024 * 1024  # Decoded sprite budget before LRU eviction
     MIN_COLUMNS = 1
     MAX_COLUMNS = 5
     CARD_MIN_WIDTH = 300
-
-    POKEMON_GAMES = {
-        "Red/Blue/Yellow": 1,
-        "Gold/Silver/Crystal": 2,
-        "Ruby/Sapphire/Emerald": 3,
-        "FireRed/LeafGreen": 3,
-        "Diamond/Pearl/Platinum": 4,
-        "HeartGold/SoulSilver": 4,
-        "Black/White": 5,
-        "Black 2/White 2": 5,
-        "X/Y": 6,
-        "Omega Ruby/Alpha Sapphire": 6,
-        "Sun/Moon": 7,
-        "Ultra Sun/Ultra Moon": 7,
-        "Sword/Shield": 8,
-        "Brilliant Diamond/Shining Pearl": 8,
-        "Legends: Arceus": 8,
-        "Scarlet/Violet": 9
-    }
-
-    HUNT_METHODS = [
-        "Random Encounter",
-        "Soft Reset",
-        "Masuda Method",
-        "Chain Fishing",
-        "Poke Radar",
-        "DexNav",
-        "SOS Battles",
-        "Dynamax Adventures",
-        "Outbreaks",
-        "Other"
-    ]
+    CARD_ROW_HEIGHT = 210
+    RENDER_FRAME_MS = 33  # UI refreshes are coalesced to at most one per frame
+    RATE_REFRESH_MS = 30000
+    STARTUP_CARDS_PER_PASS = 3  # Hunt cards created per idle callback while the panel first fills
+    STARTUP_BUDGET_MS = {"first_paint": 400, "interactive": 1500}  # Launches over budget log a warning
 
 
 class ShinyCounter:
+    """Tk view over a ShinyTracker, which owns the hunts, counting and saving"""
+
     def __init__(self, root):
         self.root = root
         self.root.title("Pokémon Shiny Hunter")
@@ -99,73 +58,205 @@ class ShinyCounter:
         self.root.minsize(800, 500)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        self.storage_file = DATA_FILE
-        self.saved_data = AppData(pokemon={})
-        self.current_pokemon = ""
-        self.current_number = 0
-        self.default_adjustment = 1
+        self.tracker = ShinyTracker(self.root.after, self.root.after_cancel, Config)
         self.current_game = ctk.StringVar()
         self.current_method = ctk.StringVar(value=Config.HUNT_METHODS[0])
-        self.image_references = []
+        self.current_charm = ctk.BooleanVar(value=False)
+        self.chain_text = ctk.StringVar(value="0")
+        self.amount_text = ctk.StringVar(value="1")
+        self.hunt_stats = {}  # name -> HuntStats from the last batch computation
+        self.images = ImageRegistry()
         self.current_theme = "dark"
         self.sort_by = ctk.StringVar(value="most_recent")
         self.sort_order = ctk.StringVar(value="descending")
         self.current_filter = ctk.StringVar(value="all")
+        self.profiling = tk.BooleanVar(value=Config.PROFILING)
 
-        self.communication_files = {
-            'emulator_count': "melon_emulator_count.txt",
-            'encounter_trigger': "encounter_trigger.txt"
-        }
-        self.last_trigger_time = 0
-        self.initial_load = True
-        self.hunt_cards = {}  # Dictionary to track hunt cards
         self.resize_job = None
+        self.note_filter_job = None
+        self.note_filter_text = ""  # Lowercased filter text the panel currently shows
+        self.renderer = RenderScheduler(self.root, self.flush_render, frame_ms=Config.RENDER_FRAME_MS)
+        self.triggers = TriggerHub(self.tracker, self.root.after, self.root.after_cancel, Config)
+        self.api_server = None
+        self.hunt_grid = None
+        # Set up after the first paint by start_sprite_services
+        self.api = None
+        self.sprite_cache = None
+        self.sprite_loader = None
+        self.species_catalog = None
+        self.startup_times = {}  # Milestone -> ms since STARTUP_STARTED
+        self.measure_startup = False  # Print the startup times and exit once interactive
+        if Config.PROFILING:
+            profiler.enable()
+        profiler.start_logging(self.root.after, self.root.after_cancel, Config.PROFILE_LOG_FILE, Config.PROFILE_LOG_MS)
+
+        # Only the counter is built before the window first paints; the rest follows in idle callbacks
+        self.create_counter_widgets()
+        self.root.bind("<Map>", self.on_window_mapped, add="+")
+
+    # Startup
+
+    def on_window_mapped(self, event):
+        if event.widget is not self.root or "first_paint" in self.startup_times:
+            return
+        # Redraws for the newly mapped widgets are already queued, so this idle callback runs after them
+        self.root.after_idle(self.on_first_paint)
+
+    def on_first_paint(self):
+        if "first_paint" in self.startup_times:
+            return  # The window was mapped again before the first callback ran
+        self.mark_startup("first_paint")
+        self.run_startup_steps([self.load_counter, self.start_sprite_services, self.create_hunts_panel])
+
+    def run_startup_steps(self, steps):
+        """One step per idle callback, so the window handles events and repaints in between"""
+        steps[0]()
+        if len(steps) > 1:
+            self.root.after_idle(lambda: self.run_startup_steps(steps[1:]))
+
+    def load_counter(self):
+        self.load_data()
+        self.set_theme(self.tracker.saved_data.theme)
+        self.bind_tracker()
+        self.load_most_recent_active_hunt()
+        self.number_label.configure(text="")
+        self.update_display()
+        self.mark_startup("counter")
+
+    def start_sprite_services(self):
+        if self.sprite_loader is not None:
+            return  # Already started early by change_pokemon
+        from pokeapi_client import PokeAPIClient
+        from species_catalog import SpeciesCatalog
+        from sprite_cache import SpriteCache
+        from sprite_loader import SpriteLoader
 
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.api = PokeAPIClient(Config.API_BASE_URL, timeout=Config.API_TIMEOUT,
+                                 rate=Config.API_RATE_LIMIT, burst=Config.API_RATE_BURST)
+        self.sprite_cache = SpriteCache(
+            CACHE_DIR,
+            (Config.MAIN_SPRITE_SIZE, Config.CARD_SPRITE_SIZE, Config.MINI_SPRITE_SIZE),
+            Config.SPRITE_CACHE_BYTES
+        )
+        self.sprite_loader = SpriteLoader(self.root, self.sprite_cache, self.api, DEFAULT_SPRITE_URL)
+        self.species_catalog = SpeciesCatalog(SPECIES_CATALOG_FILE, self.api, Config.SPECIES_CATALOG_TTL)
+        self.species_catalog.refresh_async()
+        self.pokemon_label.bind("<Button-1>", lambda e: self.change_pokemon())
+        if self.tracker.current_pokemon:
+            self.load_pokemon_image(self.tracker.current_pokemon, size=Config.MAIN_SPRITE_SIZE)
+
+    def create_hunts_panel(self):
+        self.create_hunts_widgets()
+        self.create_menu()
+        # Size the canvas now so the first fill covers the real viewport
+        self.root.update_idletasks()
+        self.hunt_grid.relayout()
+        self.renderer.request_full()
+        self.renderer.flush_now()
+        self.triggers.start()
+        self.start_api_server()
+        self.root.after(Config.RATE_REFRESH_MS, self.refresh_rates)
+        self.hunt_grid.after_filled(self.on_interactive)
+
+    def on_interactive(self):
+        self.mark_startup("interactive")
+        self.report_startup()
+        if self.measure_startup:
+            print(json.dumps(self.startup_times))
+            self.root.after_idle(self.on_close)
+
+    def mark_startup(self, milestone):
+        now = time.perf_counter()
+        self.startup_times[milestone] = round((now - STARTUP_STARTED) * 1000, 1)
+        if profiler.enabled:
+            profiler.record(f"startup.{milestone}", int(STARTUP_STARTED * 1e9), int(now * 1e9))
+
+    def report_startup(self):
+        times = self.startup_times
+        message = (f"Startup: first paint {times['first_paint']:.0f} ms, counter {times['counter']:.0f} ms, "
+                   f"interactive {times['interactive']:.0f} ms ({len(self.tracker.saved_data.pokemon):,} hunts)")
+        over = [f"{milestone} {times[milestone]:.0f} > {budget} ms"
+                for milestone, budget in Config.STARTUP_BUDGET_MS.items() if times.get(milestone, 0) > budget]
+        logger = get_logger(Config.PROFILE_LOG_FILE)
+        if over:
+            logger.warning("%s, over budget: %s", message, ", ".join(over))
+            print(f"{message}, over budget: {', '.join(over)}")
+        else:
+            logger.info(message)
 
-        self.load_data()
-        self.set_theme(self.saved_data.theme)
-        self.create_widgets()
-        self.initialize_communication_files()
-        self.setup_file_watcher()
-        self.load_most_recent_active_hunt()
-        self.initial_load = True
+    def load_data(self):
+        self.tracker.load()
+        if self.tracker.last_error:
+            messagebox.showerror("Error", self.tracker.last_error)
+        self.current_theme = self.tracker.saved_data.theme
+        self.sort_by.set(self.tracker.saved_data.sort_by)
+        self.sort_order.set(self.tracker.saved_data.sort_order)
+
+    def bind_tracker(self):
+        # Controls write straight through to the tracker; tracker changes come back through on_tracker_change
+        tracker = self.tracker
+        self.current_game.trace_add('write', lambda *args: setattr(tracker, "game", self.current_game.get()))
+        self.current_method.trace_add('write', lambda *args: setattr(tracker, "method", self.current_method.get()))
+        self.current_charm.trace_add('write', lambda *args: setattr(tracker, "charm", self.current_charm.get()))
+        self.chain_text.trace_add('write', lambda *args: setattr(tracker, "chain", self.entry_int(self.chain_text, 0)))
+        self.amount_text.trace_add('write',
+                                   lambda *args: tracker.set_amount(self.entry_int(self.amount_text, 1), notify=False))
+        tracker.method = self.current_method.get()
+        tracker.subscribe(self.on_tracker_change)
+
+    @staticmethod
+    def entry_int(variable, default):
+        text = variable.get().strip()
+        return int(text) if text.isdigit() else default
+
+    def on_tracker_change(self, change, names):
+        if change == "selected":
+            self.show_current_hunt()
+        elif change == "counter":
+            self.renderer.request_display()
+        elif change == "amount" and self.amount_text.get() != str(self.tracker.amount):
+            self.amount_text.set(str(self.tracker.amount))
+        if names:
+            self.renderer.mark_dirty(*names)
+
+    def start_api_server(self):
+        if not Config.API_SERVER:
+            return
+        from tracker_api import TrackerAPI
+
+        try:
+            self.api_server = TrackerAPI(self.tracker, self.root.after, self.root.after_cancel, Config)
+            self.api_server.start()
+        except OSError as e:
+            print(f"Tracker API unavailable: {e}")
 
     def set_theme(self, theme):
         self.current_theme = theme
         ctk.set_appearance_mode(theme)
-        self.saved_data.theme = theme
+        self.tracker.saved_data.theme = theme
 
     def load_most_recent_active_hunt(self):
         try:
-            # Get all active hunts sorted by last_updated
-            active_hunts = [
-                p for p in self.saved_data.pokemon.values()
-                if p.status == "ACTIVE"
-            ]
-
-            # Sort by last_updated descending
-            active_hunts.sort(
-                key=lambda x: datetime.strptime(x.last_updated,
-                                                "%Y-%m-%d %H:%M:%S") if x.last_updated else datetime.min,
-                reverse=True
-            )
-
-            if active_hunts:
-                most_recent = active_hunts[0].name
-                self.load_pokemon(most_recent)
-            elif self.saved_data.last_pokemon and self.saved_data.last_pokemon in self.saved_data.pokemon:
-                self.load_pokemon(self.saved_data.last_pokemon)
-
+            self.tracker.select_most_recent_hunt()
         except Exception as e:
             print(f"Error loading recent hunt: {e}")
 
     def on_close(self):
-        self.saved_data.last_pokemon = self.current_pokemon
-        self.save_data()
+        self.triggers.stop()
+        if self.api_server:
+            self.api_server.stop()
+        try:
+            # Always get pending changes onto disk before the window goes away
+            self.tracker.close()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save data: {e}")
+        if self.sprite_loader:
+            self.sprite_loader.shutdown()
+            self.api.close()
         self.root.destroy()
 
-    def create_widgets(self):
+    def create_counter_widgets(self):
         # Main frame with proper background
         self.main_frame = ctk.CTkFrame(self.root, fg_color="transparent")
         self.main_frame.pack(fill="both", expand=True, padx=0, pady=0)
@@ -178,11 +269,11 @@ class ShinyCounter:
         display_frame = ctk.CTkFrame(left_panel, corner_radius=0)
         display_frame.pack(fill="x", pady=5, padx=0)
 
+        # Clicking the sprite to pick a hunt is bound once the species catalog is up
         self.pokemon_label = ctk.CTkLabel(display_frame, text="", cursor="hand2")
         self.pokemon_label.pack()
-        self.pokemon_label.bind("<Button-1>", lambda e: self.change_pokemon())
 
-        self.number_label = ctk.CTkLabel(display_frame, text="")
+        self.number_label = ctk.CTkLabel(display_frame, text="Loading hunts...")
         self.number_label.pack(pady=5)
 
         # Control frame
@@ -203,13 +294,20 @@ class ShinyCounter:
         method_menu = ctk.CTkOptionMenu(method_frame, variable=self.current_method, values=Config.HUNT_METHODS)
         method_menu.pack(side="left", padx=5)
 
+        # Odds modifiers
+        odds_frame = ctk.CTkFrame(control_frame, fg_color="transparent")
+        odds_frame.pack(fill="x", pady=5)
+        ctk.CTkCheckBox(odds_frame, text="Shiny Charm", variable=self.current_charm).pack(side="left")
+        ctk.CTkLabel(odds_frame, text="Chain:").pack(side="left", padx=(10, 0))
+        chain_entry = ctk.CTkEntry(odds_frame, width=50, textvariable=self.chain_text)
+        chain_entry.pack(side="left", padx=5)
+
         # Adjust frame
         adjust_frame = ctk.CTkFrame(control_frame, fg_color="transparent")
         adjust_frame.pack(fill="x", pady=5)
         ctk.CTkLabel(adjust_frame, text="Adjust by:").pack(side="left")
-        self.amount_entry = ctk.CTkEntry(adjust_frame, width=50)
-        self.amount_entry.pack(side="left", padx=5)
-        self.amount_entry.insert(0, "1")
+        amount_entry = ctk.CTkEntry(adjust_frame, width=50, textvariable=self.amount_text)
+        amount_entry.pack(side="left", padx=5)
 
         # Button frame
         button_frame = ctk.CTkFrame(control_frame, fg_color="transparent")
@@ -223,6 +321,7 @@ class ShinyCounter:
         ctk.CTkButton(button_frame, text="Phase", command=lambda: self.handle_phase_input(),
                       fg_color="#FFCB05", text_color="#2C3E50", width=40).pack(side="left", expand=True)
 
+    def create_hunts_widgets(self):
         # Right panel (hunts) with proper background
         hunts_panel = ctk.CTkFrame(self.main_frame, corner_radius=0)
         hunts_panel.pack(side="right", fill="both", expand=True, padx=0, pady=0)
@@ -233,7 +332,7 @@ class ShinyCounter:
         ctk.CTkLabel(header_frame, text="Shiny Hunts", font=("Arial", 14, "bold")).pack(side="left")
         self.note_filter_entry = ctk.CTkEntry(header_frame, placeholder_text="Filter notes...")
         self.note_filter_entry.pack(side="right", padx=10)
-        self.note_filter_entry.bind("<KeyRelease>", lambda e: self.update_hunts_panel())
+        self.note_filter_entry.bind("<KeyRelease>", self.on_note_filter_changed)
 
         # Filter buttons
         filter_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
@@ -254,41 +353,114 @@ class ShinyCounter:
                         state="readonly").pack(side="left", padx=2)
         ctk.CTkComboBox(sort_frame, variable=self.sort_order, values=["ascending", "descending"], width=100,
                         state="readonly").pack(side="left", padx=2)
-        self.sort_by.trace_add('write', lambda *args: self.update_hunts_panel())
-        self.sort_order.trace_add('write', lambda *args: self.update_hunts_panel())
+        self.sort_by.trace_add('write', lambda *args: self.on_sort_changed())
+        self.sort_order.trace_add('write', lambda *args: self.on_sort_changed())
 
         # Canvas for scrollable hunts with proper background
         self.hunts_canvas = tk.Canvas(hunts_panel, highlightthickness=0,
                                       bg="#2b2b2b" if self.current_theme == "dark" else "#f0f0f0")
         self.hunts_scrollbar = ctk.CTkScrollbar(hunts_panel, orientation="vertical", command=self.hunts_canvas.yview)
-        self.hunts_frame = ctk.CTkFrame(self.hunts_canvas, fg_color="transparent")
 
         self.hunts_canvas.pack(side="left", fill="both", expand=True)
         self.hunts_scrollbar.pack(side="right", fill="y")
-        self.hunts_canvas.create_window((0, 0), window=self.hunts_frame, anchor="nw")
-        self.hunts_canvas.configure(yscrollcommand=self.hunts_scrollbar.set)
+        self.hunts_canvas.configure(yscrollcommand=self.on_hunts_scroll)
+
+        # Only cards for rows in or near the viewport exist as widgets
+        self.hunt_grid = VirtualGrid(
+            self.hunts_canvas,
+            create_card=self.create_hunt_card,
+            bind_card=self.bind_hunt_card,
+            row_height=Config.CARD_ROW_HEIGHT,
+            min_card_width=Config.CARD_MIN_WIDTH,
+            min_columns=Config.MIN_COLUMNS,
+            max_columns=Config.MAX_COLUMNS,
+            cards_per_pass=Config.STARTUP_CARDS_PER_PASS
+        )
 
-        self.hunts_frame.bind("<Configure>", self.on_hunts_frame_configure)
         self.hunts_canvas.bind("<Configure>", self.on_canvas_configure)
         self.hunts_canvas.bind_all("<MouseWheel>", self.on_mousewheel)
 
-        # Menu
+    def create_menu(self):
         menubar = tk.Menu(self.root)
         file_menu = tk.Menu(menubar, tearoff=0)
         file_menu.add_command(label="New Hunt", command=self.change_pokemon)
         file_menu.add_command(label="Toggle Theme", command=self.toggle_theme)
         file_menu.add_command(label="Run Melon Script", command=self.run_melon_script)
+        file_menu.add_command(label="Diagnostics", command=self.show_diagnostics)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.on_close)
         menubar.add_cascade(label="File", menu=file_menu)
+        debug_menu = tk.Menu(menubar, tearoff=0)
+        debug_menu.add_checkbutton(label="Enable Profiling", variable=self.profiling, command=self.toggle_profiling)
+        debug_menu.add_command(label="Show Metrics", command=self.show_metrics)
+        debug_menu.add_command(label="Export Chrome Trace...", command=self.export_trace)
+        debug_menu.add_command(label="Reset Metrics", command=profiler.reset)
+        menubar.add_cascade(label="Debug", menu=debug_menu)
         self.root.config(menu=menubar)
 
+    def on_sort_changed(self):
+        self.tracker.saved_data.sort_by = self.sort_by.get()
+        self.tracker.saved_data.sort_order = self.sort_order.get()
+        self.renderer.request_full()
+
     def toggle_theme(self):
         new_theme = "light" if self.current_theme == "dark" else "dark"
         self.set_theme(new_theme)
         # Update canvas background color
         self.hunts_canvas.configure(bg="#f0f0f0" if new_theme == "light" else "#2b2b2b")
-        self.save_data()
+        self.tracker.save_settings()
+
+    def show_diagnostics(self):
+        images = self.images.stats()
+        cache = self.sprite_cache.stats()
+        saves = self.tracker.saver.stats()
+        messagebox.showinfo(
+            "Diagnostics",
+            f"Live images: {images['images']} ({images['bytes'] / 1024:,.0f} KB) across {images['owners']} widgets\n"
+            f"Decoded sprite cache: {cache['entries']} sprites ({cache['bytes'] / 1024:,.0f} KB), "
+            f"{cache['hits']:,} hits / {cache['misses']:,} misses\n"
+            f"Saves: {saves['writes']:,} writes for {saves['requests']:,} requests, "
+            f"last {saves['last_write_ms']:.1f} ms, max {saves['max_write_ms']:.1f} ms, "
+            f"oldest pending change {saves['pending_age']:.1f} s\n"
+            "Startup: " + ", ".join(f"{milestone} {ms:.0f} ms" for milestone, ms in self.startup_times.items())
+        )
+
+    def toggle_profiling(self):
+        if self.profiling.get():
+            profiler.enable()
+        else:
+            profiler.disable()
+
+    def show_metrics(self):
+        popup = ctk.CTkToplevel(self.root)
+        popup.title("Metrics")
+        popup.geometry("760x400")
+        text = ctk.CTkTextbox(popup, font=("Courier", 12), wrap="none")
+        text.pack(fill="both", expand=True, padx=5, pady=5)
+
+        def refresh():
+            text.configure(state="normal")
+            text.delete("1.0", "end")
+            text.insert("1.0", profiler.report() if profiler.histograms or profiler.counters
+                        else "No metrics yet. Enable profiling in the Debug menu.")
+            text.configure(state="disabled")
+
+        ctk.CTkButton(popup, text="Refresh", command=refresh).pack(pady=(0, 5))
+        refresh()
+
+    def export_trace(self):
+        if not profiler.trace:
+            messagebox.showinfo("Export Chrome Trace", "No spans recorded yet. Enable profiling in the Debug menu.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".json", initialfile="shiny_hunter_trace.json",
+                                            filetypes=[("Chrome trace", "*.json")])
+        if not path:
+            return
+        try:
+            count = profiler.export_chrome_trace(path)
+            messagebox.showinfo("Export Chrome Trace", f"Wrote {count:,} spans. Open it in chrome://tracing or ui.perfetto.dev.")
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not write trace: {e}")
 
     def run_melon_script(self):
         try:
@@ -301,180 +473,59 @@ class ShinyCounter:
     def on_mousewheel(self, event):
         self.hunts_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-    def load_data(self):
-        try:
-            if os.path.exists(self.storage_file):
-                with open(self.storage_file, 'r') as f:
-                    loaded_data = json.load(f)
-                    pokemon_dict = {}
-                    for k, v in loaded_data.get('pokemon', {}).items():
-                        try:
-                            # Handle missing fields for backward compatibility
-                            if 'phase' not in v:
-                                v['phase'] = 1
-                            if 'target' not in v:
-                                v['target'] = None
-                            pokemon_dict[k] = PokemonData(**v)
-                        except Exception as e:
-                            print(f"Skipping invalid Pokémon entry {k}: {e}")
-                    self.saved_data = AppData(
-                        pokemon=pokemon_dict,
-                        active_hunts=loaded_data.get('active_hunts', []),
-                        last_pokemon=loaded_data.get('last_pokemon'),
-                        theme=loaded_data.get('theme', 'dark'),
-                        sort_by=loaded_data.get('sort_by', 'most_recent'),
-                        sort_order=loaded_data.get('sort_order', 'descending')
-                    )
-                    self.current_theme = self.saved_data.theme
-                    self.sort_by.set(self.saved_data.sort_by)
-                    self.sort_order.set(self.saved_data.sort_order)
-        except json.JSONDecodeError as e:
-            messagebox.showerror("Error", f"Invalid JSON data: {e}")
-            self.saved_data = AppData(pokemon={})
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not load data: {e}")
-            self.saved_data = AppData(pokemon={})
-
-    def save_data(self):
-        try:
-            self.saved_data.sort_by = self.sort_by.get()
-            self.saved_data.sort_order = self.sort_order.get()
-            data = {
-                "pokemon": {
-                    k: {
-                        **asdict(v),
-                        # Ensure phase and target are always included
-                        "phase": getattr(v, 'phase', 1),
-                        "target": getattr(v, 'target', None)
-                    }
-                    for k, v in self.saved_data.pokemon.items()
-                },
-                "active_hunts": self.saved_data.active_hunts,
-                "last_pokemon": self.saved_data.last_pokemon,
-                "theme": self.saved_data.theme,
-                "sort_by": self.saved_data.sort_by,
-                "sort_order": self.saved_data.sort_order
-            }
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, default=str)
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not save data: {e}")
-
     def load_pokemon(self, pokemon_name):
-        base_name = pokemon_name.split(" phase ")[0].lower()
-        if any(c.isdigit() for c in pokemon_name):
-            phase = int(pokemon_name.split()[-1])
-        else:
-            phase = 1
-
         try:
-            pokemon_name = pokemon_name.lower()
-            self.current_pokemon = pokemon_name
-
-            # Update active hunts order
-            if pokemon_name in self.saved_data.active_hunts:
-                self.saved_data.active_hunts.remove(pokemon_name)
-            self.saved_data.active_hunts.insert(0, pokemon_name)
-
-            if self.current_pokemon in self.saved_data.pokemon:
-                data = self.saved_data.pokemon[self.current_pokemon]
-                self.current_number = data.encounters
-                self.default_adjustment = data.adjustment
-                if data.game:
-                    self.current_game.set(data.game)
-                if data.method:
-                    self.current_method.set(data.method)
-                if pokemon_name not in self.saved_data.active_hunts:
-                    self.saved_data.active_hunts.append(pokemon_name)
-
-            self.update_display()
-            self.load_pokemon_image(pokemon_name, size=Config.MAIN_SPRITE_SIZE)
-            self.update_hunts_panel()
+            # The tracker reports the switch back through on_tracker_change, see show_current_hunt
+            self.tracker.select_hunt(pokemon_name)
         except Exception as e:
             messagebox.showerror("Error", f"Couldn't load Pokémon: {e}")
 
+    def show_current_hunt(self):
+        tracker = self.tracker
+        if tracker.game:
+            self.current_game.set(tracker.game)
+        self.current_method.set(tracker.method)
+        self.current_charm.set(tracker.charm)
+        self.chain_text.set(str(tracker.chain))
+        self.renderer.request_display()
+        self.load_pokemon_image(tracker.current_pokemon, size=Config.MAIN_SPRITE_SIZE)
+
+    @profiler.timed("ui.load_pokemon_image")
     def load_pokemon_image(self, pokemon_name, size=Config.MAIN_SPRITE_SIZE):
+        if self.sprite_loader is None:
+            return  # Shown by start_sprite_services
         # Extract base name for phases (remove " phase X" suffix)
         base_name = pokemon_name.split(" phase ")[0].lower()
 
-        try:
-            cache_file = CACHE_DIR / f"{base_name}_{size[0]}x{size[1]}.png"
-
-            if cache_file.exists():
-                img = Image.open(cache_file)
-            else:
-                response = requests.get(f"{Config.API_BASE_URL}/pokemon/{base_name}")
-                data = response.json()
-                sprite_url = data['sprites']['front_shiny'] or data['sprites']['front_default']
-                response = requests.get(sprite_url)
-                img = Image.open(BytesIO(response.content))
-                img = img.resize(size, Image.Resampling.LANCZOS)
-                img.save(cache_file)
-
-            # Convert to CTkImage
-            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=size)
-            self.image_references.append(ctk_img)
-            self.pokemon_label.configure(image=ctk_img)
-            self.pokemon_label.image = ctk_img
-
-            if self.current_pokemon in self.saved_data.pokemon:
-                self.saved_data.pokemon[self.current_pokemon].sprite_url = str(cache_file)
-        except Exception as e:
-            print(f"Error loading image: {e}")
-            response = requests.get(DEFAULT_SPRITE_URL)
-            img = Image.open(BytesIO(response.content)).resize(size, Image.Resampling.LANCZOS)
-            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=size)
-            self.image_references.append(ctk_img)
-            self.pokemon_label.configure(image=ctk_img)
-            self.pokemon_label.image = ctk_img
-
-    def get_next_phase_number(self, target_name):
-        target_name = target_name.lower()
-        phases = [p for p in self.saved_data.pokemon.values()
-                  if p.target and p.target.lower() == target_name]
-        return len(phases) + 1
-
-    def handle_phase(self, phased_pokemon):
-        if not self.current_pokemon:
+        # Already decoded sprites are shown directly, anything else arrives from the loader thread
+        cached = self.sprite_cache.peek(base_name, size)
+        if cached is not None:
+            self.on_sprite_loaded(pokemon_name.lower(), base_name, cached,
+                                  self.sprite_cache.path_for(base_name, size), size)
             return
 
-        # Create new phase entry
-        base_name = phased_pokemon.lower()
-        # Get all phases for current target (including other targets)
-        all_phases = [p for p in self.saved_data.pokemon.values()
-                      if p.target and p.target.lower() == self.current_pokemon.lower()]
-
-        # Calculate next phase number
-        phase_number = len(all_phases) + 1
-
-        new_name = f"{base_name} phase {phase_number}"
-
-        # Create COMPLETED phase entry (never modified again)
-        self.saved_data.pokemon[new_name] = PokemonData(
-            name=new_name,
-            encounters=self.current_number,  # Frozen at current count
-            adjustment=self.default_adjustment,
-            game=self.current_game.get(),
-            method=self.current_method.get(),
-            last_updated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            status="COMPLETE",  # Marked complete immediately
-            found_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),  # Save found date
-            phase=phase_number,
-            target=self.current_pokemon  # Links back to main hunt
+        self.set_main_sprite("placeholder", self.sprite_loader.placeholder(size), size)
+        self.sprite_loader.request(
+            base_name, size,
+            lambda img, cache_file: self.on_sprite_loaded(pokemon_name.lower(), base_name, img, cache_file, size)
         )
 
-        # Update main hunt's phase counter only (don't reset encounters)
-        if self.current_pokemon in self.saved_data.pokemon:
-            current_data = self.saved_data.pokemon[self.current_pokemon]
-            current_data.phase = phase_number + 1  # Increment phase counter
-            current_data.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def on_sprite_loaded(self, pokemon_name, base_name, img, cache_file, size):
+        # Ignore sprites for hunts that were switched away from while loading
+        if img is None or pokemon_name != self.tracker.current_pokemon:
+            return
 
-        self.save_data()
-        self.update_hunts_panel()
+        # No cache file means the loader fell back to the default sprite
+        self.set_main_sprite(base_name if cache_file else "default", img, size)
+        hunts = self.tracker.saved_data.pokemon
+        if cache_file and pokemon_name in hunts:
+            hunts[pokemon_name].sprite_url = str(cache_file)
 
-    def update_hunt_card(self, pokemon_name, pokemon_data):
-        card = self.hunt_cards[pokemon_name]
+    def set_main_sprite(self, species, img, size):
+        ctk_img = self.images.acquire(self.pokemon_label, species, size, img)
+        self.pokemon_label.configure(image=ctk_img)
 
+    def update_hunt_card(self, card, pokemon_data):
         # Update status
         status_color = {
             "COMPLETE": "#28a745",
@@ -482,36 +533,71 @@ class ShinyCounter:
             "ACTIVE": "#3D7DCA",
             "PHASE": "#FFA500"  # Add orange color for phases
         }.get(pokemon_data.status, "#3D7DCA")
-        card.status_label.configure(
-            text=f"• {pokemon_data.status}",
-            text_color=status_color
-        )
+        display_status = f"Phase {pokemon_data.phase}" if pokemon_data.target else pokemon_data.status
+        self.set_card_widget(card, "status_label", text=f"• {display_status}", text_color=status_color)
 
         # Update encounters
         formatted_number = "{:,}".format(pokemon_data.encounters)
-        card.encounters_label.configure(text=f"Encounters: {formatted_number}")
+        self.set_card_widget(card, "encounters_label", text=f"Encounters: {formatted_number}")
 
         # Update probability
-        odds = self.calculate_shiny_odds(pokemon_data)
-        probability = 1 - ((odds - 1) / odds) ** pokemon_data.encounters
-        card.probability_label.configure(
-            text=f"Shiny Chance: {probability:.2%} (1/{odds:,})"
-        )
+        if pokemon_data.method:
+            stats = self.hunt_stats.get(pokemon_data.name)
+            if stats is None:
+                self.compute_hunt_stats([pokemon_data.name])
+                stats = self.hunt_stats[pokemon_data.name]
+            self.set_card_widget(card, "probability_label", visible=True,
+                                 text=f"Shiny Chance: {stats.probability:.2%} "
+                                      f"(1/{self.tracker.odds.odds_for(pokemon_data):,})")
+        else:
+            self.set_card_widget(card, "probability_label", visible=False)
 
         # Update game
-        if card.game_label:
-            card.game_label.configure(text=f"Game: {pokemon_data.game}")
+        if pokemon_data.game:
+            self.set_card_widget(card, "game_label", visible=True, text=f"Game: {pokemon_data.game}")
+        else:
+            self.set_card_widget(card, "game_label", visible=False)
 
         # Update found date
-        if card.found_date_label and pokemon_data.status == "COMPLETE":
-            card.found_date_label.configure(text=f"Found: {pokemon_data.found_date}")
+        if pokemon_data.status == "COMPLETE" and pokemon_data.found_date:
+            self.set_card_widget(card, "found_date_label", visible=True, text=f"Found: {pokemon_data.found_date}")
+        else:
+            self.set_card_widget(card, "found_date_label", visible=False)
+
+        # Update encounter rate and ETA
+        rates = self.tracker.rates.per_hour(pokemon_data.name) if pokemon_data.status != "COMPLETE" else None
+        if rates and any(rates):
+            per_hour = rates[-1] or rates[0]
+            eta = self.tracker.eta_summary(pokemon_data, per_hour)
+            self.set_card_widget(card, "rate_label", visible=True,
+                                 text=f"{per_hour:,.0f}/h" + (f" · {eta}" if eta else ""))
+        else:
+            self.set_card_widget(card, "rate_label", visible=False)
 
         # Update status button
         btn_text = "✓" if pokemon_data.status == "COMPLETE" else "▶"
         btn_fg = "#28a745" if pokemon_data.status == "COMPLETE" else "#3D7DCA"
-        card.status_button.configure(text=btn_text, fg_color=btn_fg)
+        self.set_card_widget(card, "status_button", text=btn_text, fg_color=btn_fg)
+
+    def set_card_widget(self, card, attr, visible=None, **options):
+        # Skip the Tk round trip for widgets whose content did not change
+        state = (visible, options)
+        if card.rendered.get(attr) == state:
+            return
+        card.rendered[attr] = state
+
+        widget = getattr(card, attr)
+        if visible is False:
+            widget.grid_remove()
+            return
+        widget.configure(**options)
+        if visible:
+            widget.grid()
 
     def change_pokemon(self):
+        if self.species_catalog is None:
+            # Opened (e.g. by "+" with no hunts) before startup reached this step; the picker needs the catalog
+            self.start_sprite_services()
         popup = ctk.CTkToplevel(self.root)
         popup.title("Select Pokémon")
         popup.geometry("300x400")
@@ -536,41 +622,75 @@ class ShinyCounter:
         pokemon_list.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+        # Generation filter and ordering, both answered from the local species catalog
+        options_frame = ctk.CTkFrame(popup, fg_color="transparent")
+        options_frame.pack(fill="x", padx=5, before=list_frame)
         current_gen = Config.POKEMON_GAMES.get(self.current_game.get(), 9)
-        all_pokemon = []
-        for gen in range(1, current_gen + 1):
-            try:
-                response = requests.get(f"{Config.API_BASE_URL}/generation/{gen}")
-                data = response.json()
-                all_pokemon.extend(p['name'].capitalize() for p in data['pokemon_species'])
-            except:
-                gen_range = {
-                    1: (1, 151), 2: (152, 251), 3: (252, 386),
-                    4: (387, 493), 5: (494, 649), 6: (650, 721),
-                    7: (722, 809), 8: (810, 905), 9: (906, 1025)
-                }.get(gen, (1, 151))
-                all_pokemon.extend(f"Pokémon {i}" for i in range(gen_range[0], gen_range[1] + 1))
-
-        for pokemon in sorted(set(all_pokemon)):
-            pokemon_list.insert(tk.END, pokemon)
-
-        def update_list(*args):
-            search_term = search_var.get().lower()
+        gen_choices = [f"Gen 1-{current_gen}", "All"] + [f"Gen {g}" for g in range(1, 10)]
+        gen_var = ctk.StringVar(value=gen_choices[0])
+        order_var = ctk.StringVar(value="Name")
+        ctk.CTkOptionMenu(options_frame, variable=gen_var, values=gen_choices, width=110,
+                          command=lambda _: populate()).pack(side="left", padx=2)
+        ctk.CTkOptionMenu(options_frame, variable=order_var, values=["Name", "Dex #"], width=90,
+                          command=lambda _: populate()).pack(side="left", padx=2)
+        status_label = ctk.CTkLabel(popup, text="")
+
+        index = [SearchIndex([])]
+        shown_version = [None]
+        search_job = [None]
+
+        def populate():
+            choice = gen_var.get()
+            order = "dex" if order_var.get() == "Dex #" else "name"
+            if choice == "All":
+                species = self.species_catalog.query(order=order)
+            elif "-" in choice:
+                species = self.species_catalog.query(max_generation=current_gen, order=order)
+            else:
+                species = self.species_catalog.query(generation=int(choice.split()[-1]), order=order)
+            index[0] = SearchIndex([s.name.capitalize() for s in species])
+            shown_version[0] = self.species_catalog.version
+            update_list()
+
+        def update_list():
+            search_job[0] = None
+            matches = index[0].search(search_var.get().strip())
             pokemon_list.delete(0, tk.END)
-            for pokemon in all_pokemon:
-                if search_term in pokemon.lower():
-                    pokemon_list.insert(tk.END, pokemon)
+            if matches:
+                pokemon_list.insert(tk.END, *matches)
+
+        def on_search(*args):
+            # Debounce keystrokes so fast typing only filters once
+            if search_job[0]:
+                popup.after_cancel(search_job[0])
+            search_job[0] = popup.after(Config.SEARCH_DEBOUNCE_MS, update_list)
+
+        def watch_catalog():
+            # Pick up a catalog that finished downloading while the popup is open
+            if not popup.winfo_exists():
+                return
+            if self.species_catalog.version != shown_version[0]:
+                populate()
+            if self.species_catalog.species:
+                status_label.pack_forget()
+            else:
+                status_label.configure(text="Species list unavailable offline" if self.species_catalog.last_error
+                                       else "Downloading species list...")
+                status_label.pack(fill="x", padx=5, before=list_frame)
+            if self.species_catalog.refreshing:
+                popup.after(250, watch_catalog)
 
-        search_var.trace_add('write', update_list)
+        search_var.trace_add('write', on_search)
+        self.species_catalog.refresh_async()
+        populate()
+        watch_catalog()
 
         def on_select():
             try:
                 selection = pokemon_list.get(pokemon_list.curselection())
                 popup.destroy()
                 self.load_pokemon(selection)
-                if selection not in self.saved_data.active_hunts:
-                    self.saved_data.active_hunts.append(selection)
-                self.save_data()
+                self.tracker.save_settings()
             except:
                 messagebox.showwarning("No Selection", "Please select a Pokémon")
 
@@ -581,93 +701,63 @@ class ShinyCounter:
             side="right")
 
     def adjust_number(self, action):
-        if not self.current_pokemon:
-            if not self.saved_data.active_hunts:
-                self.change_pokemon()
-                return
-            self.load_pokemon(self.saved_data.active_hunts[0])
-
-        try:
-            amount = int(self.amount_entry.get())
-        except ValueError:
-            amount = 1
-
-        if action == "increase":
-            self.current_number += amount
-        elif action == "decrease":
-            self.current_number = max(0, self.current_number - amount)
-        elif action == "reset":
-            self.current_number = 0
-
-        self.update_display()
-        self.save_pokemon_data()
-        self.update_hunts_panel()
-
-    def save_pokemon_data(self):
-        if not self.current_pokemon:
+        if not self.tracker.current_pokemon and not self.tracker.saved_data.active_hunts:
+            self.change_pokemon()
             return
-
-        adjustment = int(self.amount_entry.get()) if self.amount_entry.get().isdigit() else 1
-
-        if self.current_pokemon not in self.saved_data.pokemon:
-            # Add this line to get the correct starting phase number
-            initial_phase = self.get_next_phase_number(self.current_pokemon)
-
-            self.saved_data.pokemon[self.current_pokemon] = PokemonData(
-                name=self.current_pokemon,
-                encounters=self.current_number,
-                adjustment=adjustment,
-                game=self.current_game.get(),
-                method=self.current_method.get(),
-                last_updated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                status="ACTIVE",
-                phase=initial_phase  # Use the calculated phase number here
-            )
-        else:
-            data = self.saved_data.pokemon[self.current_pokemon]
-            data.encounters = self.current_number
-            data.adjustment = adjustment
-            data.game = self.current_game.get()
-            data.method = self.current_method.get()
-            data.last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        self.save_data()
+        self.tracker.adjust(action)
 
     def update_display(self):
-        if not self.current_pokemon:
+        tracker = self.tracker
+        if not tracker.current_pokemon:
             return
 
-        formatted_number = "{:,}".format(self.current_number)
+        formatted_number = "{:,}".format(tracker.current_number)
         display_text = f"Encounters: {formatted_number}"
 
-        if self.current_pokemon in self.saved_data.pokemon:
-            pokemon_data = self.saved_data.pokemon[self.current_pokemon]
+        if tracker.current_pokemon in tracker.saved_data.pokemon:
+            pokemon_data = tracker.saved_data.pokemon[tracker.current_pokemon]
             if pokemon_data.method:
-                odds = self.calculate_shiny_odds(pokemon_data)
-                probability = 1 - ((odds - 1) / odds) ** self.current_number
-                display_text += f"\nShiny Chance: {probability:.2%} (1/{odds:,})"
+                chance = tracker.odds.chance_for(pokemon_data)
+                stats = tracker.odds.stats(tracker.current_number, chance)
+                display_text += f"\nShiny Chance: {stats.probability:.2%} (1/{round(1 / chance):,})"
+            rates = tracker.rates.per_hour(tracker.current_pokemon)
+            if rates and any(rates):
+                short_rate, long_rate = rates[0], rates[-1]
+                display_text += (f"\nRate: {short_rate:,.0f}/h ({Config.RATE_WINDOWS[0] // 60} min)"
+                                 f" · {long_rate:,.0f}/h ({Config.RATE_WINDOWS[-1] // 60} min)")
+                eta = tracker.eta_summary(pokemon_data, long_rate or short_rate)
+                if eta:
+                    display_text += f"\nETA {eta}"
 
         self.number_label.configure(text=display_text)
 
-    def calculate_shiny_odds(self, pokemon_data):
-        base_odds = 4096
-        if pokemon_data.game and pokemon_data.game in Config.POKEMON_GAMES:
-            generation = Config.POKEMON_GAMES[pokemon_data.game]
-            if generation <= 5:
-                base_odds = 8192
-
-        method = pokemon_data.method if pokemon_data.method else "Full Odds"
-        if method == "Shiny Charm":
-            return base_odds // 3
-        elif method == "Masuda Method":
-            return base_odds // 6 if base_odds == 4096 else base_odds // 5
-        elif method == "Masuda + Charm":
-            return base_odds // 8 if base_odds == 4096 else base_odds // 6
-        return base_odds
+    def refresh_rates(self):
+        # Rates decay while a hunt is idle, so redraw them even without new encounters
+        names = [name for name in self.tracker.rates.names() if name in self.tracker.saved_data.pokemon]
+        if names:
+            self.renderer.mark_dirty(*names)
+            self.renderer.request_display()
+        self.root.after(Config.RATE_REFRESH_MS, self.refresh_rates)
+
+    def compute_hunt_stats(self, names):
+        self.hunt_stats.update(self.tracker.compute_stats(names))
 
     def set_filter(self, filter_type):
         self.current_filter.set(filter_type)
-        self.update_hunts_panel()
+        self.renderer.request_full()
+
+    def on_note_filter_changed(self, event=None):
+        # Debounce keystrokes so fast typing only filters once
+        if self.note_filter_job:
+            self.root.after_cancel(self.note_filter_job)
+        self.note_filter_job = self.root.after(Config.FILTER_DEBOUNCE_MS, self.apply_note_filter)
+
+    def apply_note_filter(self):
+        self.note_filter_job = None
+        text = self.note_filter_entry.get().lower()
+        if text != self.note_filter_text:
+            self.note_filter_text = text
+            self.renderer.request_full()
 
     def on_canvas_configure(self, event):
         if self.resize_job:
@@ -675,123 +765,90 @@ class ShinyCounter:
         self.resize_job = self.root.after(200, self.resize_columns)
 
     def resize_columns(self):
-        current_width = self.hunts_canvas.winfo_width()
-        columns = self.calculate_columns()
-
-        row, col = 0, 0
-        for card in self.hunt_cards.values():
-            card.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-            col += 1
-            if col >= columns:
-                col = 0
-                row += 1
-
-        for c in range(columns):
-            self.hunts_frame.grid_columnconfigure(c, weight=1)
-
-        self.hunts_canvas.configure(scrollregion=self.hunts_canvas.bbox("all"))
-
-    def on_hunts_frame_configure(self, event):
-        self.hunts_canvas.configure(scrollregion=self.hunts_canvas.bbox("all"))
-
-    def calculate_columns(self):
-        canvas_width = self.hunts_canvas.winfo_width()
-        columns = max(Config.MIN_COLUMNS, min(Config.MAX_COLUMNS, canvas_width // Config.CARD_MIN_WIDTH))
-        return columns
-
-    def update_hunts_panel(self):
-        current_width = self.hunts_canvas.winfo_width()
-        filtered_hunts = self.filter_hunts()
-        sorted_hunts = sorted(filtered_hunts, key=self.get_sort_key,
-                              reverse=self.sort_order.get() == "descending")
-        current_hunt_names = {hunt.name for hunt in sorted_hunts}
-
-        # Remove cards that are no longer needed
-        for name in list(self.hunt_cards.keys()):
-            if name not in current_hunt_names:
-                self.hunt_cards[name].destroy()
-                del self.hunt_cards[name]
-
-        # Calculate grid layout
-        columns = self.calculate_columns()
-        row, col = 0, 0
-
-        # Update or create cards
-        for hunt in sorted_hunts:
-            pokemon_name = hunt.name
-            if pokemon_name in self.hunt_cards:
-                self.update_hunt_card(pokemon_name, hunt)
-            else:
-                self.hunt_cards[pokemon_name] = self.create_hunt_card(pokemon_name, hunt)
-
-            # Reposition card
-            self.hunt_cards[pokemon_name].grid(
-                row=row, column=col,
-                padx=5, pady=5, sticky="nsew"
-            )
-
-            col += 1
-            if col >= columns:
-                col = 0
-                row += 1
-
-        # Configure grid columns
-        for c in range(columns):
-            self.hunts_frame.grid_columnconfigure(c, weight=1)
-
-        # Update canvas scroll region
-        self.hunts_canvas.configure(scrollregion=self.hunts_canvas.bbox("all"))
-
-    def filter_hunts(self):
-        filter_type = self.current_filter.get()
-        note_filter = self.note_filter_entry.get().lower()
-
-        return [
-            p for p in self.saved_data.pokemon.values()
-            if (filter_type == "all" or
-                (filter_type == "active" and p.status == "ACTIVE") or
-                (filter_type == "complete" and p.status == "COMPLETE") or
-                (filter_type == "paused" and p.status == "PAUSED") or
-                (filter_type == "phase" and p.status == "PHASE"))
-               and (not note_filter or
-                    (p.notes and note_filter in p.notes.lower()) or
-                    (p.target and note_filter in p.target.lower()) or
-                    (p.name and note_filter in p.name.lower()))
-        ]
-
-    def get_sort_key(self, data):
-        if self.sort_by.get() == "most_recent":
-            return datetime.strptime(data.last_updated, "%Y-%m-%d %H:%M:%S") if data.last_updated else datetime.min
-        return data.encounters
+        self.resize_job = None
+        self.hunt_grid.relayout()
+
+    def on_hunts_scroll(self, first, last):
+        self.hunts_scrollbar.set(first, last)
+        # Materialize cards for rows that scrolled into view
+        self.hunt_grid.schedule_render()
+
+    @profiler.timed("ui.update_hunts_panel")
+    def update_hunts_panel(self, rebind=True):
+        self.hunt_grid.set_items(self.ordered_hunt_names(), rebind=rebind)
+
+    def ordered_hunt_names(self):
+        return self.tracker.ordered_names(self.filter_status(), self.note_filter_text, self.sort_by.get(),
+                                          descending=self.sort_order.get() == "descending")
+
+    def filter_status(self):
+        """Status the hunts panel is filtered to, or None for all"""
+        return {
+            "active": "ACTIVE",
+            "complete": "COMPLETE",
+            "paused": "PAUSED",
+            "phase": "PHASE"
+        }.get(self.current_filter.get())
+
+    @profiler.timed("ui.flush_render")
+    def flush_render(self, dirty, display, full):
+        if display:
+            self.update_display()
+        if self.hunt_grid is None:
+            return  # Filled by create_hunts_panel
+        if full:
+            # Cards compute their own stats when bound, so only hunts in view are hydrated
+            self.hunt_stats.clear()
+            self.update_hunts_panel()
+            return
+
+        dirty = [name for name in dirty if name in self.tracker.saved_data.pokemon]
+        if not dirty:
+            return
+        self.compute_hunt_stats(dirty)
+
+        for name in dirty:
+            self.reposition_hunt(name)
+            self.hunt_grid.refresh(name)
+
+    def reposition_hunt(self, name):
+        """Insert, remove or move one changed hunt's card instead of rebuilding the grid"""
+        old_index = self.hunt_grid.index_of(name)
+        hunt_indexes = self.tracker.hunt_indexes
+        if not hunt_indexes.matches(name, self.filter_status(), self.note_filter_text):
+            if old_index >= 0:
+                self.hunt_grid.remove(name)
+            return
+
+        new_index = hunt_indexes[self.sort_by.get()].insertion_point(
+            self.hunt_grid.keys, name, descending=self.sort_order.get() == "descending", skip=old_index)
+        if old_index < 0:
+            self.hunt_grid.insert(name, new_index)
+        else:
+            self.hunt_grid.move(name, new_index)
 
     def handle_phase_input(self):
         phased_pokemon = simpledialog.askstring("New Phase",
                                                 "Enter the Pokémon you phased on:",
                                                 parent=self.root)
         if phased_pokemon:
-            self.handle_phase(phased_pokemon)
-
-    def create_hunt_card(self, pokemon_name, pokemon_data):
-        card = ctk.CTkFrame(self.hunts_frame)
-        status = pokemon_data.status
-        status_color = {
-            "COMPLETE": "#28a745",
-            "PAUSED": "#e74c3c",
-            "ACTIVE": "#3D7DCA"
-        }.get(status, "#3D7DCA")
+            self.tracker.phase(phased_pokemon)
 
-        # Use theme-appropriate colors
+    def create_hunt_card(self, parent):
+        # Cards are recycled by the virtual grid, so they start empty and get filled by bind_hunt_card
         bg_color = self.root._apply_appearance_mode(ctk.ThemeManager.theme["CTkFrame"]["fg_color"])
         border_color = self.root._apply_appearance_mode(ctk.ThemeManager.theme["CTkButton"]["border_color"])
 
         card = ctk.CTkFrame(
-            self.hunts_frame,
+            parent,
             fg_color=bg_color,
             border_width=2,
             border_color=border_color,
             corner_radius=10
         )
-
+        card.pokemon_name = None
+        card.sprite_species = None
+        card.rendered = {}  # Last options applied per widget, see set_card_widget
 
         # Header with name and status
         header = ctk.CTkFrame(card, fg_color="transparent")
@@ -801,82 +858,34 @@ class ShinyCounter:
         name_frame = ctk.CTkFrame(header, fg_color="transparent")
         name_frame.pack(side="left", fill="x", expand=True)
 
-        name_text = pokemon_name.split()[0].capitalize()
-        if pokemon_data.phase > 1:
-            name_text += f" (Phase {pokemon_data.phase})"
-        if pokemon_data.target:
-            name_text += f" → {pokemon_data.target.capitalize()}"
-
-        name_label = ctk.CTkLabel(
-            name_frame,
-            text=name_text,
-            font=("Arial", 12, "bold")
-        )
-        name_label.pack(side="left")
+        card.name_label = ctk.CTkLabel(name_frame, text="", font=("Arial", 12, "bold"))
+        card.name_label.pack(side="left")
 
-        display_status = f"Phase {pokemon_data.phase}" if pokemon_data.target else status
-        status_label = ctk.CTkLabel(
-            name_frame,
-            text=f"• {display_status}",
-            text_color=status_color
-        )
-        status_label.pack(side="left", padx=5)
+        card.status_label = ctk.CTkLabel(name_frame, text="")
+        card.status_label.pack(side="left", padx=5)
 
         # Image frame
         img_frame = ctk.CTkFrame(card, fg_color="transparent")
         img_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
-
-        try:
-            # Try to load cached image first
-            if pokemon_data.sprite_url and os.path.exists(pokemon_data.sprite_url):
-                img = Image.open(pokemon_data.sprite_url)
-            else:
-                # Fallback to default sprite
-                response = requests.get(DEFAULT_SPRITE_URL)
-                img = Image.open(BytesIO(response.content))
-
-            img = img.resize(Config.CARD_SPRITE_SIZE, Image.Resampling.LANCZOS)
-            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=Config.CARD_SPRITE_SIZE)
-            self.image_references.append(ctk_img)
-            img_label = ctk.CTkLabel(img_frame, image=ctk_img, text="")
-            img_label.image = ctk_img
-            img_label.pack()
-        except Exception as e:
-            print(f"Error loading card image: {e}")
+        card.img_label = ctk.CTkLabel(img_frame, text="")
+        card.img_label.pack()
 
         # Details frame
         details = ctk.CTkFrame(card, fg_color="transparent")
         details.grid(row=1, column=1, sticky="nsew", padx=5, pady=5)
 
-        # Encounters
-        formatted_number = "{:,}".format(pokemon_data.encounters)
-        encounters_label = ctk.CTkLabel(details, text=f"Encounters: {formatted_number}")
-        encounters_label.grid(row=0, column=0, sticky="w")
-
-        # Probability calculation
-        probability_label = None
-        if pokemon_data.method:
-            odds = self.calculate_shiny_odds(pokemon_data)
-            probability = 1 - ((odds - 1) / odds) ** pokemon_data.encounters
-            probability_label = ctk.CTkLabel(
-                details,
-                text=f"Shiny Chance: {probability:.2%} (1/{odds:,})"
-            )
-            probability_label.grid(row=1, column=0, sticky="w")
-
-        # Game information
-        game_label = None
-        if pokemon_data.game:
-            game_label = ctk.CTkLabel(details, text=f"Game: {pokemon_data.game}")
-            game_label.grid(row=2, column=0, sticky="w")
-
-        # Found date
-        found_date_label = None
-        if status == "COMPLETE" and pokemon_data.found_date:
-            found_date_label = ctk.CTkLabel(details, text=f"Found: {pokemon_data.found_date}")
-            found_date_label.grid(row=3, column=0, sticky="w")
-
-        # Action buttons
+        card.encounters_label = ctk.CTkLabel(details, text="")
+        card.encounters_label.grid(row=0, column=0, sticky="w")
+        card.probability_label = ctk.CTkLabel(details, text="")
+        card.probability_label.grid(row=1, column=0, sticky="w")
+        card.game_label = ctk.CTkLabel(details, text="")
+        card.game_label.grid(row=2, column=0, sticky="w")
+        card.found_date_label = ctk.CTkLabel(details, text="")
+        card.found_date_label.grid(row=3, column=0, sticky="w")
+        card.rate_label = ctk.CTkLabel(details, text="")
+        card.rate_label.grid(row=4, column=0, sticky="w")
+
+        # Action buttons act on whichever hunt the card is bound to when clicked
         buttons = ctk.CTkFrame(card, fg_color="transparent")
         buttons.grid(row=2, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
 
@@ -884,7 +893,7 @@ class ShinyCounter:
         load_btn = ctk.CTkButton(
             buttons,
             text="Load",
-            command=lambda p=pokemon_name: self.load_pokemon(p),
+            command=lambda c=card: self.load_pokemon(c.pokemon_name),
             width=60
         )
         load_btn.grid(row=0, column=0, padx=2)
@@ -893,7 +902,7 @@ class ShinyCounter:
         notes_btn = ctk.CTkButton(
             buttons,
             text="Notes",
-            command=lambda p=pokemon_name: self.add_notes(p),
+            command=lambda c=card: self.add_notes(c.pokemon_name),
             fg_color="#FFCB05",
             text_color="#2C3E50",
             width=60
@@ -901,95 +910,76 @@ class ShinyCounter:
         notes_btn.grid(row=0, column=1, padx=2)
 
         # Status toggle button
-        btn_text = "✓" if status == "COMPLETE" else "▶"
-        btn_fg = "#28a745" if status == "COMPLETE" else "#3D7DCA"
-        status_button = ctk.CTkButton(
+        card.status_button = ctk.CTkButton(
             buttons,
-            text=btn_text,
-            command=lambda p=pokemon_name: self.toggle_hunt_status(p),
-            fg_color=btn_fg,
+            text="",
+            command=lambda c=card: self.toggle_hunt_status(c.pokemon_name),
             width=60
         )
-        status_button.grid(row=0, column=2, padx=2)
+        card.status_button.grid(row=0, column=2, padx=2)
 
         # Configure grid weights
         card.grid_columnconfigure(0, weight=1)
         card.grid_columnconfigure(1, weight=2)
 
-        # Store references to dynamic elements
-        card.encounters_label = encounters_label
-        card.probability_label = probability_label
-        card.status_label = status_label
-        card.game_label = game_label
-        card.found_date_label = found_date_label
-        card.status_button = status_button
-
         return card
 
+    @profiler.timed("ui.bind_hunt_card")
+    def bind_hunt_card(self, card, pokemon_name):
+        pokemon_data = self.tracker.saved_data.pokemon[pokemon_name]
+        card.pokemon_name = pokemon_name
+
+        name_text = pokemon_name.split()[0].capitalize()
+        if pokemon_data.phase > 1:
+            name_text += f" (Phase {pokemon_data.phase})"
+        if pokemon_data.target:
+            name_text += f" → {pokemon_data.target.capitalize()}"
+        self.set_card_widget(card, "name_label", text=name_text)
+
+        base_name = pokemon_name.split(" phase ")[0].lower()
+        if card.sprite_species != base_name:
+            card.sprite_species = base_name
+            try:
+                # Only already decoded sprites are bound here; reading, resizing or saving a PNG while
+                # scrolling would stall the Tk thread, so everything else goes through the loader pool
+                img = self.sprite_cache.peek(base_name, Config.CARD_SPRITE_SIZE)
+                if img is not None:
+                    self.set_card_sprite(card.img_label, base_name, img)
+                else:
+                    self.set_card_sprite(card.img_label, "placeholder",
+                                         self.sprite_loader.placeholder(Config.CARD_SPRITE_SIZE))
+                    # Decoded from disk on a worker, or fetched if not cached (or unavailable offline)
+                    self.sprite_loader.request(
+                        base_name, Config.CARD_SPRITE_SIZE,
+                        lambda loaded, cache_file, c=card, species=base_name:
+                            self.on_card_sprite_loaded(c, species, loaded, cache_file)
+                    )
+            except Exception as e:
+                print(f"Error loading card image: {e}")
+
+        self.update_hunt_card(card, pokemon_data)
+
+    def set_card_sprite(self, img_label, species, img):
+        # Cards showing the same species share one registered image
+        ctk_img = self.images.acquire(img_label, species, Config.CARD_SPRITE_SIZE, img)
+        img_label.configure(image=ctk_img)
+
+    def on_card_sprite_loaded(self, card, species, img, cache_file):
+        # The card may have been recycled for another hunt while the sprite was loading
+        if img is None or card.sprite_species != species or not card.winfo_exists():
+            return
+        self.set_card_sprite(card.img_label, species if cache_file else "default", img)
+
     def toggle_hunt_status(self, pokemon_name):
-        pokemon_name = pokemon_name.lower()
-        if pokemon_name in self.saved_data.pokemon:
-            current_status = self.saved_data.pokemon[pokemon_name].status
-            # New status cycle including PHASE
-            status_cycle = {
-                "ACTIVE": "COMPLETE",
-                "COMPLETE": "PAUSED",
-                "PAUSED": "ACTIVE",
-                "PHASE": "COMPLETE"
-            }
-            new_status = status_cycle.get(current_status, "ACTIVE")
-
-            self.saved_data.pokemon[pokemon_name].status = new_status
-
-            if new_status == "COMPLETE" and not self.saved_data.pokemon[pokemon_name].found_date:
-                self.saved_data.pokemon[pokemon_name].found_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            self.save_data()
-            self.update_hunts_panel()
+        self.tracker.toggle_status(pokemon_name)
 
     def add_notes(self, pokemon_name):
-        current_notes = self.saved_data.pokemon[pokemon_name].notes if pokemon_name in self.saved_data.pokemon else ""
+        hunts = self.tracker.saved_data.pokemon
+        current_notes = hunts[pokemon_name].notes if pokemon_name in hunts else ""
         notes = simpledialog.askstring("Add Notes", f"Notes for {pokemon_name}:", initialvalue=current_notes,
                                        parent=self.root)
         if notes is not None:
-            self.saved_data.pokemon[pokemon_name].notes = notes
-            self.save_data()
-            self.update_hunts_panel()
-
-    def initialize_communication_files(self):
-        for filepath in self.communication_files.values():
-            if not os.path.exists(filepath):
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write("16" if "emulator_count" in filepath else "0")
-
-    def setup_file_watcher(self):
-        self.check_emulator_count()
-        self.check_encounter_trigger()
-        self.root.after(500, self.setup_file_watcher)
-
-    def check_emulator_count(self):
-        try:
-            with open(self.communication_files['emulator_count'], 'r') as f:
-                new_value = f.read().strip()
-                current_value = self.amount_entry.get()
-                if new_value.isdigit() and new_value != current_value:
-                    self.amount_entry.delete(0, tk.END)
-                    self.amount_entry.insert(0, new_value)
-        except Exception as e:
-            print(f"Error reading emulator count: {e}")
-
-    def check_encounter_trigger(self):
-        try:
-            mod_time = os.path.getmtime(self.communication_files['encounter_trigger'])
-            if mod_time > self.last_trigger_time:
-                self.last_trigger_time = mod_time
-                if hasattr(self, 'initial_load') and not self.initial_load:
-                    self.adjust_number("increase")
-        except Exception as e:
-            print(f"Error checking encounter trigger: {e}")
-        finally:
-            if hasattr(self, 'initial_load'):
-                self.initial_load = False
+            self.tracker.set_notes(pokemon_name, notes)
 
 
 if __name__ == "__main__":
@@ -997,4 +987,5 @@ if __name__ == "__main__":
     ctk.set_default_color_theme("blue")
     root = ctk.CTk()
     app = ShinyCounter(root)
+    app.measure_startup = "--measure-startup" in sys.argv
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""Lightweight spans, histograms and counters for finding where the tracker spends its time
+
+    with profiler.span("save.write"):
+        ...
+
+    @profiler.timed("update_hunts_panel")
+    def update_hunts_panel(self):
+        ...
+
+While disabled (the default), span() returns a shared no-op context and a
+timed function costs one attribute check before calling through. Enabled,
+each span adds its duration to a fixed log-bucket histogram (count, total,
+max, p50/p95 estimated from the buckets) and, if tracing is on, keeps an
+event for export as a Chrome trace (chrome://tracing or ui.perfetto.dev).
+Spans may be recorded from any thread.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Callable, Dict, Optional
+
+# Bucket upper bounds in ms, 25% apart from 10 us to a bit over a minute
+BUCKET_BOUNDS = [0.01 * 1.25 ** i for i in range(71)]
+
+
+def get_logger(path) -> logging.Logger:
+    """The shiny_hunter logger, appending to path in the log's existing line format"""
+    logger = logging.getLogger("shiny_hunter")
+    if not logger.handlers:
+        handler = logging.FileHandler(path, encoding="utf-8", delay=True)
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float):
+        self.counts[bisect_left(BUCKET_BOUNDS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of samples, capped at the max"""
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max,
+        }
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class Profiler:
+    def __init__(self, max_trace_events: int = 100000):
+        self.enabled = False
+        self.tracing = False
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.trace = deque(maxlen=max_trace_events)  # (name, start ns, end ns, thread id)
+        self.thread_names: Dict[int, str] = {}  # Kept at record time, worker threads may be gone by export
+        self.lock = threading.Lock()
+        self.origin_ns = time.perf_counter_ns()
+        self.log_job = None
+
+    def enable(self, tracing: bool = True):
+        self.tracing = tracing
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.trace.clear()
+
+    def span(self, name: str):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name)
+
+    def timed(self, name: Optional[str] = None):
+        """Decorator recording every call of the function as a span (named after it by default)"""
+        def decorate(function):
+            label = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(label, start, time.perf_counter_ns())
+            return wrapper
+        return decorate
+
+    def count(self, name: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name: str, start_ns: int, end_ns: int):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add((end_ns - start_ns) / 1e6)
+            if self.tracing:
+                tid = threading.get_ident()
+                if tid not in self.thread_names:
+                    self.thread_names[tid] = threading.current_thread().name
+                self.trace.append((name, start_ns, end_ns, tid))
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "spans": {name: histogram.summary() for name, histogram in self.histograms.items()},
+                "counters": dict(self.counters),
+            }
+
+    def report(self) -> str:
+        """Spans by total time, then counters, as a plain-text table"""
+        snapshot = self.snapshot()
+        lines = [f"{'span':<32} {'count':>8} {'total ms':>10} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+        for name, s in sorted(snapshot["spans"].items(), key=lambda item: -item[1]["total_ms"]):
+            lines.append(f"{name:<32} {s['count']:>8,} {s['total_ms']:>10.1f} {s['p50_ms']:>9.3f} "
+                         f"{s['p95_ms']:>9.3f} {s['max_ms']:>9.3f}")
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"{name:<32} {value:>8,}")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path) -> int:
+        """Write the recorded spans in Chrome's trace event format; returns the number of events"""
+        with self.lock:
+            events = list(self.trace)
+            thread_names = dict(self.thread_names)
+        pid = os.getpid()
+        trace_events = [
+            {"name": name, "ph": "X", "pid": pid, "tid": tid,
+             "ts": (start - self.origin_ns) / 1000, "dur": (end - start) / 1000}
+            for name, start, end, tid in events
+        ]
+        trace_events += [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_names[tid]}}
+            for tid in {event[3] for event in events} if tid in thread_names
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+    def start_logging(self, schedule: Callable, cancel: Callable, path, interval_ms: int):
+        """Append the report to a log file every interval_ms while profiling is enabled"""
+        logger = get_logger(path).getChild("profiling")
+
+        def write_report():
+            self.log_job = schedule(interval_ms, write_report)
+            if self.enabled and self.histograms:
+                logger.info("Profile summary\n%s", self.report())
+
+        if self.log_job is not None:
+            cancel(self.log_job)
+        self.log_job = schedule(interval_ms, write_report)
+
+
+profiler = Profiler()
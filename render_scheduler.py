@@ -0,0 +1,47 @@
+from typing import Callable, Set
+
+
+class RenderScheduler:
+    """Coalesces UI refresh requests into at most one flush per frame
+
+    flush(dirty, display, full) receives the names of hunts changed since the
+    last flush, whether the main counter needs redrawing, and whether the
+    whole hunts panel has to be rebuilt (filter, sort or theme changes).
+    """
+
+    def __init__(self, root, flush: Callable[[Set[str], bool, bool], None], frame_ms: int = 33):
+        self.root = root
+        self.flush = flush
+        self.frame_ms = frame_ms
+        self.dirty: Set[str] = set()
+        self.display = False
+        self.full = False
+        self.job = None
+
+    def mark_dirty(self, *names: str):
+        self.dirty.update(names)
+        self._schedule()
+
+    def request_display(self):
+        self.display = True
+        self._schedule()
+
+    def request_full(self):
+        self.full = True
+        self._schedule()
+
+    def flush_now(self):
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+        self._flush()
+
+    def _schedule(self):
+        if self.job is None:
+            self.job = self.root.after(self.frame_ms, self._flush)
+
+    def _flush(self):
+        self.job = None
+        dirty, display, full = self.dirty, self.display, self.full
+        self.dirty, self.display, self.full = set(), False, False
+        if dirty or display or full:
+            self.flush(dirty, display, full)
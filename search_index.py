@@ -0,0 +1,54 @@
+from bisect import bisect_left
+from typing import Dict, List, Sequence
+
+
+class SearchIndex:
+    """Prefix and substring search over a fixed, ordered list of names"""
+
+    MAX_CACHED_QUERIES = 64
+
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+        self.lowered = [name.lower() for name in self.names]
+        # (lowered name, position) sorted for bisect prefix lookups
+        self.sorted_keys = sorted((low, i) for i, low in enumerate(self.lowered))
+        self.cache: Dict[str, List[int]] = {"": list(range(len(self.names)))}
+
+    def search(self, query: str) -> List[str]:
+        """Prefix matches first, then substring matches, each in the original order"""
+        query = query.lower()
+        if query not in self.cache:
+            base = self._longest_cached_prefix(query)
+            if base:
+                # The query only grew, so the answer is a subset of a result we already have
+                result = self._narrow(self.cache[base], query)
+            else:
+                result = self._lookup(query)
+
+            if len(self.cache) >= self.MAX_CACHED_QUERIES:
+                self.cache = {k: v for k, v in self.cache.items() if query.startswith(k)}
+            self.cache[query] = result
+
+        return [self.names[i] for i in self.cache[query]]
+
+    def _longest_cached_prefix(self, query):
+        for end in range(len(query) - 1, 0, -1):
+            if query[:end] in self.cache:
+                return query[:end]
+        return ""
+
+    def _lookup(self, query):
+        lo = bisect_left(self.sorted_keys, (query,))
+        hi = bisect_left(self.sorted_keys, (query + "\uffff",))
+        prefix = sorted(i for _, i in self.sorted_keys[lo:hi])
+        substring = [i for i, low in enumerate(self.lowered) if query in low and not low.startswith(query)]
+        return prefix + substring
+
+    def _narrow(self, candidates, query):
+        lowered = self.lowered
+        # A cached result lists its prefix matches first, and substring matches of the longer query can
+        # come from either group, so walk the candidates in original order like _lookup does
+        candidates = sorted(candidates)
+        prefix = [i for i in candidates if lowered[i].startswith(query)]
+        substring = [i for i in candidates if query in lowered[i] and not lowered[i].startswith(query)]
+        return prefix + substring
@@ -0,0 +1,99 @@
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import threading
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+MAGIC = b"SHCT"
+VERSION = 1
+# magic, version, slots, emulators, generation, seq, total
+HEADER = struct.Struct("<4sIIIQQQ")
+SEQ_OFFSET = 24
+COUNTER = struct.Struct("<Q")
+
+
+class CounterSnapshot(NamedTuple):
+    generation: int  # Changes whenever the segment is re-initialized
+    seq: int  # Number of completed writes
+    emulators: int
+    total: int
+    counters: Tuple[int, ...]
+
+
+class SharedCounters:
+    """Per-emulator encounter counters in a memory-mapped segment shared by melon.py and the tracker
+
+    Writers bump counters with plain memory stores, so there is no file I/O per
+    encounter. A seqlock guards the block: the writer makes seq odd, updates
+    the counters and total, then makes seq even again. A reader copies the
+    block between two reads of seq and keeps the copy only if seq was even and
+    unchanged and the counters add up to the total. On Linux the segment lives
+    in /dev/shm; on Windows it is a named mapping with no file behind it.
+    """
+
+    def __init__(self, name: str = "shiny_counters", slots: int = 32):
+        self.size = HEADER.size + slots * COUNTER.size
+        self.lock = threading.Lock()  # One writer at a time within a process
+        self.fd = None
+        if sys.platform == "win32":
+            self.map = mmap.mmap(-1, self.size, tagname=name)
+        else:
+            directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+            self.fd = os.open(os.path.join(directory, name), os.O_RDWR | os.O_CREAT, 0o600)
+            if os.fstat(self.fd).st_size < self.size:
+                os.ftruncate(self.fd, self.size)
+            self.map = mmap.mmap(self.fd, self.size)
+
+        magic, version, existing_slots = HEADER.unpack_from(self.map, 0)[:3]
+        if magic != MAGIC or version != VERSION or existing_slots != slots:
+            self._initialize(slots)
+        self.slots = slots
+
+    def _initialize(self, slots):
+        self.map[:self.size] = bytes(self.size)
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, slots, 0, random.getrandbits(63), 0, 0)
+
+    def add(self, slots: Iterable[int], delta: int = 1, emulators: Optional[int] = None):
+        """Add delta to each listed emulator's counter (and the total) as one consistent write
+
+        Emulators past the segment's slots share slot (emulator % slots), so a
+        batch never writes outside the segment and the total stays exact.
+        """
+        slots = [slot % self.slots for slot in slots]
+        with self.lock:
+            seq = COUNTER.unpack_from(self.map, SEQ_OFFSET)[0]
+            COUNTER.pack_into(self.map, SEQ_OFFSET, seq + 1)  # Odd: write in progress
+
+            magic, version, count, current_emulators, generation, _, total = HEADER.unpack_from(self.map, 0)
+            for slot in slots:
+                offset = HEADER.size + slot * COUNTER.size
+                COUNTER.pack_into(self.map, offset, COUNTER.unpack_from(self.map, offset)[0] + delta)
+                total += delta
+            HEADER.pack_into(self.map, 0, magic, version, count,
+                             current_emulators if emulators is None else emulators, generation, seq + 1, total)
+
+            COUNTER.pack_into(self.map, SEQ_OFFSET, seq + 2)
+
+    def read(self, retries: int = 100) -> Optional[CounterSnapshot]:
+        """A consistent copy of the block, or None if every attempt overlapped a write"""
+        for _ in range(retries):
+            seq = COUNTER.unpack_from(self.map, SEQ_OFFSET)[0]
+            if seq % 2:
+                continue
+            data = self.map[:self.size]
+            if COUNTER.unpack_from(self.map, SEQ_OFFSET)[0] != seq:
+                continue
+            _, _, slots, emulators, generation, copied_seq, total = HEADER.unpack_from(data, 0)
+            counters = struct.unpack_from(f"<{slots}Q", data, HEADER.size)
+            if copied_seq != seq or sum(counters) != total:
+                continue
+            return CounterSnapshot(generation, seq // 2, emulators, total, counters)
+        return None
+
+    def close(self):
+        self.map.close()
+        if self.fd is not None:
+            os.close(self.fd)
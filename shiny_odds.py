@@ -0,0 +1,159 @@
+"""Shiny odds lookup table and batch probability statistics
+
+Odds are modeled as a number of shiny rolls against the generation's base
+rate (1/8192 up to Gen 5, 1/4096 from Gen 6): the chance per encounter is
+1 - (1 - 1/base) ** rolls. Every (game, method, charm, chain) combination
+is computed once when the table is built; chains are clamped to the length
+at which a method stops improving.
+
+Chaining and event methods only count in the games listed for them in
+METHOD_GAMES; a hunt logged with one anywhere else gets that game's plain
+odds. Simplifications: DexNav search-level bonuses are not modeled, and
+the Poke Radar uses the Gen 4 chain formula in every game that has it.
+"""
+import math
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+_numpy = None  # Imported by the first batch so NumPy stays out of startup; False when not installed
+
+# Methods saved by older versions of the tracker, mapped to (method, charm)
+LEGACY_METHODS = {
+    "Shiny Charm": ("Random Encounter", True),
+    "Masuda + Charm": ("Masuda Method", True),
+    "Full Odds": ("Random Encounter", False),
+}
+
+# Chain length after which each chaining method no longer improves the odds
+CHAIN_CAPS = {
+    "Chain Fishing": 20,
+    "Poke Radar": 40,
+    "SOS Battles": 31,
+    "Outbreaks": 60,
+}
+
+DYNAMAX_ODDS = (300, 100)  # Fixed odds without / with the Shiny Charm
+
+# Games each method's bonus exists in
+METHOD_GAMES = {
+    "Chain Fishing": {"X/Y", "Omega Ruby/Alpha Sapphire"},
+    "Poke Radar": {"Diamond/Pearl/Platinum", "X/Y", "Brilliant Diamond/Shining Pearl"},
+    "SOS Battles": {"Sun/Moon", "Ultra Sun/Ultra Moon"},
+    "Dynamax Adventures": {"Sword/Shield"},
+    "Outbreaks": {"Legends: Arceus", "Scarlet/Violet"},
+}
+
+
+class HuntStats(NamedTuple):
+    probability: float  # Chance the shiny would have appeared by now
+    expected_remaining: float  # Mean encounters still to go (memoryless, so 1/p)
+    luck_percentile: float  # Percent of hunters who would still be hunting at this count
+
+
+def base_odds(generation: int) -> int:
+    return 8192 if generation <= 5 else 4096
+
+
+def rolls_for(generation: int, method: str, charm: bool, chain: int, game: Optional[str] = None) -> float:
+    """Number of shiny rolls per encounter for one combination"""
+    rolls = 1
+    if charm and generation >= 5:
+        rolls += 2
+    if method in METHOD_GAMES and game not in METHOD_GAMES[method]:
+        return rolls
+
+    if method == "Masuda Method" and generation >= 4:
+        rolls += 4 if generation == 4 else 5
+    elif method == "Chain Fishing":
+        rolls += 2 * chain
+    elif method == "SOS Battles":
+        rolls += 0 if chain <= 10 else 4 if chain <= 20 else 8 if chain <= 30 else 12
+    elif method == "Outbreaks" and generation >= 9:
+        rolls += 0 if chain < 30 else 1 if chain < 60 else 2
+    elif method == "Outbreaks":
+        rolls += 25  # Legends: Arceus massive mass outbreaks
+    return rolls
+
+
+def chance_per_encounter(generation: int, method: str, charm: bool, chain: int,
+                         game: Optional[str] = None) -> float:
+    available = game in METHOD_GAMES.get(method, ())
+    if method == "Dynamax Adventures" and available:
+        return 1 / DYNAMAX_ODDS[1 if charm else 0]
+    if method == "Poke Radar" and available and chain > 0:
+        # Gen 4 chain formula: ceil(65535 / (8200 - 200 * chain)) shiny values out of 65536
+        radar = math.ceil(65535 / (8200 - 200 * chain)) / 65536
+        return max(radar, 1 - (1 - 1 / base_odds(generation)) ** rolls_for(generation, method, charm, 0))
+    base = base_odds(generation)
+    return 1 - (1 - 1 / base) ** rolls_for(generation, method, charm, chain, game)
+
+
+class OddsTable:
+    """Precomputed chance per encounter for every (game, method, charm, chain) combination"""
+
+    def __init__(self, games: Dict[str, int], methods: Iterable[str]):
+        self.games = dict(games)
+        self.table: Dict[Tuple[str, str, bool, int], float] = {}
+        for game, generation in self.games.items():
+            for method in methods:
+                for charm in (False, True):
+                    for chain in range(CHAIN_CAPS.get(method, 0) + 1):
+                        self.table[(game, method, charm, chain)] = chance_per_encounter(
+                            generation, method, charm, chain, game)
+
+    def chance(self, game, method, charm: bool = False, chain: int = 0) -> float:
+        method, charm = LEGACY_METHODS.get(method, (method, charm))
+        key = (game, method, bool(charm), max(0, min(chain or 0, CHAIN_CAPS.get(method, 0))))
+        chance = self.table.get(key)
+        if chance is None:
+            # Unknown game or method: full odds for the game's generation (Gen 9 if unknown)
+            chance = chance_per_encounter(self.games.get(game, 9), "Random Encounter", bool(charm), 0)
+        return chance
+
+    def chance_for(self, data) -> float:
+        return self.chance(data.game, data.method, getattr(data, "charm", False), getattr(data, "chain", 0))
+
+    def odds_for(self, data) -> int:
+        """Odds as the "1 in N" shown in the UI"""
+        return round(1 / self.chance_for(data))
+
+    def stats(self, encounters: int, chance: float) -> HuntStats:
+        return batch_stats([encounters], [chance])[0]
+
+
+def numpy_module():
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def batch_stats(encounters: Sequence[int], chances: Sequence[float]) -> List[HuntStats]:
+    """Probability, expected remaining encounters and luck percentile for many hunts at once
+
+    Uses log1p/expm1 so the result stays accurate for tiny chances and very
+    large encounter counts, where (1 - p) ** n loses precision. Runs as one
+    vectorized NumPy call when NumPy is installed.
+    """
+    np = numpy_module()
+    if np is not None:
+        n = np.asarray(encounters, dtype=np.float64)
+        p = np.asarray(chances, dtype=np.float64)
+        log_miss = n * np.log1p(-p)
+        probability = -np.expm1(log_miss)
+        return [HuntStats(*row) for row in zip(probability.tolist(), (1 / p).tolist(),
+                                              (np.exp(log_miss) * 100).tolist())]
+
+    result = []
+    for n, p in zip(encounters, chances):
+        log_miss = n * math.log1p(-p)
+        result.append(HuntStats(-math.expm1(log_miss), 1 / p, math.exp(log_miss) * 100))
+    return result
+
+
+def encounters_for_probability(chance: float, target: float) -> int:
+    """Total encounters after which the cumulative shiny chance reaches target"""
+    return math.ceil(math.log1p(-target) / math.log1p(-chance))
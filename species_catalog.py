@@ -0,0 +1,102 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional
+
+from pokeapi_client import PokeAPIClient
+
+
+class Species(NamedTuple):
+    name: str
+    dex: int
+    generation: int
+
+
+class SpeciesCatalog:
+    """On-disk list of every species with its dex number and generation"""
+
+    def __init__(self, path: Path, client: PokeAPIClient, ttl: float, max_generation: int = 9):
+        self.path = Path(path)
+        self.client = client
+        self.ttl = ttl
+        self.max_generation = max_generation
+        self.species: List[Species] = []
+        self.built_at = 0.0
+        self.version = 0  # Bumped whenever the species list is replaced
+        self.refreshing = False
+        self.last_error: Optional[str] = None
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.species = [Species(*entry) for entry in data.get("species", [])]
+                self.built_at = data.get("built_at", 0.0)
+                self.version += 1
+        except Exception as e:
+            print(f"Error loading species catalog: {e}")
+
+    def is_stale(self) -> bool:
+        return not self.species or time.time() - self.built_at > self.ttl
+
+    def query(self, max_generation: Optional[int] = None, generation: Optional[int] = None,
+              order: str = "name") -> List[Species]:
+        species = self.species
+        if generation is not None:
+            species = [s for s in species if s.generation == generation]
+        elif max_generation is not None:
+            species = [s for s in species if s.generation <= max_generation]
+
+        if order == "dex":
+            return sorted(species, key=lambda s: s.dex)
+        return sorted(species, key=lambda s: s.name)
+
+    def refresh_async(self, force: bool = False, on_done: Optional[Callable[[bool], None]] = None):
+        """Rebuild the catalog on a background thread when it is missing or past its TTL"""
+        with self.lock:
+            if self.refreshing or not (force or self.is_stale()):
+                return
+            self.refreshing = True
+
+        def worker():
+            ok = False
+            try:
+                self.refresh()
+                ok = True
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Error refreshing species catalog: {e}")
+            finally:
+                self.refreshing = False
+            if on_done:
+                on_done(ok)
+
+        threading.Thread(target=worker, name="species-catalog", daemon=True).start()
+
+    def refresh(self):
+        species = []
+        for gen in range(1, self.max_generation + 1):
+            data = self.client.get_json(f"generation/{gen}")
+            for entry in data['pokemon_species']:
+                dex = int(entry['url'].rstrip('/').split('/')[-1])
+                species.append(Species(entry['name'], dex, gen))
+
+        species.sort(key=lambda s: s.dex)
+        built_at = time.time()
+        self.save(species, built_at)
+        # Swap in one assignment so readers on the Tk thread never see a partial list
+        self.species = species
+        self.built_at = built_at
+        self.version += 1
+        self.last_error = None
+
+    def save(self, species: List[Species], built_at: float):
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"built_at": built_at, "species": [list(s) for s in species]}, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,106 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+from PIL import Image
+
+
+class SpriteCache:
+    """Decoded sprites keyed by (species, size) with LRU eviction under a byte budget"""
+
+    def __init__(self, cache_dir: Path, sizes: Sequence[Tuple[int, int]], max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        # Every species is pre-generated at these sizes, largest first so it can seed the rest
+        self.sizes = sorted((tuple(s) for s in sizes), key=lambda s: s[0] * s[1], reverse=True)
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Tuple[str, Tuple[int, int]], Image.Image]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # Shared between the Tk thread and the sprite loader workers
+        self.lock = threading.RLock()
+
+    def path_for(self, species: str, size) -> Path:
+        return self.cache_dir / f"{species}_{size[0]}x{size[1]}.png"
+
+    def peek(self, species: str, size) -> Optional[Image.Image]:
+        """Memory-only lookup that never touches the disk"""
+        key = (species, tuple(size))
+        with self.lock:
+            img = self.entries.get(key)
+            if img is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            return img
+
+    def get(self, species: str, size) -> Optional[Image.Image]:
+        """Memory first, then the pre-generated PNG, then derive it from a larger cached size"""
+        img = self.peek(species, size)
+        if img is not None:
+            return img
+        with self.lock:
+            self.misses += 1
+
+        path = self.path_for(species, size)
+        if path.exists():
+            img = Image.open(path)
+            img.load()
+            self.put(species, size, img)
+            return img
+
+        source = self._largest_on_disk(species)
+        if source is None:
+            return None
+        self.add_source(species, source)
+        return self.get(species, size)
+
+    def add_source(self, species: str, source: Image.Image):
+        """Generate and persist every configured size from a freshly fetched sprite"""
+        for size in self.sizes:
+            path = self.path_for(species, size)
+            if source.size == size:
+                img = source
+            else:
+                img = source.resize(size, Image.Resampling.LANCZOS)
+            if not path.exists():
+                self._save_atomic(img, path)
+            self.put(species, size, img)
+
+    def put(self, species: str, size, img: Image.Image):
+        key = (species, tuple(size))
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= self._image_bytes(old)
+            self.entries[key] = img
+            self.total_bytes += self._image_bytes(img)
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= self._image_bytes(evicted)
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {"entries": len(self.entries), "bytes": self.total_bytes, "hits": self.hits, "misses": self.misses}
+
+    @staticmethod
+    def _save_atomic(img, path):
+        # Workers loading the same species at once each write their own temp file, and a reader
+        # only ever opens a complete PNG, like write_json_atomic does for the data file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        img.save(tmp_path, format="PNG")
+        os.replace(tmp_path, path)
+
+    def _largest_on_disk(self, species):
+        for size in self.sizes:
+            path = self.path_for(species, size)
+            if path.exists():
+                img = Image.open(path)
+                img.load()
+                return img
+        return None
+
+    @staticmethod
+    def _image_bytes(img):
+        return img.width * img.height * len(img.getbands())
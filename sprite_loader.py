@@ -0,0 +1,113 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from pokeapi_client import PokeAPIClient
+from profiling import profiler
+from sprite_cache import SpriteCache
+
+
+class SpriteLoader:
+    """Fetches and decodes sprites on worker threads, delivering them on the Tk thread"""
+
+    DEFAULT_SPECIES = "default"
+
+    def __init__(self, root, cache: SpriteCache, client: PokeAPIClient, default_sprite_url: str,
+                 max_workers: int = 4, poll_ms: int = 30):
+        self.root = root
+        self.cache = cache
+        self.client = client
+        self.default_sprite_url = default_sprite_url
+        self.poll_ms = poll_ms
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sprite-loader")
+        self.results = queue.Queue()
+        # (name, size) -> callbacks waiting on that sprite, only touched from the Tk thread
+        self.in_flight: Dict[Tuple[str, Tuple[int, int]], List[Callable]] = {}
+        self.placeholders = {}
+        self.poll_job = None
+
+    def placeholder(self, size):
+        size = tuple(size)
+        if size not in self.placeholders:
+            self.placeholders[size] = Image.new("RGBA", size, (0, 0, 0, 0))
+        return self.placeholders[size]
+
+    def request(self, name: str, size, callback: Callable[[Optional[Image.Image], Optional[Path]], None]):
+        """Queue a sprite load; duplicate requests for the same name and size share one fetch"""
+        key = (name.lower(), tuple(size))
+        if key in self.in_flight:
+            self.in_flight[key].append(callback)
+            return
+
+        self.in_flight[key] = [callback]
+        self.executor.submit(self._load, key)
+        self._schedule_poll()
+
+    def shutdown(self):
+        if self.poll_job:
+            self.root.after_cancel(self.poll_job)
+            self.poll_job = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @profiler.timed("sprites.load")
+    def _load(self, key):
+        name, size = key
+        img, cache_file = None, None
+        try:
+            img, cache_file = self._fetch_sprite(name, size)
+        except Exception as e:
+            print(f"Error loading image: {e}")
+            try:
+                img = self._fetch_default(size)
+            except Exception as e:
+                print(f"Error loading default sprite: {e}")
+        self.results.put((key, img, cache_file))
+
+    def _fetch_sprite(self, name, size):
+        # The cache decodes off the Tk thread and pre-generates every size on first download
+        img = self.cache.get(name, size)
+        if img is None:
+            profiler.count("sprites.downloads")
+            data = self.client.get_json(f"pokemon/{name}")
+            sprite_url = data['sprites']['front_shiny'] or data['sprites']['front_default']
+            self.cache.add_source(name, self._download(sprite_url))
+            img = self.cache.get(name, size)
+
+        return img, self.cache.path_for(name, size)
+
+    def _fetch_default(self, size):
+        img = self.cache.get(self.DEFAULT_SPECIES, size)
+        if img is None:
+            self.cache.add_source(self.DEFAULT_SPECIES, self._download(self.default_sprite_url))
+            img = self.cache.get(self.DEFAULT_SPECIES, size)
+        return img
+
+    def _download(self, url):
+        img = Image.open(BytesIO(self.client.get(url)))
+        img.load()
+        return img
+
+    def _schedule_poll(self):
+        if self.poll_job is None:
+            self.poll_job = self.root.after(self.poll_ms, self._drain_results)
+
+    def _drain_results(self):
+        self.poll_job = None
+        while True:
+            try:
+                key, img, cache_file = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            for callback in self.in_flight.pop(key, []):
+                try:
+                    callback(img, cache_file)
+                except Exception as e:
+                    print(f"Error delivering sprite {key[0]}: {e}")
+
+        if self.in_flight:
+            self._schedule_poll()
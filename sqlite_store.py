@@ -0,0 +1,214 @@
+import json
+import os
+import sqlite3
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from persistence import EncounterJournal, write_json_atomic
+
+HUNT_COLUMNS = (
+    "name", "encounters", "adjustment", "sprite_url", "last_updated", "status",
+    "found_date", "game", "method", "phase", "target", "charm", "chain"
+)
+# Columns added after the first release, created on databases that predate them
+ADDED_COLUMNS = {
+    "charm": "INTEGER NOT NULL DEFAULT 0",
+    "chain": "INTEGER NOT NULL DEFAULT 0",
+}
+SETTING_KEYS = ("active_hunts", "last_pokemon", "theme", "sort_by", "sort_order")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hunts (
+    name TEXT PRIMARY KEY,
+    encounters INTEGER NOT NULL DEFAULT 0,
+    adjustment INTEGER NOT NULL DEFAULT 1,
+    sprite_url TEXT,
+    last_updated TEXT,
+    status TEXT NOT NULL DEFAULT 'ACTIVE',
+    found_date TEXT,
+    game TEXT,
+    method TEXT,
+    phase INTEGER NOT NULL DEFAULT 1,
+    target TEXT,
+    charm INTEGER NOT NULL DEFAULT 0,
+    chain INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS notes (
+    hunt TEXT PRIMARY KEY REFERENCES hunts(name) ON DELETE CASCADE,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE VIEW IF NOT EXISTS phases AS
+    SELECT name, target, phase, encounters, found_date FROM hunts WHERE target IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_hunts_status ON hunts(status);
+CREATE INDEX IF NOT EXISTS idx_hunts_last_updated ON hunts(last_updated);
+CREATE INDEX IF NOT EXISTS idx_hunts_encounters ON hunts(encounters);
+CREATE INDEX IF NOT EXISTS idx_hunts_target ON hunts(target);
+"""
+
+
+class SQLiteStore:
+    """SQLite storage for hunts, phases and notes with indexed filter/sort queries
+
+    Works on plain dicts shaped like the JSON file's entries so the tracker can
+    switch between this and the JSON snapshot without changing its model.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        # WAL keeps single-row commits cheap and readers unblocked
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(hunts)")}
+        with self.conn:
+            for column, definition in ADDED_COLUMNS.items():
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE hunts ADD COLUMN {column} {definition}")
+
+    def load(self) -> Tuple[Dict[str, dict], dict]:
+        hunts = {}
+        rows = self.conn.execute(
+            "SELECT hunts.*, notes.body AS notes FROM hunts LEFT JOIN notes ON notes.hunt = hunts.name"
+        )
+        for row in rows:
+            hunt = dict(row)
+            hunt["charm"] = bool(hunt["charm"])
+            hunts[row["name"]] = hunt
+
+        settings = {}
+        for row in self.conn.execute("SELECT key, value FROM settings"):
+            settings[row["key"]] = json.loads(row["value"])
+        return hunts, settings
+
+    def upsert_hunt(self, record: dict):
+        """Write one hunt (and its notes) without touching any other row"""
+        with self.conn:
+            self._upsert(record)
+
+    def save_settings(self, settings: dict):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                [(key, json.dumps(settings.get(key))) for key in SETTING_KEYS]
+            )
+
+    def replace_all(self, hunts: Iterable[dict], settings: dict):
+        with self.conn:
+            self.conn.execute("DELETE FROM notes")
+            self.conn.execute("DELETE FROM hunts")
+            for record in hunts:
+                self._upsert(record)
+        self.save_settings(settings)
+
+    def query_hunts(self, statuses: Optional[Iterable[str]] = None, text: str = "",
+                    sort_by: str = "most_recent", descending: bool = True) -> List[str]:
+        """Names of hunts matching the filter, already in display order"""
+        sql = "SELECT hunts.name FROM hunts LEFT JOIN notes ON notes.hunt = hunts.name"
+        clauses, params = [], []
+        if statuses is not None:
+            statuses = list(statuses)
+            clauses.append(f"hunts.status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if text:
+            # Plain substring match like the n-gram index; LIKE would treat % and _ in the text as wildcards
+            clauses.append("(instr(lower(notes.body), ?) > 0 OR instr(lower(hunts.target), ?) > 0"
+                           " OR instr(lower(hunts.name), ?) > 0)")
+            params.extend([text.lower()] * 3)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+
+        # Timestamps are stored as '%Y-%m-%d %H:%M:%S', which sorts chronologically as text
+        column = "hunts.last_updated" if sort_by == "most_recent" else "hunts.encounters"
+        direction = "DESC" if descending else "ASC"
+        # Ties broken by name, matching the in-memory sorted indexes the panel repositions with
+        sql += f" ORDER BY {column} {direction}, hunts.name {direction}"
+        return [row[0] for row in self.conn.execute(sql, params)]
+
+    def close(self):
+        self.conn.close()
+
+    def _upsert(self, record):
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO hunts ({', '.join(HUNT_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(HUNT_COLUMNS))})",
+            [record.get(column) for column in HUNT_COLUMNS]
+        )
+        if record.get("notes") is not None:
+            self.conn.execute("INSERT OR REPLACE INTO notes (hunt, body) VALUES (?, ?)",
+                              (record["name"], record["notes"]))
+        else:
+            self.conn.execute("DELETE FROM notes WHERE hunt = ?", (record["name"],))
+
+
+def migrate_json_to_sqlite(json_path, db_path, journal_path=None):
+    """One-shot import of the JSON data file, plus its journal tail, into a fresh SQLite database"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    pokemon = dict(data.get("pokemon", {}))
+    if journal_path:
+        # Changes after the last snapshot (all of them, after a crash) are only in the journal
+        for record in EncounterJournal(journal_path).read(after_seq=data.get("journal_seq", 0)):
+            name, fields = record.get("hunt"), record.get("fields") or {}
+            if record.get("op") == "create":
+                pokemon[name] = dict(fields)
+            elif name in pokemon:
+                pokemon[name] = {**pokemon[name], **fields}
+
+    hunts = []
+    for name, entry in pokemon.items():
+        entry = dict(entry)
+        entry.setdefault("name", name)
+        entry.setdefault("phase", 1)
+        entry.setdefault("target", None)
+        hunts.append(entry)
+
+    store = SQLiteStore(db_path)
+    try:
+        store.replace_all(hunts, data)
+    finally:
+        store.close()
+    return len(hunts)
+
+
+def export_sqlite_to_json(db_path, json_path):
+    """Write the database back out in the JSON data file format to switch back"""
+    store = SQLiteStore(db_path)
+    try:
+        hunts, settings = store.load()
+    finally:
+        store.close()
+
+    data = {"pokemon": hunts}
+    for key in SETTING_KEYS:
+        data[key] = settings.get(key)
+    data["active_hunts"] = data["active_hunts"] or []
+    write_json_atomic(json_path, data)
+    return len(hunts)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] not in ("migrate", "export"):
+        print("Usage: python sqlite_store.py migrate <data.json> <data.db>\n"
+              "       python sqlite_store.py export <data.db> <data.json>")
+        sys.exit(1)
+
+    command, source, destination = sys.argv[1:]
+    if command == "migrate":
+        from tracker import JOURNAL_FILE
+
+        if os.path.exists(destination):
+            print(f"{destination} already exists; remove it first to re-import")
+            sys.exit(1)
+        journal = os.path.join(os.path.dirname(os.path.abspath(source)), JOURNAL_FILE)
+        count = migrate_json_to_sqlite(source, destination, journal)
+    else:
+        count = export_sqlite_to_json(source, destination)
+    print(f"Copied {count} hunts from {source} to {destination}")
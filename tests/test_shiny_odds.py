@@ -0,0 +1,56 @@
+"""OddsTable entries for methods in the games that have them, and in the games that don't
+
+Run from the repository root:  python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from shiny_odds import OddsTable  # noqa: E402
+from tracker import TrackerConfig  # noqa: E402
+
+
+class MethodAvailabilityTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = OddsTable(TrackerConfig.POKEMON_GAMES, TrackerConfig.HUNT_METHODS)
+
+    def odds(self, game, method, charm=False, chain=0):
+        return round(1 / self.table.chance(game, method, charm, chain))
+
+    def plain(self, game, charm=False):
+        return self.odds(game, "Random Encounter", charm)
+
+    def test_poke_radar(self):
+        for game in ("Diamond/Pearl/Platinum", "X/Y", "Brilliant Diamond/Shining Pearl"):
+            self.assertEqual(self.odds(game, "Poke Radar", chain=40), 200, game)
+        for game in ("HeartGold/SoulSilver", "Omega Ruby/Alpha Sapphire", "Sword/Shield", "Legends: Arceus"):
+            self.assertEqual(self.odds(game, "Poke Radar", chain=40), self.plain(game), game)
+
+    def test_dynamax_adventures(self):
+        self.assertEqual(self.odds("Sword/Shield", "Dynamax Adventures"), 300)
+        self.assertEqual(self.odds("Sword/Shield", "Dynamax Adventures", charm=True), 100)
+        for game in ("Brilliant Diamond/Shining Pearl", "Legends: Arceus", "Scarlet/Violet"):
+            self.assertEqual(self.odds(game, "Dynamax Adventures"), self.plain(game), game)
+
+    def test_chain_fishing(self):
+        for game in ("X/Y", "Omega Ruby/Alpha Sapphire"):
+            self.assertEqual(self.odds(game, "Chain Fishing", chain=20), 100, game)
+        for game in ("Sun/Moon", "Sword/Shield", "Brilliant Diamond/Shining Pearl", "Scarlet/Violet"):
+            self.assertEqual(self.odds(game, "Chain Fishing", chain=20), self.plain(game), game)
+
+    def test_outbreaks(self):
+        self.assertEqual(self.odds("Legends: Arceus", "Outbreaks"), 158)
+        self.assertEqual(self.odds("Scarlet/Violet", "Outbreaks", charm=True, chain=60), 820)
+        for game in ("Sword/Shield", "Brilliant Diamond/Shining Pearl"):
+            self.assertEqual(self.odds(game, "Outbreaks", charm=True), self.plain(game, charm=True), game)
+
+    def test_sos_battles(self):
+        self.assertEqual(self.odds("Ultra Sun/Ultra Moon", "SOS Battles", chain=31), 316)
+        self.assertEqual(self.odds("Sword/Shield", "SOS Battles", chain=31), self.plain("Sword/Shield"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""ShinyTracker changes on named hunts, against a data file in a temp directory
+
+Run from the repository root:  python -m unittest discover tests
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from event_loop import EventLoop  # noqa: E402
+from models import SCHEMA_VERSION  # noqa: E402
+from tracker import DATA_FILE, JOURNAL_FILE, ShinyTracker, TrackerConfig  # noqa: E402
+from test_tracker_cli import hunt  # noqa: E402
+
+
+class NamedHuntTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.data_file = os.path.join(directory.name, DATA_FILE)
+        self.journal_file = os.path.join(directory.name, JOURNAL_FILE)
+        with open(self.data_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "schema_version": SCHEMA_VERSION,
+                "pokemon": {
+                    "snubbull": hunt("snubbull", 4631, 24, "2024-05-02 10:00:00"),
+                    "zubat": hunt("zubat", 10, 1, "2024-05-01 10:00:00"),
+                },
+                "active_hunts": ["snubbull", "zubat"],
+            }, f)
+        self.tracker = self.open()
+        self.tracker.select_hunt("snubbull")
+
+    def open(self):
+        loop = EventLoop()  # Never run: close() flushes the saver
+        tracker = ShinyTracker(loop.after, loop.after_cancel, TrackerConfig,
+                               data_file=self.data_file, journal_file=self.journal_file)
+        tracker.load()
+        return tracker
+
+    def reload(self):
+        self.tracker.close()
+        tracker = self.open()
+        self.addCleanup(tracker.close, save=False)
+        return tracker.saved_data.pokemon
+
+    def test_add_encounters_keeps_the_selection(self):
+        self.assertTrue(self.tracker.add_encounters("zubat", 5, source="api"))
+        self.assertEqual(self.tracker.current_pokemon, "snubbull")
+        self.assertEqual(self.tracker.current_number, 4631)
+        self.assertEqual(self.tracker.saved_data.active_hunts, ["snubbull", "zubat"])
+        self.assertEqual(self.reload()["zubat"].encounters, 15)
+
+    def test_add_encounters_on_an_unknown_hunt(self):
+        self.assertFalse(self.tracker.add_encounters("ghost", 5))
+        self.assertEqual(self.reload()["snubbull"].encounters, 4631)
+
+    def test_phase_on_a_named_hunt(self):
+        new_name = self.tracker.phase("geodude", "zubat")
+        self.assertEqual(new_name, "geodude phase 1")
+        self.assertEqual(self.tracker.current_pokemon, "snubbull")
+        hunts = self.reload()
+        self.assertEqual(hunts["geodude phase 1"].encounters, 10)
+        self.assertEqual(hunts["geodude phase 1"].target, "zubat")
+        self.assertEqual(hunts["zubat"].phase, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Round trips through tracker_cli.py against a data file in a temp directory
+
+Run from the repository root:  python -m unittest discover tests
+"""
+import contextlib
+import io
+import json
+import os
+import queue
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import tracker_cli  # noqa: E402
+from encounter_protocol import EncounterServer  # noqa: E402
+from models import SCHEMA_VERSION  # noqa: E402
+from tracker import DATA_FILE, TrackerConfig  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def hunt(name, encounters, adjustment, last_updated, status="ACTIVE"):
+    return {
+        "name": name, "encounters": encounters, "adjustment": adjustment, "sprite_url": None,
+        "last_updated": last_updated, "status": status, "found_date": None, "game": "Scarlet/Violet",
+        "notes": None, "method": "Random Encounter", "phase": 1, "target": None, "charm": False, "chain": 0,
+    }
+
+
+class IncrementTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.data_file = os.path.join(self.directory.name, DATA_FILE)
+        with open(self.data_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "schema_version": SCHEMA_VERSION,
+                "pokemon": {
+                    "snubbull": hunt("snubbull", 4631, 24, "2024-05-02 10:00:00"),
+                    "zubat": hunt("zubat", 10, 1, "2024-05-01 10:00:00"),
+                },
+                "active_hunts": ["snubbull", "zubat"],
+                "last_pokemon": "snubbull",
+            }, f)
+        # Nothing listens here unless a test starts a server, so increment takes the offline path
+        port_patch = mock.patch.object(TrackerConfig, "TRIGGER_PORT", free_port())
+        port_patch.start()
+        self.addCleanup(port_patch.stop)
+
+    def run_cli(self, *args):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            tracker_cli.main(["--dir", self.directory.name, *args])
+        return out.getvalue()
+
+    def saved(self):
+        with open(self.data_file, "r", encoding="utf-8") as f:
+            return json.load(f)["pokemon"]
+
+    def test_increment_keeps_the_hunts_adjustment(self):
+        self.run_cli("increment", "snubbull")
+        snubbull = self.saved()["snubbull"]
+        self.assertEqual(snubbull["encounters"], 4632)
+        self.assertEqual(snubbull["adjustment"], 24)
+
+    def test_increment_by_counts_without_changing_the_adjustment(self):
+        self.run_cli("increment", "zubat", "--by", "5")
+        zubat = self.saved()["zubat"]
+        self.assertEqual(zubat["encounters"], 15)
+        self.assertEqual(zubat["adjustment"], 1)
+
+    def test_increment_defaults_to_the_most_recent_hunt(self):
+        self.assertEqual(self.run_cli("increment").strip(), "snubbull: 4,632")
+        self.assertEqual(self.saved()["zubat"]["encounters"], 10)
+
+    def test_forwarded_increment_names_the_most_recent_hunt(self):
+        # A stand-in for a running tracker: acks every message and keeps it for inspection
+        events = queue.Queue()
+        server = EncounterServer(TrackerConfig.TRIGGER_HOST, TrackerConfig.TRIGGER_PORT, events)
+        server.start()
+        self.addCleanup(server.stop)
+        received = []
+
+        def ack_one():
+            client_id, message = events.get(timeout=5)
+            received.append(message)
+            server.applied(client_id, message["seq"])
+
+        acker = threading.Thread(target=ack_one)
+        acker.start()
+        output = self.run_cli("increment", "--by", "2")
+        acker.join()
+        self.assertEqual(output.strip(), "Sent +2 to snubbull on the running tracker")
+        self.assertEqual((received[0]["hunt"], received[0]["delta"]), ("snubbull", 2))
+        # Left for the running tracker to record
+        self.assertEqual(self.saved()["snubbull"]["encounters"], 4631)
+
+
+if __name__ == "__main__":
+    unittest.main()
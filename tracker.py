@@ -0,0 +1,542 @@
+"""GUI-free shiny hunt tracker: counting, phases, odds, rates and persistence
+
+ShinyTracker holds everything the Tk window used to keep in widgets and ctk
+variables, so the same logic runs under the Tk view, the headless daemon in
+tracker_cli.py and benchmarks. It never touches a display: timers go through
+the schedule/cancel callables of whichever loop hosts it (root.after in the
+Tk app, event_loop.EventLoop headless), and views learn about changes through
+subscribe(). All methods must be called from that loop's thread.
+"""
+import json
+import os
+from dataclasses import asdict
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from encounter_rate import EncounterRates, eta_hours, format_duration
+from hunt_indexes import HuntIndexes
+from models import SCHEMA_VERSION, TIMESTAMP_FORMAT, AppData, HuntRecords, PokemonData, migrate_data
+from persistence import EncounterJournal, WriteBehindSaver
+from profiling import profiler
+from shiny_odds import HuntStats, OddsTable, batch_stats, encounters_for_probability
+from sqlite_store import SQLiteStore
+
+DATA_FILE = "shiny_counter_data.json"
+JOURNAL_FILE = "shiny_counter_journal.jsonl"
+DB_FILE = "shiny_counter_data.db"
+
+STATUS_CYCLE = {
+    "ACTIVE": "COMPLETE",
+    "COMPLETE": "PAUSED",
+    "PAUSED": "ACTIVE",
+    "PHASE": "COMPLETE"
+}
+
+
+class TrackerConfig:
+    STORAGE_BACKEND = "json"  # "json" snapshot + journal, or "sqlite" (imports the JSON file on first run)
+    SAVE_DELAY_MS = 1000  # Changes within this window share one write of the data file
+    SNAPSHOT_INTERVAL_MS = 60000  # Journaled changes are compacted into the data file this often
+    JOURNAL_FSYNC = False  # fsync every journal append (survives power loss, costs a disk flush per trigger)
+    RATE_WINDOWS = (5 * 60, 60 * 60)  # Sliding windows (seconds) for encounters/hour; the last drives ETAs
+    RATE_BUFFER_SIZE = 4096  # Increment timestamps kept per hunt
+    FILE_WATCHER = "auto"  # "auto"/"inotify" use inotify on Linux when available, "poll" always polls
+    FILE_POLL_MS = 500  # Polling interval of the fallback watcher
+    WATCH_DRAIN_MS = 30  # How often the host loop picks up watcher and socket events
+    TRIGGER_SERVER = True  # Accept encounter messages from melon.py over localhost TCP
+    TRIGGER_HOST = "127.0.0.1"
+    TRIGGER_PORT = 47800
+    SHARED_COUNTERS = True  # Read encounter counters melon.py bumps in shared memory
+    SHARED_COUNTERS_NAME = "shiny_counters"
+    SHARED_COUNTER_SLOTS = 32
+    API_SERVER = True  # Serve the HTTP + WebSocket API for overlays and dashboards on localhost
+    API_HOST = "127.0.0.1"
+    API_PORT = 47801
+    API_ALLOWED_ORIGINS = ()  # Web origins besides the API's own whose pages may call it, e.g. "http://localhost:8080"
+    API_PUSH_MS = 100  # Count changes are pushed to WebSocket subscribers at most this often
+    API_CLIENT_BUFFER = 256 * 1024  # Unsent bytes after which a slow subscriber is disconnected
+    PROFILING = False  # Record spans and counters from startup (also toggled from the Debug menu)
+    PROFILE_LOG_MS = 10 * 60 * 1000  # How often the profile summary is appended to PROFILE_LOG_FILE
+    PROFILE_LOG_FILE = "shiny_hunter.log"
+
+    POKEMON_GAMES = {
+        "Red/Blue/Yellow": 1,
+        "Gold/Silver/Crystal": 2,
+        "Ruby/Sapphire/Emerald": 3,
+        "FireRed/LeafGreen": 3,
+        "Diamond/Pearl/Platinum": 4,
+        "HeartGold/SoulSilver": 4,
+        "Black/White": 5,
+        "Black 2/White 2": 5,
+        "X/Y": 6,
+        "Omega Ruby/Alpha Sapphire": 6,
+        "Sun/Moon": 7,
+        "Ultra Sun/Ultra Moon": 7,
+        "Sword/Shield": 8,
+        "Brilliant Diamond/Shining Pearl": 8,
+        "Legends: Arceus": 8,
+        "Scarlet/Violet": 9
+    }
+
+    HUNT_METHODS = [
+        "Random Encounter",
+        "Soft Reset",
+        "Masuda Method",
+        "Chain Fishing",
+        "Poke Radar",
+        "DexNav",
+        "SOS Battles",
+        "Dynamax Adventures",
+        "Outbreaks",
+        "Other"
+    ]
+
+
+def now_timestamp() -> str:
+    return datetime.now().strftime(TIMESTAMP_FORMAT)
+
+
+class ShinyTracker:
+    """The hunts, the selected hunt and its controls, and everything that changes or saves them
+
+    Listeners registered with subscribe() are called as listener(change, names)
+    after every change: change is "selected" (another hunt became current),
+    "counter" (the current count changed), "hunts" (only the named hunts'
+    data changed) or "amount" (the adjust-by amount changed); names are the
+    hunts whose saved data changed.
+    """
+
+    def __init__(self, schedule: Callable, cancel: Callable, config=TrackerConfig,
+                 data_file=DATA_FILE, journal_file=JOURNAL_FILE, db_file=DB_FILE):
+        self.config = config
+        self.storage_file = data_file
+        self.db_file = db_file
+        self.saved_data = AppData(pokemon={})
+        self.current_pokemon = ""
+        self.current_number = 0
+        self.default_adjustment = 1
+        # Settings the next change is recorded with; views mirror these in their controls
+        self.game = ""
+        self.method = config.HUNT_METHODS[0]
+        self.charm = False
+        self.chain = 0
+        self.amount = 1
+        # Only an amount that was actually set (adjust-by entry, emulator count) is saved as the hunt's adjustment
+        self.amount_set = False
+        self.odds = OddsTable(config.POKEMON_GAMES, config.HUNT_METHODS)
+        self.rates = EncounterRates(config.RATE_WINDOWS, config.RATE_BUFFER_SIZE)
+        self.hunt_indexes = HuntIndexes()
+        self.store = None  # SQLiteStore when config.STORAGE_BACKEND is "sqlite"
+        self.last_error: Optional[str] = None
+        # Nothing is written until a load has succeeded, so closing early can't blank the data file
+        self.loaded = False
+        # Settings as of the last save, so closing only writes when they changed
+        self.saved_settings: Optional[dict] = None
+        self.listeners: List[Callable[[str, Iterable[str]], None]] = []
+        self.journal = EncounterJournal(journal_file, fsync=config.JOURNAL_FSYNC)
+        self.saver = WriteBehindSaver(self.storage_file, self.build_save_snapshot,
+                                      schedule, cancel, window_ms=config.SAVE_DELAY_MS,
+                                      on_written=lambda snapshot: self.journal.compact(snapshot["journal_seq"]))
+
+    def subscribe(self, listener: Callable[[str, Iterable[str]], None]):
+        self.listeners.append(listener)
+
+    def notify(self, change: str, *names: str):
+        for listener in self.listeners:
+            listener(change, names)
+
+    # Loading and saving
+
+    @profiler.timed("tracker.load")
+    def load(self):
+        """Read the saved hunts; on failure last_error says why and the tracker starts empty"""
+        self.last_error = None
+        if self.config.STORAGE_BACKEND == "sqlite":
+            self.load_sqlite_data()
+        else:
+            self.load_json_data()
+        # Read through views so loading hydrates no hunt; note text is only indexed once a filter needs it
+        hunts = self.saved_data.pokemon
+        self.hunt_indexes.rebuild(hunts.peek_all(), text_source=hunts.peek_all)
+        self.loaded = self.last_error is None
+        self.saved_settings = self.build_settings()
+
+    def load_sqlite_data(self):
+        try:
+            first_run = not os.path.exists(self.db_file)
+            self.store = SQLiteStore(self.db_file)
+            if first_run:
+                # One-time import of the JSON snapshot plus any journal tail
+                self.load_json_data()
+                self.store.replace_all(list(self.saved_data.pokemon.to_json().values()), self.build_settings())
+                return
+
+            hunts, settings = self.store.load()
+            self.saved_data = AppData(
+                pokemon=HuntRecords(hunts),
+                active_hunts=settings.get('active_hunts') or [],
+                last_pokemon=settings.get('last_pokemon'),
+                theme=settings.get('theme') or 'dark',
+                sort_by=settings.get('sort_by') or 'most_recent',
+                sort_order=settings.get('sort_order') or 'descending'
+            )
+        except Exception as e:
+            self.fail_load(f"Could not load database: {e}")
+
+    def load_json_data(self):
+        snapshot_seq = 0
+        migrated = False
+        try:
+            if os.path.exists(self.storage_file):
+                with open(self.storage_file, 'r') as f:
+                    loaded_data = json.load(f)
+                if loaded_data.get('schema_version', 1) < SCHEMA_VERSION:
+                    # Checks and fills every entry once; the rewritten file skips this from then on
+                    loaded_data = migrate_data(loaded_data)
+                    migrated = True
+                snapshot_seq = loaded_data.get('journal_seq', 0)
+                self.saved_data = AppData(
+                    # Entries become PokemonData only when first looked up
+                    pokemon=HuntRecords(loaded_data.get('pokemon', {})),
+                    active_hunts=loaded_data.get('active_hunts', []),
+                    last_pokemon=loaded_data.get('last_pokemon'),
+                    theme=loaded_data.get('theme', 'dark'),
+                    sort_by=loaded_data.get('sort_by', 'most_recent'),
+                    sort_order=loaded_data.get('sort_order', 'descending')
+                )
+        except json.JSONDecodeError as e:
+            self.fail_load(f"Invalid JSON data: {e}")
+        except Exception as e:
+            self.fail_load(f"Could not load data: {e}")
+
+        self.replay_journal(snapshot_seq)
+        if migrated and not self.store:
+            self.saver.request()
+
+    def fail_load(self, message):
+        print(message)
+        self.last_error = message
+        self.saved_data = AppData(pokemon={})
+
+    def replay_journal(self, snapshot_seq):
+        # Re-apply changes recorded after the last snapshot, e.g. when the app crashed before compaction
+        records = self.journal.read(after_seq=snapshot_seq)
+        self.journal.seq = max([snapshot_seq] + [r["seq"] for r in records])
+        for record in records:
+            try:
+                name, fields = record["hunt"], record["fields"]
+                if record["op"] == "create":
+                    self.saved_data.pokemon[name] = PokemonData(**fields)
+                elif name in self.saved_data.pokemon:
+                    for field, value in fields.items():
+                        setattr(self.saved_data.pokemon[name], field, value)
+            except Exception as e:
+                print(f"Skipping invalid journal record {record.get('seq')}: {e}")
+
+        if records:
+            # Fold the replayed tail into a fresh snapshot
+            self.saver.request()
+
+    def record_change(self, op, pokemon_name, fields, source="ui", delta=None):
+        self.hunt_indexes.update(self.saved_data.pokemon[pokemon_name])
+        if self.store:
+            # SQLite updates just this hunt's row
+            self.store.upsert_hunt(asdict(self.saved_data.pokemon[pokemon_name]))
+            return
+        # Journaled right away so a crash loses nothing; the JSON snapshot catches up later
+        self.journal.append(op, pokemon_name, fields, source=source, delta=delta)
+        self.saver.request(self.config.SNAPSHOT_INTERVAL_MS)
+
+    def save_settings(self):
+        if not self.loaded:
+            return
+        if self.store:
+            self.saved_settings = self.build_settings()
+            self.store.save_settings(self.saved_settings)
+            return
+        # Coalesced and written on the write-behind thread; see build_save_snapshot
+        self.saver.request()
+
+    def build_settings(self):
+        return {
+            # Copied so the writer thread never sees a list the UI is still changing
+            "active_hunts": list(self.saved_data.active_hunts),
+            "last_pokemon": self.saved_data.last_pokemon,
+            "theme": self.saved_data.theme,
+            "sort_by": self.saved_data.sort_by,
+            "sort_order": self.saved_data.sort_order
+        }
+
+    def build_save_snapshot(self):
+        if not self.loaded:
+            return None
+        self.saved_settings = self.build_settings()
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "pokemon": self.saved_data.pokemon.to_json(),
+            **self.saved_settings,
+            # Journal records up to here are contained in this snapshot
+            "journal_seq": self.journal.seq
+        }
+
+    def close(self, save=True):
+        """Save any changes and release the files; raises IOError if the final write failed
+
+        With save=False (read-only hosts like the CLI's list) nothing is written
+        and a pending save, such as a schema upgrade, is dropped.
+        """
+        if save:
+            if self.current_pokemon:
+                self.saved_data.last_pokemon = self.current_pokemon
+            if self.build_settings() != self.saved_settings:
+                self.save_settings()
+            if self.store and self.loaded and self.current_pokemon in self.saved_data.pokemon:
+                # Picks up fields that are not journaled, like a freshly cached sprite path
+                self.store.upsert_hunt(asdict(self.saved_data.pokemon[self.current_pokemon]))
+        if self.store:
+            self.store.close()
+        try:
+            if save:
+                # Always get pending changes onto disk before the host goes away
+                self.saver.close()
+            else:
+                self.saver.discard()
+        finally:
+            self.journal.close()
+
+    # Selecting and changing hunts
+
+    def select_hunt(self, pokemon_name):
+        pokemon_name = pokemon_name.lower()
+        self.current_pokemon = pokemon_name
+
+        # Update active hunts order
+        if pokemon_name in self.saved_data.active_hunts:
+            self.saved_data.active_hunts.remove(pokemon_name)
+        self.saved_data.active_hunts.insert(0, pokemon_name)
+
+        if self.current_pokemon in self.saved_data.pokemon:
+            data = self.saved_data.pokemon[self.current_pokemon]
+            self.current_number = data.encounters
+            self.default_adjustment = data.adjustment
+            if data.game:
+                self.game = data.game
+            if data.method:
+                self.method = data.method
+            self.charm = data.charm
+            self.chain = data.chain
+
+        self.notify("selected")
+
+    def select_most_recent_hunt(self):
+        """Select the most recently updated active hunt, else the hunt that was open last"""
+        # Answered from the indexes, so no hunt is hydrated to find it
+        active_hunts = self.hunt_indexes.status.members("ACTIVE")
+        if active_hunts:
+            self.select_hunt(max(active_hunts, key=self.hunt_indexes["most_recent"].entry_of.__getitem__))
+        elif self.saved_data.last_pokemon and self.saved_data.last_pokemon in self.saved_data.pokemon:
+            self.select_hunt(self.saved_data.last_pokemon)
+
+    def set_amount(self, amount: int, notify: bool = True):
+        """Set the adjust-by amount; notify=False for the control it was typed into"""
+        self.amount_set = True
+        if amount != self.amount:
+            self.amount = amount
+            if notify:
+                self.notify("amount")
+
+    @profiler.timed("tracker.adjust")
+    def adjust(self, action, amount: Optional[int] = None, source="ui") -> bool:
+        """Increase, decrease or reset the current hunt; False if there is no hunt to count on"""
+        if not self.current_pokemon:
+            if not self.saved_data.active_hunts:
+                return False
+            self.select_hunt(self.saved_data.active_hunts[0])
+
+        amount = self.amount if amount is None else amount
+        previous = self.current_number
+        if action == "increase":
+            self.current_number += amount
+        elif action == "decrease":
+            self.current_number = max(0, self.current_number - amount)
+        elif action == "reset":
+            self.current_number = 0
+
+        self.save_current(delta=self.current_number - previous, source=source)
+        if profiler.enabled:
+            profiler.count("encounters." + source, self.current_number - previous)
+        self.notify("counter", self.current_pokemon)
+        return True
+
+    def add_encounters(self, pokemon_name, delta: int, source="ui") -> bool:
+        """Count delta encounters on a named hunt without changing the selection; False if there is no such hunt"""
+        if pokemon_name == self.current_pokemon:
+            return self.adjust("increase", amount=delta, source=source)
+        if pokemon_name not in self.saved_data.pokemon:
+            return False
+
+        data = self.saved_data.pokemon[pokemon_name]
+        previous = data.encounters
+        data.encounters = max(0, previous + delta)
+        data.last_updated = now_timestamp()
+        delta = data.encounters - previous
+        if delta > 0:
+            self.rates.record(pokemon_name, delta)
+        self.record_change("encounter", pokemon_name,
+                           {"encounters": data.encounters, "last_updated": data.last_updated},
+                           source=source, delta=delta)
+        if profiler.enabled:
+            profiler.count("encounters." + source, delta)
+        self.notify("hunts", pokemon_name)
+        return True
+
+    def save_current(self, delta=0, source="ui"):
+        if not self.current_pokemon:
+            return
+        if delta > 0:
+            self.rates.record(self.current_pokemon, delta)
+
+        if self.current_pokemon not in self.saved_data.pokemon:
+            self.saved_data.pokemon[self.current_pokemon] = PokemonData(
+                name=self.current_pokemon,
+                encounters=self.current_number,
+                adjustment=self.amount,
+                game=self.game,
+                method=self.method,
+                charm=self.charm,
+                chain=self.chain,
+                last_updated=now_timestamp(),
+                status="ACTIVE",
+                phase=self.next_phase_number(self.current_pokemon)
+            )
+            self.record_change("create", self.current_pokemon, asdict(self.saved_data.pokemon[self.current_pokemon]),
+                               source=source, delta=delta)
+        else:
+            data = self.saved_data.pokemon[self.current_pokemon]
+            data.encounters = self.current_number
+            if self.amount_set:
+                data.adjustment = self.amount
+            data.game = self.game
+            data.method = self.method
+            data.charm = self.charm
+            data.chain = self.chain
+            data.last_updated = now_timestamp()
+            self.record_change("encounter", self.current_pokemon, {
+                "encounters": data.encounters,
+                "adjustment": data.adjustment,
+                "game": data.game,
+                "method": data.method,
+                "charm": data.charm,
+                "chain": data.chain,
+                "last_updated": data.last_updated
+            }, source=source, delta=delta)
+
+    def next_phase_number(self, target_name):
+        target_name = target_name.lower()
+        phases = [p for p in self.saved_data.pokemon.peek_all()
+                  if p.target and p.target.lower() == target_name]
+        return len(phases) + 1
+
+    def phase(self, phased_pokemon, pokemon_name: Optional[str] = None) -> Optional[str]:
+        """Record a phase on phased_pokemon at a hunt's count; returns the new phase entry's name
+
+        The hunt defaults to the selected one; naming another phases it
+        without changing the selection, from its own saved settings.
+        """
+        target = pokemon_name or self.current_pokemon
+        if not target:
+            return None
+        if target == self.current_pokemon:
+            settings = (self.current_number, self.default_adjustment, self.game, self.method, self.charm, self.chain)
+        elif target in self.saved_data.pokemon:
+            data = self.saved_data.pokemon[target]
+            settings = (data.encounters, data.adjustment, data.game, data.method, data.charm, data.chain)
+        else:
+            return None
+        encounters, adjustment, game, method, charm, chain = settings
+
+        phase_number = self.next_phase_number(target)
+        new_name = f"{phased_pokemon.lower()} phase {phase_number}"
+
+        # Completed phase entry, frozen at the current count and linked back to the main hunt
+        phase_data = PokemonData(
+            name=new_name,
+            encounters=encounters,
+            adjustment=adjustment,
+            game=game,
+            method=method,
+            charm=charm,
+            chain=chain,
+            last_updated=now_timestamp(),
+            status="COMPLETE",
+            found_date=now_timestamp(),
+            phase=phase_number,
+            target=target
+        )
+        self.saved_data.pokemon[new_name] = phase_data
+        self.record_change("create", new_name, asdict(phase_data))
+
+        # Update main hunt's phase counter only (don't reset encounters)
+        if target in self.saved_data.pokemon:
+            target_data = self.saved_data.pokemon[target]
+            target_data.phase = phase_number + 1
+            target_data.last_updated = now_timestamp()
+            self.record_change("phase", target,
+                               {"phase": target_data.phase, "last_updated": target_data.last_updated})
+
+        self.notify("hunts", new_name, target)
+        return new_name
+
+    def toggle_status(self, pokemon_name):
+        pokemon_name = pokemon_name.lower()
+        if pokemon_name in self.saved_data.pokemon:
+            self.set_status(pokemon_name, STATUS_CYCLE.get(self.saved_data.pokemon[pokemon_name].status, "ACTIVE"))
+
+    def set_status(self, pokemon_name, status):
+        data = self.saved_data.pokemon[pokemon_name]
+        data.status = status
+        if status == "COMPLETE" and not data.found_date:
+            data.found_date = now_timestamp()
+        self.record_change("status", pokemon_name, {"status": status, "found_date": data.found_date})
+        self.notify("hunts", pokemon_name)
+
+    def set_notes(self, pokemon_name, notes):
+        self.saved_data.pokemon[pokemon_name].notes = notes
+        self.record_change("notes", pokemon_name, {"notes": notes})
+        self.notify("hunts", pokemon_name)
+
+    # Queries
+
+    @profiler.timed("tracker.ordered_names")
+    def ordered_names(self, status: Optional[str] = None, text: str = "", sort_by: str = "most_recent",
+                      descending: bool = True) -> List[str]:
+        """Hunt names with the given status whose notes, target or name contain text, in display order"""
+        if self.store:
+            # Indexed filter and sort in SQLite instead of scanning every hunt
+            return self.store.query_hunts([status] if status else None, text, sort_by, descending)
+
+        # Sort order, status buckets and text matches are all maintained incrementally by hunt_indexes
+        index = self.hunt_indexes[sort_by]
+        matches = self.hunt_indexes.matching(status, text)
+        if matches is None:
+            return index.names(descending=descending)
+        return sorted(matches, key=index.entry_of.__getitem__, reverse=descending)
+
+    @profiler.timed("tracker.compute_stats")
+    def compute_stats(self, names: Iterable[str]) -> Dict[str, HuntStats]:
+        """Odds statistics for many hunts in one vectorized call; hunts without a method are left out"""
+        hunts = [self.saved_data.pokemon[name] for name in names
+                 if name in self.saved_data.pokemon and self.saved_data.pokemon[name].method]
+        stats = batch_stats([hunt.encounters for hunt in hunts], [self.odds.chance_for(hunt) for hunt in hunts])
+        return dict(zip((hunt.name for hunt in hunts), stats))
+
+    def eta_summary(self, pokemon_data, per_hour) -> Optional[str]:
+        """Time until the cumulative shiny chance reaches 50% and 90% at per_hour encounters"""
+        if not pokemon_data.method:
+            return None
+        chance = self.odds.chance_for(pokemon_data)
+        etas = [
+            format_duration(eta_hours(pokemon_data.encounters, encounters_for_probability(chance, target), per_hour))
+            for target in (0.5, 0.9)
+        ]
+        return f"50%: {etas[0]} · 90%: {etas[1]}"
@@ -0,0 +1,422 @@
+"""Local HTTP + WebSocket API over a ShinyTracker, for stream overlays and dashboards
+
+    GET  /api/hunts?status=active&q=text&sort=most_recent&order=desc&limit=50
+    GET  /api/hunts/<name>
+    GET  /api/current
+    GET  /api/odds?game=<game>&method=<method>&charm=1&chain=0
+    POST /api/increment                 {"by": 1}   (the current hunt)
+    POST /api/hunts/<name>/increment    {"by": 1}
+    POST /api/hunts/<name>/phase        {"phased_on": "zubat"}
+    GET  /ws    WebSocket: one "snapshot" message, then "update" messages
+
+The server runs its own asyncio loop on a background thread and never
+touches the tracker. Requests are queued and run by drain() on the host
+loop (the Tk thread or the headless daemon's loop), like TriggerHub's
+events. Pushes are coalesced: the tracker listener only adds names to a
+set, and at most every API_PUSH_MS the changed hunts are serialized once
+and the same frame is written to every subscriber without waiting on any
+of them, so an increment costs the same however many clients are
+connected. A subscriber whose unsent data backs up past API_CLIENT_BUFFER
+is disconnected instead of holding up the rest.
+
+Only the API's own address is served: a request whose Host header names
+anything else (a DNS rebinding attack) or whose Origin is not the API's
+own or one of API_ALLOWED_ORIGINS is refused with 403, WebSocket upgrades
+included, so other websites can't read or change hunts through a
+visitor's browser. Allowed origins get a matching CORS header on GET;
+POST bodies must be application/json, which needs a CORS preflight that
+is never granted.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import queue
+import socket
+import struct
+import threading
+import time
+from typing import Callable, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from hunt_indexes import SORT_KEYS, STATUSES
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+LOOPBACK_NAMES = ("127.0.0.1", "localhost", "[::1]")
+MAX_BODY = 64 * 1024
+REASONS = {
+    200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed",
+    409: "Conflict", 413: "Payload Too Large", 415: "Unsupported Media Type", 500: "Internal Server Error"
+}
+
+
+def websocket_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """One unmasked, unfragmented server-to-client frame"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack(">BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack(">BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack(">BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+async def read_websocket_frame(reader):
+    """(opcode, payload) of the next frame from a client; client frames are masked"""
+    head = await reader.readexactly(2)
+    opcode, length = head[0] & 0x0F, head[1] & 0x7F
+    if length == 126:
+        (length,) = struct.unpack(">H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack(">Q", await reader.readexactly(8))
+    if length > MAX_BODY:
+        raise ValueError(f"WebSocket frame of {length} bytes exceeds the {MAX_BODY} byte limit")
+    mask = await reader.readexactly(4) if head[1] & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+def encode_message(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class TrackerAPI:
+    def __init__(self, tracker, schedule: Callable, cancel: Callable, config):
+        self.tracker = tracker
+        self.schedule = schedule
+        self.cancel = cancel
+        self.config = config
+        self.requests = queue.Queue()  # (future or None, function, args) for the host loop
+        self.changed = set()
+        self.current_changed = False
+        self.next_push = 0.0
+        self.job = None
+
+        self.subscribers = set()  # WebSocket writers; only changed on the API thread
+        self.stopping: Optional[asyncio.Event] = None
+        self.stop_requested = False
+        self.sock = socket.create_server((config.API_HOST, config.API_PORT))
+        port = self.sock.getsockname()[1]
+        names = {config.API_HOST}
+        if config.API_HOST in LOOPBACK_NAMES:
+            names.update(LOOPBACK_NAMES)
+        self.allowed_hosts = {f"{name}:{port}" for name in names}
+        self.allowed_origins = {f"http://{host}" for host in self.allowed_hosts} | set(config.API_ALLOWED_ORIGINS)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name="tracker-api", daemon=True)
+        tracker.subscribe(self.on_tracker_change)
+
+    def start(self):
+        self.thread.start()
+        self.drain()
+
+    def stop(self):
+        if self.job is not None:
+            self.cancel(self.job)
+            self.job = None
+        self.loop.call_soon_threadsafe(self._request_stop)
+        self.thread.join(timeout=2)
+
+    # Host loop side
+
+    def on_tracker_change(self, change, names):
+        self.changed.update(names)
+        if change in ("selected", "counter"):
+            self.current_changed = True
+
+    def drain(self):
+        while True:
+            try:
+                future, function, args = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                result = function(*args)
+            except Exception as e:
+                result = (500, {"error": str(e)})
+            if future is not None:
+                self.loop.call_soon_threadsafe(self._resolve, future, result)
+
+        now = time.monotonic()
+        if (self.changed or self.current_changed) and now >= self.next_push:
+            self.next_push = now + self.config.API_PUSH_MS / 1000
+            names, self.changed = self.changed, set()
+            self.current_changed = False
+            if self.subscribers:
+                hunts = self.tracker.saved_data.pokemon
+                message = {
+                    "type": "update",
+                    "current": self.current_json(),
+                    "hunts": {name: self.hunt_json(hunts[name]) for name in names if name in hunts},
+                }
+                self.loop.call_soon_threadsafe(self._broadcast, message)
+        self.job = self.schedule(self.config.WATCH_DRAIN_MS, self.drain)
+
+    def hunt_json(self, data, stats=None) -> dict:
+        tracker = self.tracker
+        result = {
+            "name": data.name,
+            "status": data.status,
+            "encounters": data.encounters,
+            "game": data.game,
+            "method": data.method,
+            "charm": data.charm,
+            "chain": data.chain,
+            "phase": data.phase,
+            "target": data.target,
+            "notes": data.notes,
+            "last_updated": data.last_updated,
+            "found_date": data.found_date,
+        }
+        if data.method:
+            stats = stats or tracker.compute_stats([data.name])[data.name]
+            result.update(odds=tracker.odds.odds_for(data), probability=stats.probability,
+                          luck_percentile=stats.luck_percentile, expected_remaining=stats.expected_remaining)
+        rates = tracker.rates.per_hour(data.name)
+        if rates and any(rates):
+            result["rates_per_hour"] = dict(zip((str(window) for window in self.config.RATE_WINDOWS), rates))
+            result["eta"] = tracker.eta_summary(data, rates[-1] or rates[0])
+        return result
+
+    def current_json(self) -> dict:
+        return {"name": self.tracker.current_pokemon or None, "encounters": self.tracker.current_number,
+                "amount": self.tracker.amount}
+
+    def list_hunts(self, status, text, sort_by, descending, limit):
+        names = self.tracker.ordered_names(status, text, sort_by, descending)
+        total = len(names)
+        if limit is not None:
+            names = names[:limit]
+        stats = self.tracker.compute_stats(names)
+        hunts = self.tracker.saved_data.pokemon
+        return 200, {"total": total, "hunts": [self.hunt_json(hunts[name], stats.get(name)) for name in names]}
+
+    def get_hunt(self, name):
+        data = self.tracker.saved_data.pokemon.get(name)
+        if data is None:
+            return 404, {"error": f"No hunt named {name}"}
+        return 200, self.hunt_json(data)
+
+    def get_current(self):
+        data = self.tracker.saved_data.pokemon.get(self.tracker.current_pokemon)
+        return 200, {**self.current_json(), "hunt": self.hunt_json(data) if data else None}
+
+    def increment(self, name, by):
+        tracker = self.tracker
+        if name is not None:
+            # Counted in place: the window's selection, which untargeted triggers land on, stays put
+            if not tracker.add_encounters(name, by, source="api"):
+                return 404, {"error": f"No hunt named {name}"}
+            return self.get_hunt(name)
+        if not tracker.adjust("increase", amount=by, source="api"):
+            return 409, {"error": "No hunt selected"}
+        return self.get_current()
+
+    def phase(self, name, phased_on):
+        tracker = self.tracker
+        if name not in tracker.saved_data.pokemon:
+            return 404, {"error": f"No hunt named {name}"}
+        new_name = tracker.phase(phased_on, name)
+        return 200, self.hunt_json(tracker.saved_data.pokemon[new_name])
+
+    def send_snapshot(self, writer):
+        hunts = self.tracker.saved_data.pokemon
+        names = set(self.tracker.ordered_names("ACTIVE"))
+        if self.tracker.current_pokemon in hunts:
+            names.add(self.tracker.current_pokemon)
+        stats = self.tracker.compute_stats(names)
+        message = {
+            "type": "snapshot",
+            "current": self.current_json(),
+            "hunts": {name: self.hunt_json(hunts[name], stats.get(name)) for name in names},
+        }
+        # Queued behind every update built so far, so the client never sees older state after this
+        self.loop.call_soon_threadsafe(self._subscribe, writer, message)
+
+    # API thread side
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._serve())
+        finally:
+            self.loop.close()
+
+    async def _serve(self):
+        self.stopping = asyncio.Event()
+        if self.stop_requested:
+            return
+        server = await asyncio.start_server(self._handle, sock=self.sock)
+        async with server:
+            await self.stopping.wait()
+        for writer in list(self.subscribers):
+            writer.close()
+
+    def _request_stop(self):
+        self.stop_requested = True
+        if self.stopping is not None:
+            self.stopping.set()
+
+    @staticmethod
+    def _resolve(future, result):
+        if not future.done():
+            future.set_result(result)
+
+    async def _call(self, function, *args):
+        """Run function(*args) on the host loop and return its (status, payload)"""
+        future = self.loop.create_future()
+        self.requests.put((future, function, args))
+        return await future
+
+    def _subscribe(self, writer, message):
+        if writer.is_closing():
+            return
+        writer.write(websocket_frame(encode_message(message)))
+        self.subscribers.add(writer)
+
+    def _broadcast(self, message):
+        frame = websocket_frame(encode_message(message))
+        for writer in list(self.subscribers):
+            if writer.transport.get_write_buffer_size() > self.config.API_CLIENT_BUFFER:
+                # Too slow to keep up; dropping it keeps every other subscriber current
+                self.subscribers.discard(writer)
+                writer.close()
+                continue
+            writer.write(frame)
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": "Request body too large"}, close=True)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                origin = headers.get("origin")
+                if headers.get("host", "").lower() not in self.allowed_hosts or (
+                        origin is not None and origin not in self.allowed_origins):
+                    await self._respond(writer, 403, {"error": "Host or origin not allowed"}, close=True)
+                    return
+
+                url = urlsplit(target)
+                if url.path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                    await self._serve_websocket(reader, writer, headers)
+                    return
+                status, payload = await self._route(method, url.path, parse_qs(url.query), headers, body)
+                close = version == "HTTP/1.0" or headers.get("connection", "").lower() == "close"
+                await self._respond(writer, status, payload, close=close, origin=origin)
+                if close:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, payload, close=False, origin=None):
+        body = encode_message(payload)
+        # Only called with an origin that passed the check in _handle
+        cors = f"Access-Control-Allow-Origin: {origin}\r\nVary: Origin\r\n" if origin else ""
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{cors}"
+            f"Cache-Control: no-store\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+
+    async def _route(self, method, path, query, headers, body):
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        if parts[:1] != ["api"]:
+            return 404, {"error": "Not found"}
+
+        def arg(name, default=None):
+            return query.get(name, [default])[0]
+
+        if method == "GET":
+            if parts == ["api", "hunts"]:
+                status = (arg("status") or "").upper() or None
+                sort_by = arg("sort", "most_recent")
+                if status is not None and status not in STATUSES:
+                    return 400, {"error": f"status must be one of {', '.join(s.lower() for s in STATUSES)}"}
+                if sort_by not in SORT_KEYS:
+                    return 400, {"error": f"sort must be one of {', '.join(SORT_KEYS)}"}
+                limit = int(arg("limit")) if arg("limit", "").isdigit() else None
+                return await self._call(self.list_hunts, status, (arg("q") or "").lower(), sort_by,
+                                        arg("order", "desc") != "asc", limit)
+            if len(parts) == 3 and parts[1] == "hunts":
+                return await self._call(self.get_hunt, parts[2].lower())
+            if parts == ["api", "current"]:
+                return await self._call(self.get_current)
+            if parts == ["api", "odds"]:
+                # The odds table never changes after startup, so it is safe to read from this thread
+                chance = self.tracker.odds.chance(arg("game"), arg("method"), arg("charm") in ("1", "true"),
+                                                  int(arg("chain", "0")) if arg("chain", "0").isdigit() else 0)
+                return 200, {"chance": chance, "odds": round(1 / chance)}
+            return 404, {"error": "Not found"}
+
+        if method != "POST":
+            return 405, {"error": "Use GET or POST"}
+        if not headers.get("content-type", "").startswith("application/json"):
+            return 415, {"error": "POST bodies must be application/json"}
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {"error": "Body is not valid JSON"}
+        if not isinstance(data, dict):
+            return 400, {"error": "Body must be a JSON object"}
+
+        if parts == ["api", "increment"] or (len(parts) == 4 and parts[1] == "hunts" and parts[3] == "increment"):
+            by = data.get("by", 1)
+            if not isinstance(by, int) or isinstance(by, bool) or by < 1:
+                return 400, {"error": "by must be a positive integer"}
+            return await self._call(self.increment, parts[2].lower() if len(parts) == 4 else None, by)
+        if len(parts) == 4 and parts[1] == "hunts" and parts[3] == "phase":
+            phased_on = data.get("phased_on")
+            if not isinstance(phased_on, str) or not phased_on.strip():
+                return 400, {"error": "phased_on must name the Pokémon that appeared"}
+            return await self._call(self.phase, parts[2].lower(), phased_on.strip())
+        return 404, {"error": "Not found"}
+
+    async def _serve_websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key")
+        if not key or headers.get("sec-websocket-version") != "13":
+            await self._respond(writer, 400, {"error": "Unsupported WebSocket handshake"}, close=True)
+            return
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode("latin-1")).digest()).decode("latin-1")
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode("latin-1")
+        )
+        # The host loop sends the snapshot and only then adds this writer to the subscribers
+        self.requests.put((None, self.send_snapshot, (writer,)))
+        try:
+            while True:
+                opcode, payload = await read_websocket_frame(reader)
+                if opcode == 0x8:
+                    writer.write(websocket_frame(payload[:2], opcode=0x8))
+                    return
+                if opcode == 0x9:
+                    writer.write(websocket_frame(payload, opcode=0xA))
+                # Anything else from subscribers is ignored; the channel is push-only
+        finally:
+            self.subscribers.discard(writer)
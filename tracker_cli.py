@@ -0,0 +1,277 @@
+"""Headless shiny tracker: query and change hunts from a shell, or run as a trigger daemon
+
+    python tracker_cli.py list [--status active] [--filter text] [--sort most_encounters] [--ascending]
+    python tracker_cli.py stats [hunt]
+    python tracker_cli.py increment [hunt] [--by N]
+    python tracker_cli.py phase <phased pokemon> [--hunt hunt]
+    python tracker_cli.py daemon [--profile] [--trace trace.json]
+
+The daemon consumes melon.py's triggers (files, socket, shared memory) like
+the Tk window does, without needing a display, and serves the HTTP +
+WebSocket API from tracker_api.py. While a tracker (the window
+or the daemon) is listening on the trigger port, increment is sent to it
+over the encounter protocol instead of editing the data files underneath
+it, and phase refuses to run. daemon --profile appends timing summaries to
+shiny_hunter.log and prints one on exit; --trace also writes a Chrome trace.
+"""
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+import uuid
+
+from encounter_protocol import recv_frame, send_frame
+from event_loop import EventLoop
+from profiling import profiler
+from tracker import DATA_FILE, DB_FILE, JOURNAL_FILE, ShinyTracker, TrackerConfig
+
+STATUS_CHOICES = ("active", "complete", "paused", "phase")
+
+
+def open_tracker(loop, directory):
+    tracker = ShinyTracker(loop.after, loop.after_cancel, TrackerConfig,
+                           data_file=os.path.join(directory, DATA_FILE),
+                           journal_file=os.path.join(directory, JOURNAL_FILE),
+                           db_file=os.path.join(directory, DB_FILE))
+    tracker.load()
+    if tracker.last_error:
+        tracker.close(save=False)
+        sys.exit(1)
+    return tracker
+
+
+def positive_int(value) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
+def tracker_running(host, port) -> bool:
+    try:
+        socket.create_connection((host, port), timeout=0.5).close()
+        return True
+    except OSError:
+        return False
+
+
+def forward_increment(host, port, hunt, delta, timeout=5.0) -> bool:
+    """Send one encounter to a running tracker and wait until it is applied"""
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        send_frame(sock, {"type": "hello", "client": f"cli-{uuid.uuid4().hex}"})
+        welcome = recv_frame(sock)
+        if not welcome or welcome.get("type") != "welcome":
+            return False
+        send_frame(sock, {"type": "batch", "messages": [
+            {"seq": 1, "kind": "encounter", "t": time.time(), "hunt": hunt, "delta": delta}
+        ]})
+        while True:
+            message = recv_frame(sock)
+            if message is None:
+                return False
+            if message.get("type") == "ack" and message.get("seq", 0) >= 1:
+                return True
+
+
+def describe(tracker, data, stats):
+    odds = f"1/{tracker.odds.odds_for(data):,}" if data.method else "-"
+    chance = f"{stats.probability:6.2%}" if stats else "     -"
+    return (f"{data.name:<28} {data.status:<8} {data.encounters:>9,}  {odds:>8}  {chance}  "
+            f"{data.game or '-'} / {data.method or '-'}")
+
+
+def cmd_list(args, loop):
+    tracker = open_tracker(loop, args.dir)
+    try:
+        names = tracker.ordered_names(args.status.upper() if args.status else None, (args.filter or "").lower(),
+                                      args.sort, descending=not args.ascending)
+        stats = tracker.compute_stats(names)
+        for name in names:
+            print(describe(tracker, tracker.saved_data.pokemon[name], stats.get(name)))
+        print(f"{len(names)} of {len(tracker.saved_data.pokemon)} hunts")
+    finally:
+        # Read-only: leave the data file and the journal a running tracker appends to alone
+        tracker.close(save=False)
+
+
+def cmd_stats(args, loop):
+    tracker = open_tracker(loop, args.dir)
+    try:
+        if args.hunt:
+            names = [args.hunt.lower()]
+        else:
+            names = tracker.ordered_names("ACTIVE")
+        for name in names:
+            data = tracker.saved_data.pokemon.get(name)
+            if data is None:
+                print(f"No hunt named {name}")
+                sys.exit(1)
+            print(data.name)
+            print(f"  Encounters: {data.encounters:,}")
+            if not data.method:
+                print("  No hunt method set; odds unknown")
+                continue
+            stats = tracker.compute_stats([name])[name]
+            print(f"  Odds: 1/{tracker.odds.odds_for(data):,} ({data.game or 'unknown game'}, {data.method}"
+                  f"{', Shiny Charm' if data.charm else ''}{f', chain {data.chain}' if data.chain else ''})")
+            print(f"  Shiny chance by now: {stats.probability:.2%}")
+            print(f"  Hunters still searching at this count: {stats.luck_percentile:.1f}%")
+            print(f"  Expected encounters to go: {stats.expected_remaining:,.0f}")
+    finally:
+        tracker.close(save=False)
+
+
+def resolve_hunt(tracker, hunt):
+    """The named hunt, or the most recent one; exits if there is none"""
+    if hunt:
+        if hunt not in tracker.saved_data.pokemon:
+            print(f"No hunt named {hunt}")
+            sys.exit(1)
+        return hunt
+    tracker.select_most_recent_hunt()
+    if not tracker.current_pokemon:
+        print("No hunt to count on")
+        sys.exit(1)
+    return tracker.current_pokemon
+
+
+def cmd_increment(args, loop):
+    hunt = args.hunt.lower() if args.hunt else None
+    if tracker_running(TrackerConfig.TRIGGER_HOST, TrackerConfig.TRIGGER_PORT):
+        # Resolved from the saved hunts like the offline path, so the running tracker's selection doesn't
+        # decide where it lands (and an unknown name fails here instead of being skipped there)
+        tracker = open_tracker(loop, args.dir)
+        try:
+            hunt = resolve_hunt(tracker, hunt)
+        finally:
+            tracker.close(save=False)
+        try:
+            confirmed = forward_increment(TrackerConfig.TRIGGER_HOST, TrackerConfig.TRIGGER_PORT, hunt, args.by)
+        except (OSError, ValueError) as e:
+            print(f"Could not reach the running tracker: {e}")
+            sys.exit(1)
+        if not confirmed:
+            print("The running tracker did not confirm the encounter")
+            sys.exit(1)
+        print(f"Sent {args.by:+,} to {hunt} on the running tracker")
+        return
+
+    tracker = open_tracker(loop, args.dir)
+    try:
+        tracker.select_hunt(resolve_hunt(tracker, hunt))
+        tracker.adjust("increase", amount=args.by, source="cli")
+        print(f"{tracker.current_pokemon}: {tracker.current_number:,}")
+    finally:
+        tracker.close()
+
+
+def cmd_phase(args, loop):
+    if tracker_running(TrackerConfig.TRIGGER_HOST, TrackerConfig.TRIGGER_PORT):
+        print("A tracker is running; record the phase there so it isn't overwritten")
+        sys.exit(1)
+
+    tracker = open_tracker(loop, args.dir)
+    try:
+        if args.hunt:
+            if args.hunt.lower() not in tracker.saved_data.pokemon:
+                print(f"No hunt named {args.hunt.lower()}")
+                sys.exit(1)
+            tracker.select_hunt(args.hunt)
+        else:
+            tracker.select_most_recent_hunt()
+        new_name = tracker.phase(args.phased_on)
+        if new_name is None:
+            print("No hunt to phase on")
+            sys.exit(1)
+        print(f"Recorded {new_name} at {tracker.current_number:,} encounters")
+    finally:
+        tracker.close()
+
+
+def cmd_daemon(args, loop):
+    # Only the daemon needs the servers, so one-shot commands skip importing them
+    from tracker_api import TrackerAPI
+    from trigger_hub import TriggerHub
+
+    if args.profile or args.trace or TrackerConfig.PROFILING:
+        profiler.enable(tracing=bool(args.trace))
+        profiler.start_logging(loop.after, loop.after_cancel, os.path.join(args.dir, TrackerConfig.PROFILE_LOG_FILE),
+                               TrackerConfig.PROFILE_LOG_MS)
+    tracker = open_tracker(loop, args.dir)
+    tracker.select_most_recent_hunt()
+
+    def on_change(change, names):
+        if change == "counter":
+            print(f"{tracker.current_pokemon}: {tracker.current_number:,}")
+        elif change == "selected":
+            print(f"Counting on {tracker.current_pokemon}")
+
+    tracker.subscribe(on_change)
+    hub = TriggerHub(tracker, loop.after, loop.after_cancel, TrackerConfig, directory=args.dir)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: loop.stop())
+
+    api_server = None
+    if TrackerConfig.API_SERVER:
+        try:
+            api_server = TrackerAPI(tracker, loop.after, loop.after_cancel, TrackerConfig)
+        except OSError as e:
+            print(f"Tracker API unavailable: {e}")
+
+    print(f"Tracking {tracker.current_pokemon or 'no hunt yet'}; Ctrl+C to stop")
+    hub.start()
+    if api_server:
+        api_server.start()
+        print(f"API on http://{TrackerConfig.API_HOST}:{TrackerConfig.API_PORT}/api/hunts")
+    try:
+        loop.run()
+    finally:
+        hub.stop()
+        if api_server:
+            api_server.stop()
+        tracker.close()
+        if profiler.enabled:
+            print(profiler.report())
+        if args.trace:
+            print(f"Wrote {profiler.export_chrome_trace(args.trace):,} spans to {args.trace}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Pokémon shiny hunt tracker")
+    parser.add_argument("--dir", default=".", help="directory holding the data and communication files")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="list hunts")
+    list_parser.add_argument("--status", choices=STATUS_CHOICES)
+    list_parser.add_argument("--filter", help="only hunts whose notes, target or name contain this")
+    list_parser.add_argument("--sort", choices=("most_recent", "most_encounters"), default="most_recent")
+    list_parser.add_argument("--ascending", action="store_true")
+    list_parser.set_defaults(run=cmd_list)
+
+    stats_parser = commands.add_parser("stats", help="odds statistics for one hunt or all active hunts")
+    stats_parser.add_argument("hunt", nargs="?")
+    stats_parser.set_defaults(run=cmd_stats)
+
+    increment_parser = commands.add_parser("increment", help="add encounters to a hunt (default: most recent)")
+    increment_parser.add_argument("hunt", nargs="?")
+    increment_parser.add_argument("--by", type=positive_int, default=1)
+    increment_parser.set_defaults(run=cmd_increment)
+
+    phase_parser = commands.add_parser("phase", help="record a phase on the current hunt")
+    phase_parser.add_argument("phased_on", help="the Pokémon that appeared shiny instead")
+    phase_parser.add_argument("--hunt", help="hunt to phase (default: most recent)")
+    phase_parser.set_defaults(run=cmd_phase)
+
+    daemon_parser = commands.add_parser("daemon", help="consume melon.py's triggers without a window")
+    daemon_parser.add_argument("--profile", action="store_true", help="record timing spans and log summaries")
+    daemon_parser.add_argument("--trace", help="also write the spans to this Chrome trace file on exit")
+    daemon_parser.set_defaults(run=cmd_daemon)
+
+    args = parser.parse_args(argv)
+    args.run(args, EventLoop())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import os
+import queue
+from typing import Callable
+
+from encounter_protocol import EncounterServer
+from file_watcher import create_file_watcher
+from profiling import profiler
+from shared_counters import SharedCounters
+
+COMMUNICATION_FILES = {
+    'emulator_count': "melon_emulator_count.txt",
+    'encounter_trigger': "encounter_trigger.txt"
+}
+
+
+class TriggerHub:
+    """Applies encounter triggers from melon.py to a ShinyTracker
+
+    Triggers arrive through the communication files, the localhost encounter
+    server and the shared counter segment. Watcher and server threads only
+    put events on queues; drain() runs every WATCH_DRAIN_MS on the host loop
+    (the Tk thread, or the headless daemon's loop), which is the only thread
+    that touches the tracker.
+    """
+
+    def __init__(self, tracker, schedule: Callable, cancel: Callable, config, directory="."):
+        self.tracker = tracker
+        self.schedule = schedule
+        self.cancel = cancel
+        self.config = config
+        self.directory = directory
+        self.file_events = queue.Queue()
+        self.file_watcher = None
+        self.socket_events = queue.Queue()
+        self.trigger_server = None
+        self.shared_counters = None
+        self.counter_baseline = None
+        self.job = None
+
+    def path(self, key):
+        return os.path.join(self.directory, COMMUNICATION_FILES[key])
+
+    def start(self):
+        self.initialize_communication_files()
+        self.check_emulator_count()
+        self.file_watcher = create_file_watcher(self.directory, COMMUNICATION_FILES.values(), self.file_events,
+                                                backend=self.config.FILE_WATCHER,
+                                                poll_interval_ms=self.config.FILE_POLL_MS)
+        self.file_watcher.start()
+        if self.config.TRIGGER_SERVER:
+            try:
+                self.trigger_server = EncounterServer(self.config.TRIGGER_HOST, self.config.TRIGGER_PORT,
+                                                      self.socket_events)
+                self.trigger_server.start()
+            except OSError as e:
+                print(f"Encounter server unavailable, using the trigger file only: {e}")
+        if self.config.SHARED_COUNTERS:
+            try:
+                self.shared_counters = SharedCounters(self.config.SHARED_COUNTERS_NAME,
+                                                      self.config.SHARED_COUNTER_SLOTS)
+                # Only encounters counted from now on are applied
+                self.counter_baseline = self.shared_counters.read()
+            except (OSError, ValueError) as e:
+                print(f"Shared counters unavailable: {e}")
+        self.drain()
+
+    def stop(self):
+        if self.job is not None:
+            self.cancel(self.job)
+            self.job = None
+        if self.file_watcher:
+            self.file_watcher.stop()
+        if self.trigger_server:
+            self.trigger_server.stop()
+        if self.shared_counters:
+            self.shared_counters.close()
+
+    def initialize_communication_files(self):
+        for key in COMMUNICATION_FILES:
+            filepath = self.path(key)
+            if not os.path.exists(filepath):
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write("16" if key == "emulator_count" else "0")
+
+    def drain(self):
+        while True:
+            try:
+                filename = self.file_events.get_nowait()
+            except queue.Empty:
+                break
+            if filename == COMMUNICATION_FILES['encounter_trigger']:
+                self.handle_encounter_trigger()
+            elif filename == COMMUNICATION_FILES['emulator_count']:
+                self.check_emulator_count()
+        self.apply_socket_events()
+        self.poll_shared_counters()
+        self.job = self.schedule(self.config.WATCH_DRAIN_MS, self.drain)
+
+    def apply_socket_events(self):
+        # A burst of messages becomes one increment (and one journal record) per hunt
+        deltas = {}
+        emulators = None
+        acks = {}
+        while True:
+            try:
+                client_id, message = self.socket_events.get_nowait()
+            except queue.Empty:
+                break
+            if message.get("kind") == "encounter":
+                hunt = message.get("hunt")
+                deltas[hunt] = deltas.get(hunt, 0) + int(message.get("delta") or 0)
+                emulators = message.get("emulators") or emulators
+            acks[client_id] = message["seq"]
+
+        if not acks:
+            return
+        with profiler.span("triggers.socket"):
+            self.apply_socket_deltas(deltas, emulators, acks)
+
+    def apply_socket_deltas(self, deltas, emulators, acks):
+        if emulators:
+            self.set_emulator_count(str(emulators))
+        for hunt, delta in deltas.items():
+            try:
+                if not hunt:
+                    self.increase(delta, "socket")
+                elif not self.tracker.add_encounters(hunt, delta, source="socket"):
+                    # Counting it on the current hunt instead would credit the wrong one
+                    print(f"Skipping encounter message for unknown hunt {hunt}")
+            except Exception as e:
+                print(f"Error applying encounter message: {e}")
+        # Acked only now that the change is journaled, so the controller replays anything earlier
+        for client_id, seq in acks.items():
+            self.trigger_server.applied(client_id, seq)
+
+    def poll_shared_counters(self):
+        if not self.shared_counters:
+            return
+        snapshot = self.shared_counters.read()
+        if snapshot is None:
+            return  # Kept overlapping a write; the next tick will see it
+        baseline = self.counter_baseline
+        if baseline is None or snapshot.generation != baseline.generation or snapshot.total < baseline.total:
+            # Segment was (re)created; start counting from its current state
+            self.counter_baseline = snapshot
+            return
+        if snapshot.seq == baseline.seq:
+            return
+
+        self.counter_baseline = snapshot
+        if snapshot.emulators:
+            self.set_emulator_count(str(snapshot.emulators))
+        delta = snapshot.total - baseline.total
+        if delta:
+            try:
+                with profiler.span("triggers.shm"):
+                    self.increase(delta, "shm")
+            except Exception as e:
+                print(f"Error applying shared counter update: {e}")
+
+    def check_emulator_count(self):
+        try:
+            with open(self.path('emulator_count'), 'r') as f:
+                self.set_emulator_count(f.read().strip())
+        except Exception as e:
+            print(f"Error reading emulator count: {e}")
+
+    def set_emulator_count(self, new_value):
+        if new_value.isdigit():
+            self.tracker.set_amount(int(new_value))
+
+    @profiler.timed("triggers.file")
+    def handle_encounter_trigger(self):
+        # One call per completed write of the trigger file
+        try:
+            self.increase(None, "trigger")
+        except Exception as e:
+            print(f"Error handling encounter trigger: {e}")
+
+    def increase(self, amount, source):
+        if not self.tracker.adjust("increase", amount=amount, source=source):
+            print(f"Ignored {source} encounter: no hunt selected")